@@ -3,17 +3,33 @@ import json
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 load_dotenv()
 
+# Variables Settings cannot start without; main.py reports all missing ones at once
+REQUIRED_ENV_VARS = ("SUPABASE_URL", "SUPABASE_KEY", "TELEGRAM_TOKEN")
+
 
 class Settings:
     def __init__(self):
+        missing_vars = [key for key in REQUIRED_ENV_VARS if not os.getenv(key)]
+        if missing_vars:
+            raise EnvironmentError(f"Missing required environment variables: {', '.join(missing_vars)}")
         self.SUPABASE_URL = self._get_env("SUPABASE_URL")
         self.SUPABASE_KEY = self._get_env("SUPABASE_KEY")
         self.TELEGRAM_TOKEN = self._get_env("TELEGRAM_TOKEN")
         self.REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 
         self.BLOCKCHAINS = self._load_blockchains_config()
+        # Flattened chain name -> RPC endpoint, for single-lookup access
+        self.RPC_URLS = {
+            name: cfg['rpc_url']
+            for name, cfg in self.BLOCKCHAINS.get('blockchains', {}).items()
+        }
 
         self.TRACKED_CURRENCIES = frozenset([
             "BNB", "ARB", "PLS", "POL", "TRX", "SOL", "DAI",
@@ -22,6 +38,16 @@ class Settings:
             "OSMO", "ATOM",  # Added OSMO and ATOM
         ])
 
+        # Transaction alert template; fields: chain, amount, cur, usd, url, hash.
+        # Overridden at runtime by /set_message_format
+        self.MESSAGE_TEMPLATE = os.getenv(
+            "MESSAGE_TEMPLATE",
+            "🔔 New {chain} Transaction!\n"
+            "Amount: {amount:.4f} {cur}\n"
+            "USD Value: ${usd:.2f}\n"
+            "Explorer: {url}{hash}"
+        )
+
         self.ADMIN_COMMANDS = frozenset([
             "/start", "/pause_tracking", "/resume_tracking",
             "/start_tracking", "/stop_tracking", "/add_wallet",
@@ -37,14 +63,12 @@ class Settings:
             raise EnvironmentError(f"Environment variable '{key}' is required but not set.")
         return value
 
-    def _load_blockchains_config(self) -> dict:
-        config_path = Path(__file__).parent / "blockchains.json"
+    def _load_blockchains_config(self, config_path: Path = Path(__file__).parent / "blockchains.json") -> dict:
         if not config_path.exists():
             raise FileNotFoundError(f"Missing 'blockchains.json' at {config_path}")
         try:
-            with open(config_path, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
+            return _json_loads(config_path.read_bytes())
+        except json.JSONDecodeError as e:  # orjson's decode error subclasses this one
             raise ValueError(f"Failed to parse 'blockchains.json': {e}")
 
 
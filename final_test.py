@@ -123,8 +123,8 @@ def test_complete_system():
     
     return True
 
-def test_blockchain_coverage():
-    """Test blockchain coverage"""
+def test_blockchain_coverage(deep=False):
+    """Test blockchain coverage; with deep=True each adapter is also instantiated"""
     print("\n🌐 BLOCKCHAIN COVERAGE TEST")
     print("=" * 50)
     
@@ -140,6 +140,14 @@ def test_blockchain_coverage():
         print(f"EVM chains: {len([c for c in evm_chains if c in chains])}/{len(evm_chains)}")
         print(f"Non-EVM chains: {len([c for c in non_evm_chains if c in chains])}/{len(non_evm_chains)}")
         
+        if not deep:
+            # Resolving the registry is enough to show availability without opening RPC clients
+            for chain, adapter_class in adapters.list_adapter_classes().items():
+                print(f"   ✅ {chain} ({adapter_class.__name__})")
+            for chain in adapters.custom_adapters:
+                print(f"   ✅ {chain} (custom)")
+            return True
+        
         for chain in chains:
             try:
                 adapter = adapters.get_adapter(chain)
@@ -187,14 +195,14 @@ def test_file_structure():
         print(f"\n✅ All {len(required_files)} required files present")
         return True
 
-def main():
-    """Run all tests"""
+def main(deep=False):
+    """Run all tests; pass --deep to also connect every blockchain adapter"""
     print("🚀 BLOCKCHAIN TRANSACTION BOT - FINAL BUILD TEST")
     print("=" * 60)
     
     tests = [
         ("System Integration", test_complete_system),
-        ("Blockchain Coverage", test_blockchain_coverage),
+        ("Blockchain Coverage", lambda: test_blockchain_coverage(deep)),
         ("File Structure", test_file_structure),
     ]
     
@@ -225,5 +233,5 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    success = main(deep='--deep' in sys.argv)
     sys.exit(0 if success else 1)
\ No newline at end of file
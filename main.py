@@ -4,13 +4,22 @@ Main entry point for the Blockchain Transaction Tracking Bot
 """
 
 import asyncio
-import threading
 import signal
 import sys
+
+if __name__ == "__main__":
+    # Fail fast on a misconfigured deployment, before the web3 and Telegram imports below;
+    # Settings owns the list of required variables, so the check cannot drift from it
+    try:
+        import config.settings
+    except EnvironmentError as e:
+        print(e, file=sys.stderr)
+        print("Please set these variables in your .env file or environment", file=sys.stderr)
+        sys.exit(1)
+
 from src.interface.telegram.bot import TelegramBot
 from src.core.blockchain.manager import BlockchainTracker
 from src.utils.logger import logger
-from config.settings import settings
 
 
 class BotApplication:
@@ -19,8 +28,10 @@ class BotApplication:
     def __init__(self):
         self.telegram_bot = None
         self.blockchain_tracker = None
-        self.tracker_thread = None
+        self.tracker_task = None
+        self.stop_task = None
         self.running = False
+        self.stopped = False
     
     async def start(self):
         """Start the bot application"""
@@ -33,12 +44,8 @@ class BotApplication:
             # Initialize blockchain tracker
             self.blockchain_tracker = BlockchainTracker()
             
-            # Start blockchain tracker in a separate thread
-            self.tracker_thread = threading.Thread(
-                target=self.blockchain_tracker.start,
-                daemon=True
-            )
-            self.tracker_thread.start()
+            # Run blockchain tracker on the same event loop as the Telegram bot
+            self.tracker_task = asyncio.create_task(self.blockchain_tracker.run())
             
             # Start Telegram bot
             self.running = True
@@ -51,6 +58,10 @@ class BotApplication:
     
     async def stop(self):
         """Stop the bot application"""
+        # Reached from a signal, a failed start and main()'s finally; only the first call cleans up
+        if self.stopped:
+            return
+        self.stopped = True
         try:
             logger.log("Stopping bot...")
             self.running = False
@@ -58,6 +69,10 @@ class BotApplication:
             if self.blockchain_tracker:
                 self.blockchain_tracker.active = False
             
+            if self.tracker_task:
+                self.tracker_task.cancel()
+                await asyncio.gather(self.tracker_task, return_exceptions=True)
+            
             if self.telegram_bot:
                 await self.telegram_bot.stop()
             
@@ -67,21 +82,23 @@ class BotApplication:
             logger.log(f"Error stopping bot: {e}")
 
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals"""
-    logger.log(f"Received signal {signum}, shutting down...")
-    sys.exit(0)
+def signal_handler(app, sig):
+    """Handle shutdown signals by stopping the app on the event loop"""
+    logger.log(f"Received signal {sig.name}, shutting down...")
+    # Keep a reference so the stop task isn't garbage collected mid-shutdown
+    app.stop_task = asyncio.create_task(app.stop())
 
 
 async def main():
     """Main function"""
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-    
     # Create and start the application
     app = BotApplication()
     
+    # Shut down through the event loop so pending tasks are cancelled cleanly
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, signal_handler, app, sig)
+    
     try:
         await app.start()
     except KeyboardInterrupt:
@@ -93,15 +110,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Check if required environment variables are set
-    required_vars = ['TELEGRAM_BOT_TOKEN', 'SUPABASE_URL', 'SUPABASE_KEY']
-    missing_vars = [var for var in required_vars if not getattr(settings, var, None)]
-    
-    if missing_vars:
-        logger.log(f"Missing required environment variables: {', '.join(missing_vars)}")
-        logger.log("Please set these variables in your .env file or environment")
-        sys.exit(1)
-    
     # Run the bot
     try:
         asyncio.run(main())
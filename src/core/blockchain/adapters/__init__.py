@@ -1,61 +1,77 @@
-from .base_chain_adapter import BaseChainAdapter
-from .ethereum_adapter import EthereumAdapter
-from .bsc_adapter import BSCAdapter
-from .polygon_adapter import PolygonAdapter
-from .avalanche_adapter import AvalancheAdapter
-from .arbitrum_adapter import ArbitrumAdapter
-from .optimism_adapter import OptimismAdapter
-from .fantom_adapter import FantomAdapter
-from .pulsechain_adapter import PulsechainAdapter
-from .solana_adapter import SolanaAdapter
-from .tron_adapter import TronAdapter
-from .dogecoin_adapter import DogecoinAdapter
-from .polkadot_adapter import PolkadotAdapter
-from .near_adapter import NearAdapter
-from .algorand_adapter import AlgorandAdapter
-from .ton_adapter import TonAdapter
-from .pi_network_adapter import PiNetworkAdapter
-from .cosmos_adapter import CosmosAdapter
-from .osmosis_adapter import OsmosisAdapter
-from .eos_adapter import EOSAdapter
-from .custom_evm_adapter import CustomEVMAdapter
-from .custom_web3_adapter import CustomWeb3Adapter
+import functools
+import importlib
+from types import MappingProxyType
 
 from config.settings import settings
 from src.utils.logger import logger
 
+# Explorers whose transaction path isn't '/tx/': (tx path, address path, block path)
+_EXPLORER_PATHS = {
+    'Tron': ('#/transaction/', '#/address/', '#/block/'),
+    'Polkadot': ('/extrinsic/', '/account/', '/block/'),
+    'Near': ('/transactions/', '/accounts/', '/blocks/'),
+    'Cosmos': ('/txs/', '/address/', '/block/'),
+    'Osmosis': ('/txs/', '/address/', '/block/'),
+    'EOS': ('/transaction/', '/account/', '/block/'),
+}
+
+
+def _derive_explorer_urls(tx_urls: dict, url_type: str) -> dict:
+    """Build per-chain address or block base URLs from the transaction base URLs"""
+    index = {'address': 1, 'block': 2}[url_type]
+    derived = {}
+    for chain_name, url in tx_urls.items():
+        paths = _EXPLORER_PATHS.get(chain_name, ('/tx/', '/address/', '/block/'))
+        derived[chain_name] = url.replace(paths[0], paths[index])
+    return derived
+
+
+@functools.lru_cache(maxsize=128)
+def _explorer_prefix(chain_name: str, url_type: str):
+    """Base URL for a built-in chain and URL type; None when url_type is unknown"""
+    urls = BlockchainAdapters._explorer_url_tables.get(url_type)
+    return urls.get(chain_name, '') if urls is not None else None
+
 
 class BlockchainAdapters:
     """Factory class for blockchain adapters with custom integration support"""
     
-    _adapters = {
-        'Ethereum': EthereumAdapter,
-        'Binance Smart Chain': BSCAdapter,
-        'Polygon': PolygonAdapter,
-        'Avalanche': AvalancheAdapter,
-        'Arbitrum': ArbitrumAdapter,
-        'Optimism': OptimismAdapter,
-        'Fantom': FantomAdapter,
-        'PulseChain': PulsechainAdapter,
-        'Solana': SolanaAdapter,
-        'Tron': TronAdapter,
-        'Dogecoin': DogecoinAdapter,
-        'Polkadot': PolkadotAdapter,
-        'Near': NearAdapter,
-        'Algorand': AlgorandAdapter,
-        'Ton': TonAdapter,
-        'Pi Network': PiNetworkAdapter,
-        'Cosmos': CosmosAdapter,
-        'Osmosis': OsmosisAdapter,
-        'EOS': EOSAdapter,
-    }
+    __slots__ = ('custom_manager', 'custom_adapters', '_instance_cache', '_chain_configs')
+    
+    # Chain name -> (module, class). Adapter modules are imported on first use
+    # so callers only pay for the SDKs of the chains they actually touch
+    _ADAPTER_REGISTRY = MappingProxyType({
+        'Ethereum': ('.ethereum_adapter', 'EthereumAdapter'),
+        'Binance Smart Chain': ('.evm_adapter', 'EVMAdapter'),
+        'Polygon': ('.evm_adapter', 'EVMAdapter'),
+        'Avalanche': ('.evm_adapter', 'EVMAdapter'),
+        'Arbitrum': ('.evm_adapter', 'EVMAdapter'),
+        'Optimism': ('.evm_adapter', 'EVMAdapter'),
+        'Fantom': ('.evm_adapter', 'EVMAdapter'),
+        'PulseChain': ('.evm_adapter', 'EVMAdapter'),
+        'Base': ('.evm_adapter', 'EVMAdapter'),
+        'Solana': ('.solana_adapter', 'SolanaAdapter'),
+        'Tron': ('.tron_adapter', 'TronAdapter'),
+        'Dogecoin': ('.dogecoin_adapter', 'DogecoinAdapter'),
+        'Polkadot': ('.polkadot_adapter', 'PolkadotAdapter'),
+        'Near': ('.near_adapter', 'NearAdapter'),
+        'Algorand': ('.algorand_adapter', 'AlgorandAdapter'),
+        'Ton': ('.ton_adapter', 'TonAdapter'),
+        'Pi Network': ('.pi_network_adapter', 'PiNetworkAdapter'),
+        'Cosmos': ('.cosmos_adapter', 'CosmosAdapter'),
+        'Osmosis': ('.osmosis_adapter', 'OsmosisAdapter'),
+        'EOS': ('.eos_adapter', 'EOSAdapter'),
+    })
+    _adapter_classes = {}  # Resolved registry entries
     
     def __init__(self):
         """Initialize with custom blockchain integration support"""
         self.custom_adapters = {}
+        self._instance_cache = {}  # Built-in adapter instances by chain name
+        self._chain_configs = dict(settings.BLOCKCHAINS.get('blockchains', {}))
         self._load_custom_integrations()
     
-    _explorer_urls = {
+    _explorer_urls = MappingProxyType({
         'Ethereum': 'https://etherscan.io/tx/',
         'Binance Smart Chain': 'https://bscscan.com/tx/',
         'Polygon': 'https://polygonscan.com/tx/',
@@ -64,6 +80,7 @@ class BlockchainAdapters:
         'Optimism': 'https://optimistic.etherscan.io/tx/',
         'Fantom': 'https://ftmscan.com/tx/',
         'PulseChain': 'https://scan.pulsechain.com/tx/',
+        'Base': 'https://basescan.org/tx/',
         'Solana': 'https://solscan.io/tx/',
         'Tron': 'https://tronscan.org/#/transaction/',
         'Dogecoin': 'https://dogechain.info/tx/',
@@ -75,7 +92,10 @@ class BlockchainAdapters:
         'Cosmos': 'https://www.mintscan.io/cosmos/txs/',
         'Osmosis': 'https://www.mintscan.io/osmosis/txs/',
         'EOS': 'https://bloks.io/transaction/',
-    }
+    })
+    _address_urls = MappingProxyType(_derive_explorer_urls(_explorer_urls, 'address'))
+    _block_urls = MappingProxyType(_derive_explorer_urls(_explorer_urls, 'block'))
+    _explorer_url_tables = MappingProxyType({'tx': _explorer_urls, 'address': _address_urls, 'block': _block_urls})
     
     def _load_custom_integrations(self):
         """Load custom blockchain integrations"""
@@ -87,115 +107,134 @@ class BlockchainAdapters:
         except Exception as e:
             logger.log(f"Error loading custom integrations: {e}")
             self.custom_manager = None
+            self.custom_adapters = {}
     
     def get_adapter(self, chain_name: str):
         """Get adapter instance for a blockchain"""
         # Check custom adapters first
-        if hasattr(self, 'custom_adapters') and chain_name in self.custom_adapters:
+        if chain_name in self.custom_adapters:
             return self.custom_adapters[chain_name]
         
+        # Adapters hold RPC connections, so build each one only once
+        if chain_name in self._instance_cache:
+            return self._instance_cache[chain_name]
+        
         # Check built-in adapters
-        if chain_name not in self._adapters:
+        if chain_name not in self._ADAPTER_REGISTRY:
             raise ValueError(f"Unsupported blockchain: {chain_name}")
         
-        adapter_class = self._adapters[chain_name]
-        blockchain_config = settings.BLOCKCHAINS.get('blockchains', {}).get(chain_name)
+        adapter_class = self._get_adapter_class(chain_name)
+        blockchain_config = self._chain_configs.get(chain_name)
         
         if not blockchain_config:
             # Try to create adapter without config for basic functionality
             try:
-                return adapter_class()
+                adapter = adapter_class()
             except Exception as e:
                 logger.log(f"Warning: Failed to initialize {chain_name} adapter: {e}")
                 return None
+        else:
+            adapter = adapter_class({**blockchain_config, 'name': chain_name})
         
-        return adapter_class(blockchain_config)
+        self._instance_cache[chain_name] = adapter
+        return adapter
+    
+    def reload_configs(self):
+        """Re-read the built-in chain configs from settings and rebuild adapters on next use"""
+        self._chain_configs = dict(settings.BLOCKCHAINS.get('blockchains', {}))
+        self._instance_cache.clear()
+    
+    @classmethod
+    def _get_adapter_class(cls, chain_name: str):
+        """Import and cache the adapter class registered for a blockchain"""
+        if chain_name not in cls._adapter_classes:
+            module_path, class_name = cls._ADAPTER_REGISTRY[chain_name]
+            module = importlib.import_module(module_path, __package__)
+            cls._adapter_classes[chain_name] = getattr(module, class_name)
+        return cls._adapter_classes[chain_name]
     
     def get_explorer_url(self, chain_name: str, url_type: str = 'tx', identifier: str = '') -> str:
         """Get explorer URL for a blockchain transaction or address"""
         # Check custom adapters first
-        if hasattr(self, 'custom_adapters') and chain_name in self.custom_adapters:
+        if chain_name in self.custom_adapters:
             adapter = self.custom_adapters[chain_name]
             if hasattr(adapter, 'get_explorer_url'):
                 return adapter.get_explorer_url(url_type, identifier)
         
-        # Check built-in explorer URLs
-        base_url = self._explorer_urls.get(chain_name, '')
-        if not base_url:
-            return ''
-        
-        if url_type == 'tx':
-            return f"{base_url}{identifier}"
-        elif url_type == 'address':
-            return base_url.replace('/tx/', '/address/') + identifier
-        elif url_type == 'block':
-            return base_url.replace('/tx/', '/block/') + identifier
-        else:
-            return base_url
+        # Check built-in explorer URLs; the tables are read-only, so prefixes are memoized
+        prefix = _explorer_prefix(chain_name, url_type)
+        if prefix is None:
+            return self._explorer_urls.get(chain_name, '')
+        return prefix + identifier if prefix else ''
+    
+    @classmethod
+    def list_adapter_classes(cls) -> dict:
+        """Get the adapter class for every built-in blockchain without instantiating any of them"""
+        return {chain_name: cls._get_adapter_class(chain_name) for chain_name in cls._ADAPTER_REGISTRY}
     
     def get_supported_chains(self) -> list:
         """Get list of supported blockchain names including custom chains"""
-        chains = list(self._adapters.keys())
-        if hasattr(self, 'custom_adapters'):
-            chains.extend(self.custom_adapters.keys())
-        return chains
+        return list(self._ADAPTER_REGISTRY.keys()) + list(self.custom_adapters.keys())
     
     def add_custom_evm_chain(self, chain_name: str, config: dict) -> bool:
         """Add a custom EVM-compatible blockchain"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return False
         
         config['type'] = 'evm'
         success = self.custom_manager.add_custom_chain(chain_name, config)
         if success:
             self.custom_adapters = self.custom_manager.get_all_custom_chains()
+            self._instance_cache.pop(chain_name, None)
         return success
     
     def add_custom_web3_chain(self, chain_name: str, config: dict) -> bool:
         """Add a custom Web3-compatible blockchain"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return False
         
         config['type'] = 'web3'
         success = self.custom_manager.add_custom_chain(chain_name, config)
         if success:
             self.custom_adapters = self.custom_manager.get_all_custom_chains()
+            self._instance_cache.pop(chain_name, None)
         return success
     
     def remove_custom_chain(self, chain_name: str) -> bool:
         """Remove a custom blockchain"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return False
         
         success = self.custom_manager.remove_custom_chain(chain_name)
         if success:
             self.custom_adapters = self.custom_manager.get_all_custom_chains()
+            self._instance_cache.pop(chain_name, None)
         return success
     
     def test_custom_chain(self, chain_name: str) -> dict:
         """Test connection to a custom blockchain"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return {'success': False, 'error': 'Custom integration manager not available'}
         
         return self.custom_manager.test_chain_connection(chain_name)
     
     def get_custom_chain_stats(self) -> dict:
         """Get statistics for custom blockchains"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return {'total_chains': 0, 'enabled_chains': 0}
         
         return self.custom_manager.get_chain_stats()
     
     def create_evm_template(self) -> dict:
         """Create a template for EVM chain configuration"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return {}
         
         return self.custom_manager.create_evm_chain_template()
     
     def create_web3_template(self, chain_type: str = "substrate") -> dict:
         """Create a template for Web3 chain configuration"""
-        if not hasattr(self, 'custom_manager') or not self.custom_manager:
+        if self.custom_manager is None:
             return {}
         
         return self.custom_manager.create_web3_chain_template(chain_type)
\ No newline at end of file
@@ -1,44 +1,72 @@
-from typing import List, Dict, Any
-from .base_chain_adapter import BaseChainAdapter
+from itertools import chain
+from typing import List, Dict, Any, Optional
+from .base_chain_adapter import BaseChainAdapter, Tx
 from src.utils.logger import logger
 
+_MICROALGOS = 10 ** 6
+
 
 class AlgorandAdapter(BaseChainAdapter):
-    """Algorand blockchain adapter"""
+    """Algorand blockchain adapter using the algod v2 REST API"""
     
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        try:
-            # Algorand client initialization would go here
-            pass
-        except Exception as e:
-            logger.log(f"Error initializing Algorand adapter: {e}")
-            raise
+        # algod is plain REST, so requests go through the shared keep-alive session
+        if not self.rpc_url:
+            raise ValueError("Algorand adapter requires an algod 'rpc_url'")
     
     def get_current_block(self) -> int:
         """Get the current block number"""
         try:
-            # Algorand specific implementation
-            return 0  # Placeholder
-        except Exception as e:
-            logger.log(f"Error getting current block: {e}")
+            status = self._get_json('/v2/status')
+            return status['last-round'] if status else 0
+        except (KeyError, TypeError, ValueError) as e:
+            logger.log(f"Malformed Algorand status response: {e}")
             return 0
     
-    def get_transactions(self, start_block: int, end_block: int) -> List[Dict[str, Any]]:
+    def get_transactions(self, start_block: int, end_block: int) -> List[Tx]:
         """Get transactions between block range"""
         transactions = []
         try:
-            # Algorand transaction fetching logic would go here
-            pass
-        except Exception as e:
-            logger.log(f"Error getting transactions: {e}")
+            # Rounds are fetched in parallel over pooled connections instead of one round trip at a time;
+            # the per-block lists come back in block order and are flattened in one pass
+            per_block = self._fetch_concurrently(self._get_round_transactions, range(start_block, end_block + 1))
+            transactions = list(chain.from_iterable(per_block))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            logger.log(f"Malformed Algorand block response: {e}")
         return transactions
     
+    def _get_round_transactions(self, round_number: int) -> List[Tx]:
+        """Fetch one round and format its payment transactions"""
+        block = self._get_json(f'/v2/blocks/{round_number}?format=json')
+        if not block:
+            return []
+        block = block.get('block', {})
+        signed_txns = block.get('txns') or []
+        if not signed_txns:
+            return []
+        
+        # Block bodies don't carry transaction IDs; algod lists them in block order
+        txids = (self._get_json(f'/v2/blocks/{round_number}/txids') or {}).get('blockTxids') or []
+        timestamp = block.get('ts', 0)
+        transactions = []
+        for i, signed in enumerate(signed_txns):
+            tx_hash = txids[i] if i < len(txids) else ''
+            tx = self._format_algorand_transaction(signed.get('txn', {}), tx_hash, round_number, timestamp)
+            if tx:
+                transactions.append(tx)
+        return transactions
+    
+    def _format_algorand_transaction(self, txn: Dict[str, Any], tx_hash: str,
+                                     round_number: int, timestamp: int) -> Optional[Tx]:
+        """Convert an algod payment into a Tx; other transaction types return None"""
+        if txn.get('type') != 'pay':
+            return None
+        return Tx(tx_hash, txn.get('rcv', ''), txn.get('snd', ''), txn.get('amt', 0) / _MICROALGOS,
+                  self.native_token, round_number, timestamp)
+    
     def get_transaction_details(self, tx_hash: str) -> Dict[str, Any]:
         """Get detailed transaction information"""
-        try:
-            # Algorand transaction details logic
-            return {}  # Placeholder
-        except Exception as e:
-            logger.log(f"Error getting transaction details: {e}")
-            return {}
+        # algod only serves pending transactions; confirmed ones need an indexer
+        details = self._get_json(f'/v2/transactions/pending/{tx_hash}?format=json')
+        return details or {}
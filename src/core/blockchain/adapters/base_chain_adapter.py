@@ -1,17 +1,78 @@
+import asyncio
+import orjson
+import requests
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from operator import itemgetter
+from typing import List, Dict, Any, Callable, Iterable, Optional, Sequence, Tuple
 from .token_methods import TokenMethodsMixin
+from src.utils.logger import logger
+from src.infrastructure.rpc_client import rpc_session
+from src.core.blockchain.wallet_cache import address_key
+
+
+class RecordMixin:
+    """Dict-style access for slotted dataclass records; the field `from_` is exposed as 'from'"""
+    
+    __slots__ = ()  # keeps subclasses declared with slots=True free of a per-instance __dict__
+    
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access so callers written against the old dict records keep working"""
+        try:
+            return getattr(self, 'from_' if key == 'from' else key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {'from' if f.name == 'from_' else f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True, frozen=True)
+class Tx(RecordMixin):
+    """Normalised transaction record returned by adapters"""
+    hash: str
+    to: str
+    from_: str
+    value: float
+    currency: str
+    block: int
+    timestamp: int = 0
 
 
 class BaseChainAdapter(ABC, TokenMethodsMixin):
     """Base class for all blockchain adapters with token tracking support"""
     
+    # Max JSON-RPC calls per batch POST; some providers degrade past ~40
+    BATCH_SIZE = 50
+    # Concurrent requests per block range for REST APIs without batching; stays under the session's pool size
+    FETCH_WORKERS = 16
+    # Fields of the records get_transactions returns, as columns for get_transactions_columnar
+    TX_COLUMNS = ('hash', 'to', 'from', 'value', 'currency', 'block', 'timestamp')
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.rpc_url = config.get('rpc_url')
-        self.native_token = config.get('native_token')
+        # Currencies are reported upper-case so trackers can test them against
+        # TRACKED_CURRENCIES without normalising every transaction
+        native_token = config.get('native_token')
+        self.native_token = native_token.upper() if native_token else native_token
         self.tokens = config.get('tokens', {})
+        # Contract address key -> token name, so currency detection is one dict lookup
+        self._token_map = {address_key(addr): name.upper() for name, addr in self.tokens.items()}
         self.chain_name = config.get('name', 'unknown')
+        self.batch_size = config.get('batch_size', self.BATCH_SIZE)
+        # Lower this for providers that rate limit concurrent requests
+        self.fetch_workers = config.get('fetch_workers', self.FETCH_WORKERS)
+        # Worth enabling on low-activity chains where most blocks are empty
+        self.skip_empty_blocks = config.get('skip_empty_blocks', False)
+        self._session = rpc_session
     
     @abstractmethod
     def get_current_block(self) -> int:
@@ -19,7 +80,7 @@ class BaseChainAdapter(ABC, TokenMethodsMixin):
         pass
     
     @abstractmethod
-    def get_transactions(self, start_block: int, end_block: int) -> List[Dict[str, Any]]:
+    def get_transactions(self, start_block: int, end_block: int) -> List[Tx]:
         """Get transactions between block range"""
         pass
     
@@ -28,24 +89,149 @@ class BaseChainAdapter(ABC, TokenMethodsMixin):
         """Get detailed transaction information"""
         pass
     
-    def _detect_token_currency(self, tx: Dict[str, Any]) -> str:
-        """Detect the currency/token type from transaction"""
-        to_addr = (tx.get('to') or '').lower()
+    def get_transactions_columnar(self, start_block: int, end_block: int) -> Dict[str, List[Any]]:
+        """
+        get_transactions() transposed into one list per field in TX_COLUMNS.
+        
+        Lets callers filter or sum a single field, e.g. every `to` address,
+        without looking it up record by record.
+        """
+        txs = self.get_transactions(start_block, end_block)
+        if not txs:
+            return {column: [] for column in self.TX_COLUMNS}
+        # itemgetter and zip do the transposition in C; every record type supports tx[field]
+        rows = map(itemgetter(*self.TX_COLUMNS), txs)
+        return dict(zip(self.TX_COLUMNS, map(list, zip(*rows))))
+    
+    async def get_current_block_async(self) -> int:
+        """get_current_block() in a worker thread, so many chains can be awaited together with asyncio.gather"""
+        return await asyncio.to_thread(self.get_current_block)
+    
+    async def get_transactions_async(self, start_block: int, end_block: int) -> List[Tx]:
+        """get_transactions() in a worker thread, so many chains can be awaited together with asyncio.gather"""
+        return await asyncio.to_thread(self.get_transactions, start_block, end_block)
+    
+    def _rpc_batch(self, methods_and_params: Sequence[Tuple[str, List]]) -> List[Optional[Any]]:
+        """
+        Send JSON-RPC calls as batch POSTs of at most `batch_size` calls each.
+        
+        Args:
+            methods_and_params: (method, params) pairs to execute.
+        
+        Returns:
+            The `result` of each call in request order, or None for calls that failed.
+        """
+        calls = list(methods_and_params)
+        results: List[Optional[Any]] = [None] * len(calls)
+        
+        for offset in range(0, len(calls), self.batch_size):
+            payload = [
+                {"jsonrpc": "2.0", "id": offset + i, "method": method, "params": params}
+                for i, (method, params) in enumerate(calls[offset:offset + self.batch_size])
+            ]
+            try:
+                response = self._session.post(self.rpc_url, json=payload, timeout=30)
+                response.raise_for_status()
+                replies = orjson.loads(response.content)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.log(f"Batch RPC call to {self.rpc_url} failed: {e}")
+                continue
+            
+            # Providers may answer a batch in any order, so match replies by id
+            for reply in replies if isinstance(replies, list) else []:
+                if not isinstance(reply, dict):
+                    continue
+                if 'error' in reply:
+                    logger.log(f"RPC error in batch for {self.chain_name}: {reply['error']}")
+                    continue
+                # A missing or foreign id (some proxies renumber or drop it) only loses that entry
+                call_id = reply.get('id')
+                if not isinstance(call_id, int) or not offset <= call_id < offset + len(payload):
+                    logger.log(f"Unmatched reply id {call_id!r} in batch for {self.chain_name}")
+                    continue
+                results[call_id] = reply.get('result')
         
-        for token_name, contract_addr in self.tokens.items():
-            if to_addr == contract_addr.lower():
-                return token_name
+        return results
+    
+    def _get_blocks_batched(self, start_block: int, end_block: int) -> List[Dict[str, Any]]:
+        """Fetch full EVM blocks (with transactions) in [start_block, end_block] via batched RPC"""
+        numbers = range(start_block, end_block + 1)
+        if self.skip_empty_blocks:
+            counts = self._rpc_batch([
+                ("eth_getBlockTransactionCountByNumber", [hex(n)]) for n in numbers
+            ])
+            # A failed count still fetches the block rather than risk missing transactions
+            numbers = [n for n, count in zip(numbers, counts) if count is None or self._hex_to_int(count) > 0]
+        
+        blocks = self._rpc_batch([("eth_getBlockByNumber", [hex(n), True]) for n in numbers])
+        return [block for block in blocks if block]
+    
+    def _get_json(self, path: str, prefilter: Optional[Callable[[bytes], bool]] = None) -> Optional[Any]:
+        """GET a JSON document from the chain's REST API over the shared session; None on failure
         
-        return self.native_token
+        A prefilter sees the raw body first; when it returns False the body is not parsed and None is returned.
+        """
+        try:
+            # Short connect timeout so a dead endpoint fails fast; reads allow for large blocks
+            response = self._session.get(f"{self.rpc_url.rstrip('/')}{path}", timeout=(3, 10))
+            response.raise_for_status()
+            body = response.content
+            if prefilter is not None and not prefilter(body):
+                return None
+            return orjson.loads(body)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.log(f"REST call to {self.rpc_url}{path} failed: {e}")
+            return None
+    
+    def _fetch_concurrently(self, fetch: Callable[[int], Any], numbers: Iterable[int]) -> List[Any]:
+        """Call fetch(n) for every block number in parallel, returning results in block order"""
+        numbers = list(numbers)
+        if len(numbers) <= 1:
+            return [fetch(n) for n in numbers]
+        with ThreadPoolExecutor(max_workers=min(self.fetch_workers, len(numbers))) as pool:
+            return list(pool.map(fetch, numbers))
+    
+    @staticmethod
+    def _hex_to_int(value: Any) -> Any:
+        """Decode a hex quantity from a raw JSON-RPC response; other values pass through"""
+        if isinstance(value, str):
+            return int(value, 16)
+        return value
+    
+    @staticmethod
+    def _hash_hex(value: Any) -> str:
+        """0x-prefixed hex of a transaction or block hash, whether web3 returned HexBytes or a string"""
+        if isinstance(value, str):
+            return value if value[:2] in ('0x', '0X') else '0x' + value
+        # bytes.hex() never adds the prefix, unlike HexBytes.hex() before hexbytes 1.0
+        return '0x' + bytes(value).hex()
+    
+    def _detect_token_currency(self, tx: Dict[str, Any]) -> str:
+        """Detect the currency/token type from transaction"""
+        if not self._token_map:
+            return self.native_token  # Token-less chains skip the address normalisation
+        return self._token_map.get(address_key(tx.get('to')), self.native_token)
+    
+    def _format_transactions(self, txs: Sequence[Dict[str, Any]]) -> List[Tx]:
+        """Format a batch of transactions; bulk equivalent of _format_transaction"""
+        token_map, native, key = self._token_map, self.native_token, address_key
+        return [
+            Tx(
+                t.get('hash', ''), t.get('to', ''), t.get('from', ''), t.get('value', 0),
+                token_map.get(key(t.get('to')), native) if token_map else native,
+                t.get('blockNumber', 0), t.get('timestamp', 0)
+            )
+            for t in txs
+        ]
     
-    def _format_transaction(self, tx: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_transaction(self, tx: Dict[str, Any]) -> Tx:
         """Format transaction data to standard format"""
-        return {
-            'hash': tx.get('hash', ''),
-            'to': tx.get('to', ''),
-            'from': tx.get('from', ''),
-            'value': tx.get('value', 0),
-            'currency': self._detect_token_currency(tx),
-            'block': tx.get('blockNumber', 0),
-            'timestamp': tx.get('timestamp', 0)
-        }
\ No newline at end of file
+        return Tx(
+            hash=tx.get('hash', ''),
+            to=tx.get('to', ''),
+            from_=tx.get('from', ''),
+            value=tx.get('value', 0),
+            currency=self._detect_token_currency(tx),
+            block=tx.get('blockNumber', 0),
+            timestamp=tx.get('timestamp', 0)
+        )
\ No newline at end of file
@@ -3,9 +3,77 @@ Custom EVM Blockchain Adapter
 Allows dynamic integration of any EVM-compatible blockchain
 """
 
-from typing import Dict, List, Optional, Any
-from .base_chain_adapter import BaseChainAdapter
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Any, Union
+from eth_utils import function_signature_to_4byte_selector, is_hex_address
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+from .base_chain_adapter import BaseChainAdapter, RecordMixin
 from src.utils.logger import logger
+from src.infrastructure.multicall import MULTICALL3_ADDRESS, Multicall
+from src.infrastructure.rpc_client import OrjsonHTTPProvider, rpc_session
+from src.utils.address import checksum_address
+from src.core.blockchain.wallet_cache import address_key
+
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector('balanceOf(address)')
+DECIMALS_SELECTOR = function_signature_to_4byte_selector('decimals()')
+# Multicall3's own helper for reading native balances inside an aggregate call
+GET_ETH_BALANCE_SELECTOR = function_signature_to_4byte_selector('getEthBalance(address)')
+
+# Unit scales for plain int division; Web3.from_wei builds a Decimal context per call
+_WEI = 10 ** 18
+_GWEI = 10 ** 9
+
+
+@functools.lru_cache(maxsize=8192)
+def _address_word(address: str) -> bytes:
+    """ABI-encode an address argument: its 20 bytes left-padded to a 32-byte word"""
+    raw = bytes.fromhex(address[2:] if address[:2] in ('0x', '0X') else address)
+    if len(raw) != 20:
+        raise ValueError(f"Invalid EVM address: {address}")
+    return raw.rjust(32, b'\x00')
+
+
+@dataclass(slots=True, frozen=True)
+class TxRecord(RecordMixin):
+    """
+    Raw transaction fields from a custom EVM block.
+
+    Values stay as ints and hashes as the bytes web3 returns; string
+    conversion is deferred to to_dict(), which emits the JSON-ready form.
+    """
+    hash: Union[str, bytes]
+    from_: str
+    to: str
+    value: int
+    gas: int
+    gas_price: int
+    block_number: int
+    block_hash: Union[str, bytes]
+    transaction_index: int
+    chain_id: Optional[int]
+    chain_name: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'hash': BaseChainAdapter._hash_hex(self.hash),
+            'from': self.from_,
+            'to': self.to,
+            'value': str(self.value),
+            'gas': self.gas,
+            'gas_price': str(self.gas_price),
+            'block_number': self.block_number,
+            'block_hash': BaseChainAdapter._hash_hex(self.block_hash),
+            'transaction_index': self.transaction_index,
+            'chain_id': self.chain_id,
+            'chain_name': self.chain_name
+        }
+
 
 class CustomEVMAdapter(BaseChainAdapter):
     """
@@ -13,6 +81,20 @@ class CustomEVMAdapter(BaseChainAdapter):
     Supports any EVM-compatible blockchain with custom configuration
     """
     
+    # Custom chains are often served by public RPCs that throttle large batches
+    BATCH_SIZE = 20
+    TX_COLUMNS = ('hash', 'from', 'to', 'value', 'gas', 'gas_price', 'block_number', 'block_hash',
+                  'transaction_index', 'chain_id', 'chain_name')
+    # Seconds a successful connection check is trusted before the next one
+    CONNECTION_CHECK_TTL = 5.0
+    # Blocks fetched and formatted per step of get_transactions
+    BLOCK_FETCH_CHUNK = 50
+    # Seconds a fetched chain head is reused for confirmation counts
+    BLOCK_NUMBER_TTL = 1.0
+    # Receipt polling backoff bounds in seconds for wait_for_transaction
+    RECEIPT_POLL_INITIAL = 0.5
+    RECEIPT_POLL_MAX = 3.5
+    
     def __init__(self, chain_config: Dict[str, Any]):
         """
         Initialize custom EVM adapter with dynamic configuration
@@ -21,47 +103,100 @@ class CustomEVMAdapter(BaseChainAdapter):
             chain_config: Dictionary containing:
                 - name: Chain name
                 - rpc_url: RPC endpoint URL
+                - http_rpc_url: HTTP endpoint for reads when rpc_url is a websocket
                 - chain_id: Network chain ID
                 - symbol: Native token symbol
                 - explorer_url: Block explorer URL
                 - gas_price_multiplier: Optional gas price multiplier
                 - block_time: Average block time in seconds
                 - confirmations: Required confirmations
+                - batch_rpc: Set False for providers that serialize JSON-RPC batches
+                - rpc_concurrency: Parallel block requests when batching is off
+                - block_fetch_chunk: Blocks fetched per step of get_transactions
+                - multicall_address: Multicall3 deployment, if not at the canonical address
         """
         super().__init__(chain_config)
         self.chain_name = chain_config.get('name', 'Custom EVM Chain')
         self.chain_id = chain_config.get('chain_id')
+        self.http_rpc_url = chain_config.get('http_rpc_url')
         self.symbol = chain_config.get('symbol', 'ETH')
         self.explorer_url = chain_config.get('explorer_url', '')
+        self._explorer_base = self.explorer_url.rstrip('/')
+        self._explorer_prefixes = {
+            url_type: f"{self._explorer_base}/{url_type}/" for url_type in ('tx', 'address', 'block')
+        }
         self.gas_price_multiplier = chain_config.get('gas_price_multiplier', 1.0)
         self.block_time = chain_config.get('block_time', 15)  # seconds
         self.confirmations = chain_config.get('confirmations', 12)
+        self.multicall_address = chain_config.get('multicall_address', MULTICALL3_ADDRESS)
         
         # Token contracts for stablecoins
         self.token_contracts = chain_config.get('token_contracts', {})
         
-        # Initialize Web3 connection
-        self.web3 = None
-        self._initialize_connection()
+        # Some providers bill and serialize a batch as N requests, so concurrent
+        # single requests can be faster there; the pool is reused across polls
+        self.batch_rpc = chain_config.get('batch_rpc', True)
+        self.block_fetch_chunk = chain_config.get('block_fetch_chunk', self.BLOCK_FETCH_CHUNK)
+        self._pool = ThreadPoolExecutor(
+            max_workers=chain_config.get('rpc_concurrency', 8),
+            thread_name_prefix=f"rpc-{self.chain_name}"
+        )
+        
+        # Latest block number pushed by the newHeads subscription on websocket endpoints
+        self._latest_head: Optional[int] = None
+        self._new_head = threading.Event()  # set on every pushed head, wakes wait_for_transaction
+        self._closed = False
+        
+        self._conn_ok_until = 0.0  # monotonic deadline of the last successful connection check
+        self._block_number_memo = (0, 0.0)  # (block number, monotonic expiry)
+        
+        # The Web3 connection is built on first use of self.web3, so constructing
+        # many adapters at boot doesn't serialize their connection handshakes
+        self._web3 = None
+        self._web3_ready = False
+        self._connect_lock = threading.Lock()
+        if self._is_websocket():
+            self._start_head_subscription()
         
         logger.log(f"Custom EVM adapter initialized for {self.chain_name} (Chain ID: {self.chain_id})")
     
+    @property
+    def web3(self):
+        """Web3 client for the chain, connected on first access"""
+        if not self._web3_ready:
+            with self._connect_lock:
+                if not self._web3_ready:
+                    self._initialize_connection()
+                    self._web3_ready = True
+        return self._web3
+    
+    @web3.setter
+    def web3(self, value):
+        self._web3 = value
+        self._web3_ready = True
+    
+    def warm_up(self):
+        """Connect now rather than on first use; safe to call from a worker thread"""
+        return self.web3
+    
     def _initialize_connection(self):
         """Initialize Web3 connection to the custom EVM chain"""
         try:
-            from web3 import Web3
-            
             if not self.rpc_url:
                 logger.log(f"No RPC URL provided for {self.chain_name}")
                 return
             
-            if self.rpc_url.startswith('wss://') or self.rpc_url.startswith('ws://'):
-                from web3.providers import WebsocketProvider
-                provider = WebsocketProvider(self.rpc_url)
-            else:
-                from web3.providers import HTTPProvider
-                # Set a short timeout for HTTP requests
-                provider = HTTPProvider(self.rpc_url, request_kwargs={'timeout': 3})
+            read_url = self.rpc_url
+            if self._is_websocket():
+                # web3 has no synchronous websocket provider, so a websocket endpoint
+                # only pushes new heads and blocks are read over HTTP
+                read_url = self.http_rpc_url
+                if not read_url:
+                    logger.log(f"No http_rpc_url for {self.chain_name}; its websocket endpoint cannot serve reads")
+                    return
+            
+            # Set a short timeout for HTTP requests
+            provider = OrjsonHTTPProvider(read_url, request_kwargs={'timeout': 3}, session=rpc_session)
             
             self.web3 = Web3(provider)
             
@@ -69,7 +204,8 @@ class CustomEVMAdapter(BaseChainAdapter):
             try:
                 is_connected = self.web3.is_connected()
                 if is_connected:
-                    logger.log(f"Successfully connected to {self.chain_name} at {self.rpc_url}")
+                    self._conn_ok_until = time.monotonic() + self.CONNECTION_CHECK_TTL
+                    logger.log(f"Successfully connected to {self.chain_name} at {read_url}")
                     # Verify chain ID if provided
                     if self.chain_id:
                         try:
@@ -79,15 +215,73 @@ class CustomEVMAdapter(BaseChainAdapter):
                         except Exception as e:
                             logger.log(f"Could not verify chain ID for {self.chain_name}: {e}")
                 else:
-                    logger.log(f"Failed to connect to {self.chain_name} at {self.rpc_url}")
+                    logger.log(f"Failed to connect to {self.chain_name} at {read_url}")
             except Exception as e:
-                logger.log(f"Failed to connect to {self.chain_name} at {self.rpc_url}")
+                logger.log(f"Failed to connect to {self.chain_name} at {read_url}")
                 self.web3 = None
                 
         except Exception as e:
             logger.log(f"Error initializing connection to {self.chain_name}: {e}")
             self.web3 = None
     
+    def _ensure_connected(self) -> bool:
+        """Check the connection, trusting a successful check for CONNECTION_CHECK_TTL seconds"""
+        if not self.web3:
+            return False
+        now = time.monotonic()
+        if now < self._conn_ok_until:
+            return True
+        # is_connected() is itself an RPC round trip, so don't pay it on every call
+        ok = self.web3.is_connected()
+        self._conn_ok_until = now + self.CONNECTION_CHECK_TTL if ok else 0.0
+        return ok
+    
+    def _is_websocket(self) -> bool:
+        """Whether the RPC endpoint is a websocket, which supports subscriptions"""
+        return bool(self.rpc_url) and self.rpc_url.startswith(('wss://', 'ws://'))
+    
+    def _start_head_subscription(self):
+        """Follow new heads on a background event loop so block numbers are pushed, not polled"""
+        thread = threading.Thread(
+            target=asyncio.run, args=(self._follow_new_heads(),),
+            name=f"heads-{self.chain_name}", daemon=True
+        )
+        thread.start()
+    
+    async def _follow_new_heads(self):
+        """Keep the newHeads subscription alive, resubscribing after disconnects until closed"""
+        while not self._closed and self._is_websocket():
+            try:
+                await self.subscribe_new_heads()
+            except Exception as e:
+                logger.log(f"newHeads subscription for {self.chain_name} dropped: {e}")
+            # Fall back to polling the block number until the subscription is back
+            self._latest_head = None
+            await asyncio.sleep(self.block_time)
+    
+    async def subscribe_new_heads(self, callback: Optional[Callable[[Dict[str, Any]], Any]] = None):
+        """
+        Subscribe to eth_subscribe('newHeads') and record each new block number.
+        
+        Args:
+            callback: Optional function called with every new block header.
+        
+        Runs until the websocket closes or the adapter is closed.
+        """
+        from web3 import AsyncWeb3, WebSocketProvider
+        
+        async with AsyncWeb3(WebSocketProvider(self.rpc_url)) as w3:
+            await w3.eth.subscribe('newHeads')
+            logger.log(f"Subscribed to new heads on {self.chain_name}")
+            async for payload in w3.socket.process_subscriptions():
+                if self._closed:
+                    break
+                head = payload['result']
+                self._latest_head = self._hex_to_int(head['number'])
+                self._new_head.set()
+                if callback:
+                    callback(head)
+    
     def get_chain_info(self) -> Dict[str, Any]:
         """Get comprehensive chain information"""
         return {
@@ -105,65 +299,125 @@ class CustomEVMAdapter(BaseChainAdapter):
     
     def get_current_block(self) -> int:
         """Get current block number"""
+        # A pushed head is only reported while blocks can be read, otherwise the
+        # caller's cursor would move past blocks it never scanned
+        if self._latest_head is not None and self._ensure_connected():
+            return self._latest_head  # Pushed by the newHeads subscription
+        
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not self._ensure_connected():
                 logger.log(f"Warning: Not connected to {self.chain_name} RPC")
                 return 0
             
             block_number = self.web3.eth.block_number
-            logger.log(f"{self.chain_name} current block: {block_number}")
+            logger.log("%s current block: %s", self.chain_name, block_number, level='debug')
             return block_number
         except Exception as e:
             logger.log(f"Error getting current block for {self.chain_name}: {e}")
             return 0
     
-    def get_transactions(self, start_block: int, end_block: int) -> List[Dict]:
-        """Get transactions in block range"""
+    def get_transactions(self, start_block: int, end_block: int,
+                         chunk_size: Optional[int] = None) -> List[TxRecord]:
+        """Get transactions in block range, fetched chunk_size blocks at a time"""
+        return list(self.iter_transactions(start_block, end_block, chunk_size))
+    
+    def iter_transactions(self, start_block: int, end_block: int,
+                          chunk_size: Optional[int] = None) -> Iterator[TxRecord]:
+        """
+        Yield transactions in block range one chunk of blocks at a time.
+        
+        The whole range is covered, so only one chunk of blocks is held in
+        memory when scanning a wide range such as the backlog after downtime.
+        """
+        if not self._ensure_connected():
+            logger.log(f"Warning: Not connected to {self.chain_name} RPC")
+            return
+        
+        chunk_size = chunk_size or self.block_fetch_chunk
+        for chunk_start in range(start_block, end_block + 1, chunk_size):
+            yield from self._get_chunk_transactions(chunk_start, min(chunk_start + chunk_size - 1, end_block))
+    
+    def _get_chunk_transactions(self, start_block: int, end_block: int) -> List[TxRecord]:
+        """Fetch and format the transactions of one chunk of blocks"""
         try:
-            if not self.web3 or not self.web3.is_connected():
-                logger.log(f"Warning: Not connected to {self.chain_name} RPC")
-                return []
+            # Batches are POSTed to rpc_url, which a websocket endpoint can't accept
+            if self._is_websocket() or not self.batch_rpc:
+                return self._get_transactions_per_block(start_block, end_block)
             
+            # One batched eth_getBlockByNumber POST per batch_size blocks instead of a round trip per block
+            to_int = self._hex_to_int
+            chain_id, chain_name = self.chain_id, self.chain_name
             transactions = []
-            for block_num in range(start_block, min(end_block + 1, start_block + 10)):
+            extend = transactions.extend
+            for block in self._get_blocks_batched(start_block, end_block):
                 try:
-                    block = self.web3.eth.get_block(block_num, full_transactions=True)
-                    for tx in block.transactions:
-                        tx_data = {
-                            'hash': tx.hash.hex(),
-                            'from': tx['from'],
-                            'to': tx.get('to', ''),
-                            'value': str(tx.value),
-                            'gas': tx.gas,
-                            'gas_price': str(tx.gasPrice),
-                            'block_number': block_num,
-                            'block_hash': block.hash.hex(),
-                            'transaction_index': tx.transactionIndex,
-                            'chain_id': self.chain_id,
-                            'chain_name': self.chain_name
-                        }
-                        transactions.append(tx_data)
-                except Exception as e:
-                    logger.log(f"Error processing block {block_num} on {self.chain_name}: {e}")
+                    block_number = to_int(block['number'])
+                    block_hash = block['hash']
+                    extend([
+                        TxRecord(
+                            tx['hash'], tx['from'], tx.get('to') or '',
+                            to_int(tx['value']), to_int(tx['gas']), to_int(tx.get('gasPrice', 0)),
+                            block_number, block_hash, to_int(tx['transactionIndex']),
+                            chain_id, chain_name
+                        )
+                        for tx in block.get('transactions', [])
+                    ])
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.log(f"Error processing block {block.get('number')} on {self.chain_name}: {e}")
                     continue
             
             return transactions
         except Exception as e:
-            logger.log(f"Error getting transactions for {self.chain_name}: {e}")
+            logger.log(f"Error getting transactions {start_block}-{end_block} for {self.chain_name}: {e}")
             return []
     
+    def _get_transactions_per_block(self, start_block: int, end_block: int) -> List[TxRecord]:
+        """Fetch blocks with one web3 request each, for websocket endpoints and providers without batching"""
+        # Futures are keyed by block number, so results come back in block order
+        pending = {
+            n: self._pool.submit(self.web3.eth.get_block, n, True) for n in range(start_block, end_block + 1)
+        }
+        
+        chain_id, chain_name = self.chain_id, self.chain_name
+        transactions = []
+        append = transactions.append
+        for block_num, future in pending.items():
+            try:
+                block = future.result()
+                block_hash = block.hash
+                for tx in block.transactions:
+                    append(TxRecord(
+                        tx.hash, tx['from'], tx.get('to', ''),
+                        tx.value, tx.gas, tx.gasPrice,
+                        block_num, block_hash, tx.transactionIndex,
+                        chain_id, chain_name
+                    ))
+            except Exception as e:
+                logger.log(f"Error processing block {block_num} on {chain_name}: {e}")
+                continue
+        
+        return transactions
+    
+    def close(self):
+        """Shut down the block fetch thread pool and stop following new heads"""
+        self._closed = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
     def get_transaction_details(self, tx_hash: str) -> Optional[Dict]:
         """Get detailed transaction information"""
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not self._ensure_connected():
                 logger.log(f"Warning: Not connected to {self.chain_name} RPC")
                 return None
             
+            if not self._is_websocket() and self.batch_rpc:
+                return self._get_transaction_details_batched(tx_hash)
+            
             tx = self.web3.eth.get_transaction(tx_hash)
             receipt = self.web3.eth.get_transaction_receipt(tx_hash)
             
             return {
-                'hash': tx.hash.hex(),
+                'hash': self._hash_hex(tx.hash),
                 'from': tx['from'],
                 'to': tx.get('to', ''),
                 'value': str(tx.value),
@@ -172,50 +426,126 @@ class CustomEVMAdapter(BaseChainAdapter):
                 'gas_used': receipt.gasUsed,
                 'status': receipt.status,
                 'block_number': receipt.blockNumber,
-                'block_hash': receipt.blockHash.hex(),
+                'block_hash': self._hash_hex(receipt.blockHash),
                 'transaction_index': receipt.transactionIndex,
                 'chain_id': self.chain_id,
                 'chain_name': self.chain_name,
-                'confirmations': self.get_current_block() - receipt.blockNumber
+                'confirmations': (self._recent_block_number() or self.get_current_block()) - receipt.blockNumber
             }
         except Exception as e:
             logger.log(f"Error getting transaction details for {tx_hash} on {self.chain_name}: {e}")
             return None
     
+    def _get_transaction_details_batched(self, tx_hash: str) -> Optional[Dict]:
+        """Fetch the transaction, its receipt and the chain head in one JSON-RPC batch"""
+        head = self._recent_block_number()
+        calls = [("eth_getTransactionByHash", [tx_hash]), ("eth_getTransactionReceipt", [tx_hash])]
+        if head is None:
+            calls.append(("eth_blockNumber", []))
+        results = self._rpc_batch(calls)
+        tx, receipt = results[0], results[1]
+        if not tx or not receipt:
+            logger.log(f"Transaction {tx_hash} not found on {self.chain_name}")
+            return None
+        if head is None:
+            if results[2] is None:
+                logger.log(f"Chain head not found on {self.chain_name}; no confirmations for {tx_hash}")
+                return None
+            head = self._remember_block_number(self._hex_to_int(results[2]))
+        
+        to_int = self._hex_to_int
+        block_number = to_int(receipt['blockNumber'])
+        return {
+            'hash': tx['hash'],
+            'from': tx['from'],
+            'to': tx.get('to') or '',
+            'value': str(to_int(tx['value'])),
+            'gas': to_int(tx['gas']),
+            'gas_price': str(to_int(tx.get('gasPrice', 0))),
+            'gas_used': to_int(receipt['gasUsed']),
+            'status': to_int(receipt['status']),
+            'block_number': block_number,
+            'block_hash': receipt['blockHash'],
+            'transaction_index': to_int(receipt['transactionIndex']),
+            'chain_id': self.chain_id,
+            'chain_name': self.chain_name,
+            'confirmations': head - block_number
+        }
+    
+    def wait_for_transaction(self, tx_hash: str, timeout: float = 120.0) -> Optional[Dict]:
+        """
+        Wait until a transaction is mined and return its details.
+        
+        With a live newHeads subscription the receipt is checked once per new block;
+        otherwise it is polled with exponential backoff from RECEIPT_POLL_INITIAL
+        up to RECEIPT_POLL_MAX seconds.
+        
+        Returns:
+            The get_transaction_details() result, or None if not mined within timeout seconds.
+        """
+        deadline = time.monotonic() + timeout
+        interval = self.RECEIPT_POLL_INITIAL
+        while True:
+            self._new_head.clear()
+            if self._fetch_receipt(tx_hash):
+                return self.get_transaction_details(tx_hash)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._closed:
+                logger.log(f"Timed out waiting for {tx_hash} on {self.chain_name}")
+                return None
+            if self._latest_head is not None:
+                self._new_head.wait(remaining)
+            else:
+                time.sleep(min(interval, remaining))
+                interval = min(interval * 1.5, self.RECEIPT_POLL_MAX)
+    
+    def _fetch_receipt(self, tx_hash: str) -> Optional[Dict]:
+        """Transaction receipt, or None while the transaction is pending or unknown"""
+        try:
+            if not self._ensure_connected():
+                return None
+            if not self._is_websocket() and self.batch_rpc:
+                results = self._rpc_batch([("eth_getTransactionReceipt", [tx_hash])])
+                return results[0] if results else None
+            return self.web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+        except Exception as e:
+            logger.log(f"Error fetching receipt for {tx_hash} on {self.chain_name}: {e}")
+            return None
+    
+    def _recent_block_number(self) -> Optional[int]:
+        """Chain head from the newHeads subscription or a lookup under a second old; None if neither"""
+        if self._latest_head is not None:
+            return self._latest_head
+        number, expires = self._block_number_memo
+        return number if time.monotonic() < expires else None
+    
+    def _remember_block_number(self, number: int) -> int:
+        """Memoize a fetched chain head for BLOCK_NUMBER_TTL seconds"""
+        self._block_number_memo = (number, time.monotonic() + self.BLOCK_NUMBER_TTL)
+        return number
+    
     def get_token_balance(self, address: str, token_contract: str) -> float:
         """Get token balance for an address"""
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not self._ensure_connected():
                 return 0.0
             
-            # Standard ERC-20 ABI for balanceOf function
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [{"name": "_owner", "type": "address"}],
-                    "name": "balanceOf",
-                    "outputs": [{"name": "balance", "type": "uint256"}],
-                    "type": "function"
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "decimals",
-                    "outputs": [{"name": "", "type": "uint8"}],
-                    "type": "function"
-                }
-            ]
-            
-            contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(token_contract),
-                abi=erc20_abi
-            )
-            
-            balance = contract.functions.balanceOf(
-                self.web3.to_checksum_address(address)
-            ).call()
+            # Selectors are constants, so calldata is raw bytes sent with eth_call
+            # rather than built through a web3 Contract and the ABI codec
+            token = checksum_address(token_contract)
+            raw = self.web3.eth.call({'to': token, 'data': BALANCE_OF_SELECTOR + _address_word(address)})
+            if not raw:
+                raise ValueError(f"{token_contract} returned no data for balanceOf")
+            balance = int.from_bytes(raw, 'big')
             
-            decimals = contract.functions.decimals().call()
+            # decimals() is immutable, so after the first lookup a balance is one eth_call
+            key = address_key(token_contract)
+            decimals = self._decimals_cache.get(key)
+            if decimals is None:
+                decimals = int.from_bytes(self.web3.eth.call({'to': token, 'data': DECIMALS_SELECTOR}), 'big')
+                self._decimals_cache[key] = decimals
             return balance / (10 ** decimals)
             
         except Exception as e:
@@ -225,22 +555,73 @@ class CustomEVMAdapter(BaseChainAdapter):
     def get_native_balance(self, address: str) -> float:
         """Get native token balance"""
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not self._ensure_connected():
                 return 0.0
             
             balance_wei = self.web3.eth.get_balance(
-                self.web3.to_checksum_address(address)
+                checksum_address(address)
             )
-            return self.web3.from_wei(balance_wei, 'ether')
+            return balance_wei / _WEI
             
         except Exception as e:
             logger.log(f"Error getting native balance on {self.chain_name}: {e}")
             return 0.0
     
+    def get_token_balances(self, addresses: List[str], token_contract: str) -> List[float]:
+        """
+        Get token balances for many addresses in a single Multicall3 eth_call.
+        
+        Args:
+            addresses: Wallet addresses to read.
+            token_contract: ERC-20 contract address.
+        
+        Returns:
+            Balances in whole tokens, in the order of `addresses`; 0.0 where a read failed.
+        """
+        if not addresses:
+            return []
+        try:
+            if not self._ensure_connected():
+                return [0.0] * len(addresses)
+            
+            calls = [(token_contract, BALANCE_OF_SELECTOR + _address_word(a)) for a in addresses]
+            key = address_key(token_contract)
+            decimals = self._decimals_cache.get(key)
+            if decimals is None:
+                calls.append((token_contract, DECIMALS_SELECTOR))
+            
+            results = Multicall(self.web3, self.multicall_address).try_aggregate(calls)
+            if decimals is None:
+                decimals = int.from_bytes(results.pop(), 'big')
+                self._decimals_cache[key] = decimals
+            
+            scale = 10 ** decimals
+            return [int.from_bytes(data, 'big') / scale if data else 0.0 for data in results]
+            
+        except Exception as e:
+            logger.log(f"Multicall token balances failed on {self.chain_name}, reading one by one: {e}")
+            return [self.get_token_balance(address, token_contract) for address in addresses]
+    
+    def get_native_balances(self, addresses: List[str]) -> List[float]:
+        """Get native token balances for many addresses in a single Multicall3 eth_call"""
+        if not addresses:
+            return []
+        try:
+            if not self._ensure_connected():
+                return [0.0] * len(addresses)
+            
+            calls = [(self.multicall_address, GET_ETH_BALANCE_SELECTOR + _address_word(a)) for a in addresses]
+            results = Multicall(self.web3, self.multicall_address).try_aggregate(calls)
+            return [int.from_bytes(data, 'big') / _WEI if data else 0.0 for data in results]
+            
+        except Exception as e:
+            logger.log(f"Multicall native balances failed on {self.chain_name}, reading one by one: {e}")
+            return [self.get_native_balance(address) for address in addresses]
+    
     def estimate_gas_price(self) -> int:
         """Estimate current gas price"""
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not self._ensure_connected():
                 return 0
             
             gas_price = self.web3.eth.gas_price
@@ -251,32 +632,18 @@ class CustomEVMAdapter(BaseChainAdapter):
             return 0
     
     def validate_address(self, address: str) -> bool:
-        """Validate if address is valid for this chain"""
-        try:
-            if not self.web3:
-                return False
-            
-            checksum_address = self.web3.to_checksum_address(address)
-            return self.web3.is_address(checksum_address)
-            
-        except Exception:
+        """Validate if address is valid for this chain; a local check that needs no RPC connection"""
+        if not isinstance(address, str) or len(address) != 42 or address[:2] not in ('0x', '0X'):
             return False
+        # Any 20-byte hex string is accepted, as before; checksum casing is not enforced
+        return is_hex_address(address)
     
     def get_explorer_url(self, url_type: str, identifier: str) -> str:
         """Get explorer URL for transaction, address, or block"""
         if not self.explorer_url:
             return ""
-        
-        base_url = self.explorer_url.rstrip('/')
-        
-        if url_type == 'tx':
-            return f"{base_url}/tx/{identifier}"
-        elif url_type == 'address':
-            return f"{base_url}/address/{identifier}"
-        elif url_type == 'block':
-            return f"{base_url}/block/{identifier}"
-        else:
-            return base_url
+        prefix = self._explorer_prefixes.get(url_type)
+        return f"{prefix}{identifier}" if prefix else self._explorer_base
     
     def get_supported_tokens(self) -> Dict[str, str]:
         """Get supported token contracts"""
@@ -294,15 +661,25 @@ class CustomEVMAdapter(BaseChainAdapter):
             logger.log(f"Removed {symbol} token contract from {self.chain_name}")
     
     def update_rpc_url(self, new_rpc_url: str):
-        """Update RPC URL and reconnect"""
+        """Update RPC URL, reusing the current HTTP provider when the transport doesn't change"""
+        was_websocket = self._is_websocket()
         self.rpc_url = new_rpc_url
-        self._initialize_web3()
+        self._conn_ok_until = 0.0
+        if self._web3_ready and self._web3 is not None and not was_websocket and not self._is_websocket():
+            # HTTP to HTTP: retarget the provider in place so the shared session's pooled
+            # connections and the Web3 instance survive failover between endpoints
+            self._web3.provider.endpoint_uri = new_rpc_url
+        else:
+            # The transport changed or there is no connection yet; rebuild on next use of self.web3
+            self._web3_ready = False
+            if self._is_websocket() and not was_websocket:
+                self._start_head_subscription()
         logger.log(f"Updated RPC URL for {self.chain_name}: {new_rpc_url}")
     
     def get_network_stats(self) -> Dict[str, Any]:
         """Get network statistics"""
         try:
-            if not self.web3 or not self.web3.is_connected():
+            if not self._ensure_connected():
                 return {}
             
             current_block = self.get_current_block()
@@ -311,7 +688,7 @@ class CustomEVMAdapter(BaseChainAdapter):
             return {
                 'current_block': current_block,
                 'gas_price': gas_price,
-                'gas_price_gwei': self.web3.from_wei(gas_price, 'gwei') if gas_price > 0 else 0,
+                'gas_price_gwei': gas_price / _GWEI if gas_price > 0 else 0,
                 'chain_id': self.chain_id,
                 'connected': True,
                 'block_time': self.block_time,
@@ -3,18 +3,71 @@ Custom Web3 Blockchain Adapter
 Allows dynamic integration of any Web3-compatible blockchain (including non-EVM)
 """
 
-import json
-import requests
-from typing import Dict, List, Optional, Any, Callable
-from .base_chain_adapter import BaseChainAdapter
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+import orjson
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from .base_chain_adapter import BaseChainAdapter, RecordMixin
 from src.utils.logger import logger
 
+# The request body is pre-encoded with orjson, so the content type is set explicitly
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Explorer path segment per URL type for each chain type; other chain types use the generic layout
+_EXPLORER_PATHS = {
+    'substrate': {'tx': 'extrinsic', 'address': 'account', 'block': 'block'},
+    'cosmos': {'tx': 'tx', 'address': 'account', 'block': 'blocks'},
+}
+_GENERIC_EXPLORER_PATHS = {'tx': 'tx', 'address': 'address', 'block': 'block'}
+
+
+@dataclass(slots=True, frozen=True)
+class ChainTxRecord(RecordMixin):
+    """Transaction parsed from a custom Web3 chain's block; slotted, so a large block costs no per-tx dicts"""
+    hash: str
+    from_: str
+    to: str
+    value: str
+    block_number: int
+    transaction_index: int
+    chain_name: str
+    chain_type: str
+
+
+def _cosmos_transfer(tx_data: Dict) -> Tuple[str, str, str]:
+    """Sender, recipient and amount of a Cosmos transaction's first message, read in one walk"""
+    # Nodes send null for empty fields, so fall back on falsy values rather than missing keys
+    msgs = ((tx_data.get('tx') or {}).get('body') or {}).get('messages')
+    if not msgs:
+        return '', '', '0'
+    msg = msgs[0]
+    amount = msg.get('amount')
+    return msg.get('from_address', ''), msg.get('to_address', ''), amount[0].get('amount', '0') if amount else '0'
+
+
+def _build_cosmos_tx(i: int, tx: Dict, block_num: int, chain_name: str) -> ChainTxRecord:
+    """Format the i-th transaction of a Cosmos block"""
+    sender, recipient, amount = _cosmos_transfer(tx)
+    return ChainTxRecord(
+        tx.get('txhash', f"block_{block_num}_tx_{i}"), sender, recipient, amount, block_num, i, chain_name, 'cosmos'
+    )
+
 class CustomWeb3Adapter(BaseChainAdapter):
     """
     Custom Web3 Blockchain Adapter for dynamic blockchain integration
     Supports any Web3-compatible blockchain with custom RPC methods
     """
     
+    TX_COLUMNS = ('hash', 'from', 'to', 'value', 'block_number', 'transaction_index', 'chain_name', 'chain_type')
+    # Entries kept in the read-only RPC response cache before the least recently used is evicted
+    RPC_CACHE_SIZE = 10000
+    # Seconds a block, transaction or receipt response is reused; these don't change once found
+    RPC_CACHE_TTL = 300
+    
     def __init__(self, chain_config: Dict[str, Any]):
         """
         Initialize custom Web3 adapter with dynamic configuration
@@ -30,12 +83,16 @@ class CustomWeb3Adapter(BaseChainAdapter):
                 - address_format: Address format validation regex
                 - decimals: Native token decimals
                 - block_time: Average block time in seconds
+                - disable_cache: Set True to send every read-only RPC call to the node
         """
         super().__init__(chain_config)
         self.chain_name = chain_config.get('name', 'Custom Web3 Chain')
         self.chain_type = chain_config.get('chain_type', 'custom')
         self.symbol = chain_config.get('symbol', 'CUSTOM')
         self.explorer_url = chain_config.get('explorer_url', '')
+        self._explorer_base = self.explorer_url.rstrip('/')
+        paths = _EXPLORER_PATHS.get(self.chain_type, _GENERIC_EXPLORER_PATHS)
+        self._explorer_prefixes = {url_type: f"{self._explorer_base}/{path}/" for url_type, path in paths.items()}
         self.decimals = chain_config.get('decimals', 18)
         self.block_time = chain_config.get('block_time', 6)  # seconds
         
@@ -50,23 +107,94 @@ class CustomWeb3Adapter(BaseChainAdapter):
         
         # Address format validation
         self.address_format = chain_config.get('address_format', r'^[a-zA-Z0-9]+$')
+        try:
+            self._address_re = re.compile(self.address_format)
+        except re.error as e:
+            logger.log(f"Invalid address_format for {self.chain_name}: {e}")
+            self._address_re = None
         
         # Custom parsers for different response formats
         self.response_parsers = chain_config.get('response_parsers', {})
         
-        # Initialize without web3 for non-EVM chains
+        # chain_type is fixed, so the block and transaction parsers are chosen once here
+        self._block_parser = {
+            'substrate': self._parse_substrate_block,
+            'cosmos': self._parse_cosmos_block,
+        }.get(self.chain_type, self._parse_generic_block)
+        self._details_parser = {
+            'substrate': self._parse_substrate_details,
+            'cosmos': self._parse_cosmos_details,
+        }.get(self.chain_type, self._parse_generic_details)
+        
+        # Read-only responses keyed by (method, params) -> (result, monotonic expiry)
+        self.cache_enabled = not chain_config.get('disable_cache', False)
+        self._rpc_cache = OrderedDict()
+        self._rpc_cache_lock = threading.RLock()
+        # Cache misses being fetched right now, so concurrent duplicates share one POST
+        self._inflight: Dict[Tuple, Future] = {}
+        self._refresh_cache_ttls()
+        
+        # Initialize without web3 for non-EVM chains; calls go over the shared keep-alive session
         self.web3 = None
-        self.session = requests.Session()
-        self.session.headers.update({'Content-Type': 'application/json'})
         
         logger.log(f"Custom Web3 adapter initialized for {self.chain_name} ({self.chain_type})")
     
+    def _refresh_cache_ttls(self):
+        """Map the chain's read-only RPC method names to how long their responses are reused"""
+        ttls = {
+            'get_block': self.RPC_CACHE_TTL,
+            'get_transaction': self.RPC_CACHE_TTL,
+            'get_transaction_receipt': self.RPC_CACHE_TTL,
+            # State that moves with the chain is only reused within a block
+            'get_balance': self.block_time,
+            'get_block_number': self.block_time * 0.5,
+        }
+        self._cache_ttls = {self.rpc_methods[name]: ttl for name, ttl in ttls.items() if name in self.rpc_methods}
+    
     def _make_rpc_call(self, method: str, params: List = None) -> Optional[Dict]:
-        """Make a custom RPC call"""
+        """Make a custom RPC call, reusing recent responses of read-only methods"""
+        if params is None:
+            params = []
+        
+        ttl = self._cache_ttls.get(method) if self.cache_enabled else None
+        if ttl is None:
+            return self._post_rpc_call(method, params)
+        
+        key = (method, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+        with self._rpc_cache_lock:
+            entry = self._rpc_cache.get(key)
+            if entry and time.monotonic() < entry[1]:
+                self._rpc_cache.move_to_end(key)
+                return entry[0]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            result = self._post_rpc_call(method, params)
+        except BaseException as e:
+            with self._rpc_cache_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._rpc_cache_lock:
+            # Misses and errors are not cached, so a pending transaction is looked up again next time
+            if result is not None:
+                self._rpc_cache[key] = (result, time.monotonic() + ttl)
+                self._rpc_cache.move_to_end(key)
+                if len(self._rpc_cache) > self.RPC_CACHE_SIZE:
+                    self._rpc_cache.popitem(last=False)
+            del self._inflight[key]
+        future.set_result(result)
+        return result
+    
+    def _post_rpc_call(self, method: str, params: List) -> Optional[Dict]:
+        """POST a single JSON-RPC call"""
         try:
-            if params is None:
-                params = []
-            
             payload = {
                 'jsonrpc': '2.0',
                 'method': method,
@@ -74,10 +202,14 @@ class CustomWeb3Adapter(BaseChainAdapter):
                 'id': 1
             }
             
-            response = self.session.post(self.rpc_url, json=payload, timeout=30)
+            # Connections come from the shared keep-alive pool; a short connect timeout
+            # fails fast on an unreachable node while slow responses get the full read timeout
+            response = self._session.post(
+                self.rpc_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=(3, 30)
+            )
             response.raise_for_status()
             
-            data = response.json()
+            data = orjson.loads(response.content)
             if 'error' in data:
                 logger.log(f"RPC error for {self.chain_name}: {data['error']}")
                 return None
@@ -122,34 +254,28 @@ class CustomWeb3Adapter(BaseChainAdapter):
                 # Direct integer response
                 block_number = int(result)
             
-            logger.log(f"{self.chain_name} current block: {block_number}")
+            logger.log("%s current block: %s", self.chain_name, block_number, level='debug')
             return block_number
             
         except Exception as e:
             logger.log(f"Error getting current block for {self.chain_name}: {e}")
             return 0
     
-    def get_transactions(self, start_block: int, end_block: int) -> List[Dict]:
+    def get_transactions(self, start_block: int, end_block: int) -> List[ChainTxRecord]:
         """Get transactions in block range using custom RPC methods"""
         try:
             transactions = []
             method = self.rpc_methods.get('get_block', 'chain_getBlock')
+            block_nums = range(start_block, end_block + 1)
             
-            for block_num in range(start_block, min(end_block + 1, start_block + 5)):
-                try:
-                    # Get block with transactions
-                    block_result = self._make_rpc_call(method, [block_num, True])
-                    
-                    if not block_result:
-                        continue
-                    
-                    # Parse block based on chain type
-                    block_txs = self._parse_block_transactions(block_result, block_num)
-                    transactions.extend(block_txs)
-                    
-                except Exception as e:
-                    logger.log(f"Error processing block {block_num} on {self.chain_name}: {e}")
+            # All blocks go out as JSON-RPC batch POSTs of batch_size calls instead of one round trip each
+            blocks = self._rpc_batch([(method, [block_num, True]) for block_num in block_nums])
+            for block_num, block_result in zip(block_nums, blocks):
+                if not block_result:
                     continue
+                
+                # Parse block based on chain type
+                transactions.extend(self._parse_block_transactions(block_result, block_num))
             
             return transactions
             
@@ -157,64 +283,43 @@ class CustomWeb3Adapter(BaseChainAdapter):
             logger.log(f"Error getting transactions for {self.chain_name}: {e}")
             return []
     
-    def _parse_block_transactions(self, block_data: Dict, block_num: int) -> List[Dict]:
+    def _parse_block_transactions(self, block_data: Dict, block_num: int) -> List[ChainTxRecord]:
         """Parse transactions from block data based on chain type"""
-        transactions = []
-        
         try:
-            # Handle different block formats
-            if self.chain_type == 'substrate':
-                # Substrate/Polkadot format
-                extrinsics = block_data.get('block', {}).get('extrinsics', [])
-                for i, ext in enumerate(extrinsics):
-                    tx_data = {
-                        'hash': ext.get('hash', f"block_{block_num}_tx_{i}"),
-                        'from': ext.get('signer', ''),
-                        'to': self._extract_destination(ext),
-                        'value': self._extract_value(ext),
-                        'block_number': block_num,
-                        'transaction_index': i,
-                        'chain_name': self.chain_name,
-                        'chain_type': self.chain_type
-                    }
-                    transactions.append(tx_data)
-                    
-            elif self.chain_type == 'cosmos':
-                # Cosmos format
-                txs = block_data.get('block', {}).get('data', {}).get('txs', [])
-                for i, tx in enumerate(txs):
-                    tx_data = {
-                        'hash': tx.get('txhash', f"block_{block_num}_tx_{i}"),
-                        'from': self._extract_cosmos_sender(tx),
-                        'to': self._extract_cosmos_recipient(tx),
-                        'value': self._extract_cosmos_amount(tx),
-                        'block_number': block_num,
-                        'transaction_index': i,
-                        'chain_name': self.chain_name,
-                        'chain_type': self.chain_type
-                    }
-                    transactions.append(tx_data)
-                    
-            else:
-                # Generic format
-                txs = block_data.get('transactions', block_data.get('txs', []))
-                for i, tx in enumerate(txs):
-                    tx_data = {
-                        'hash': tx.get('hash', tx.get('txid', f"block_{block_num}_tx_{i}")),
-                        'from': tx.get('from', tx.get('sender', '')),
-                        'to': tx.get('to', tx.get('recipient', '')),
-                        'value': str(tx.get('value', tx.get('amount', 0))),
-                        'block_number': block_num,
-                        'transaction_index': i,
-                        'chain_name': self.chain_name,
-                        'chain_type': self.chain_type
-                    }
-                    transactions.append(tx_data)
-            
+            return self._block_parser(block_data, block_num)
         except Exception as e:
             logger.log(f"Error parsing block transactions for {self.chain_name}: {e}")
-        
-        return transactions
+            return []
+    
+    def _parse_substrate_block(self, block_data: Dict, block_num: int) -> List[ChainTxRecord]:
+        """Substrate/Polkadot blocks list their extrinsics"""
+        extrinsics = block_data.get('block', {}).get('extrinsics', [])
+        return [
+            ChainTxRecord(
+                ext.get('hash', f"block_{block_num}_tx_{i}"), ext.get('signer', ''),
+                self._extract_destination(ext), self._extract_value(ext),
+                block_num, i, self.chain_name, self.chain_type
+            )
+            for i, ext in enumerate(extrinsics)
+        ]
+    
+    def _parse_cosmos_block(self, block_data: Dict, block_num: int) -> List[ChainTxRecord]:
+        """Cosmos blocks carry their transactions under block.data.txs"""
+        txs = block_data.get('block', {}).get('data', {}).get('txs', [])
+        chain_name = self.chain_name
+        return [_build_cosmos_tx(i, tx, block_num, chain_name) for i, tx in enumerate(txs)]
+    
+    def _parse_generic_block(self, block_data: Dict, block_num: int) -> List[ChainTxRecord]:
+        """Generic blocks with a transactions or txs list"""
+        txs = block_data.get('transactions', block_data.get('txs', []))
+        return [
+            ChainTxRecord(
+                tx.get('hash', tx.get('txid', f"block_{block_num}_tx_{i}")),
+                tx.get('from', tx.get('sender', '')), tx.get('to', tx.get('recipient', '')),
+                str(tx.get('value', tx.get('amount', 0))), block_num, i, self.chain_name, self.chain_type
+            )
+            for i, tx in enumerate(txs)
+        ]
     
     def get_transaction_details(self, tx_hash: str) -> Optional[Dict]:
         """Get detailed transaction information"""
@@ -235,43 +340,48 @@ class CustomWeb3Adapter(BaseChainAdapter):
     def _parse_transaction_details(self, tx_data: Dict, tx_hash: str) -> Dict:
         """Parse transaction details based on chain type"""
         try:
-            if self.chain_type == 'substrate':
-                return {
-                    'hash': tx_hash,
-                    'from': tx_data.get('signer', ''),
-                    'to': self._extract_destination(tx_data),
-                    'value': self._extract_value(tx_data),
-                    'block_number': tx_data.get('blockNumber', 0),
-                    'status': 'success' if tx_data.get('success', True) else 'failed',
-                    'chain_name': self.chain_name,
-                    'chain_type': self.chain_type
-                }
-            elif self.chain_type == 'cosmos':
-                return {
-                    'hash': tx_hash,
-                    'from': self._extract_cosmos_sender(tx_data),
-                    'to': self._extract_cosmos_recipient(tx_data),
-                    'value': self._extract_cosmos_amount(tx_data),
-                    'block_number': tx_data.get('height', 0),
-                    'status': 'success' if tx_data.get('code', 0) == 0 else 'failed',
-                    'chain_name': self.chain_name,
-                    'chain_type': self.chain_type
-                }
-            else:
-                return {
-                    'hash': tx_hash,
-                    'from': tx_data.get('from', tx_data.get('sender', '')),
-                    'to': tx_data.get('to', tx_data.get('recipient', '')),
-                    'value': str(tx_data.get('value', tx_data.get('amount', 0))),
-                    'block_number': tx_data.get('blockNumber', tx_data.get('height', 0)),
-                    'status': tx_data.get('status', 'unknown'),
-                    'chain_name': self.chain_name,
-                    'chain_type': self.chain_type
-                }
+            return self._details_parser(tx_data, tx_hash)
         except Exception as e:
             logger.log(f"Error parsing transaction details for {self.chain_name}: {e}")
             return {'hash': tx_hash, 'error': str(e)}
     
+    def _parse_substrate_details(self, tx_data: Dict, tx_hash: str) -> Dict:
+        return {
+            'hash': tx_hash,
+            'from': tx_data.get('signer', ''),
+            'to': self._extract_destination(tx_data),
+            'value': self._extract_value(tx_data),
+            'block_number': tx_data.get('blockNumber', 0),
+            'status': 'success' if tx_data.get('success', True) else 'failed',
+            'chain_name': self.chain_name,
+            'chain_type': self.chain_type
+        }
+    
+    def _parse_cosmos_details(self, tx_data: Dict, tx_hash: str) -> Dict:
+        sender, recipient, amount = _cosmos_transfer(tx_data)
+        return {
+            'hash': tx_hash,
+            'from': sender,
+            'to': recipient,
+            'value': amount,
+            'block_number': tx_data.get('height', 0),
+            'status': 'success' if tx_data.get('code', 0) == 0 else 'failed',
+            'chain_name': self.chain_name,
+            'chain_type': self.chain_type
+        }
+    
+    def _parse_generic_details(self, tx_data: Dict, tx_hash: str) -> Dict:
+        return {
+            'hash': tx_hash,
+            'from': tx_data.get('from', tx_data.get('sender', '')),
+            'to': tx_data.get('to', tx_data.get('recipient', '')),
+            'value': str(tx_data.get('value', tx_data.get('amount', 0))),
+            'block_number': tx_data.get('blockNumber', tx_data.get('height', 0)),
+            'status': tx_data.get('status', 'unknown'),
+            'chain_name': self.chain_name,
+            'chain_type': self.chain_type
+        }
+    
     def get_balance(self, address: str) -> float:
         """Get native token balance"""
         try:
@@ -299,44 +409,19 @@ class CustomWeb3Adapter(BaseChainAdapter):
     
     def validate_address(self, address: str) -> bool:
         """Validate address format"""
-        import re
+        if self._address_re is None:
+            return False
         try:
-            return bool(re.match(self.address_format, address))
-        except Exception:
+            return bool(self._address_re.match(address))
+        except TypeError:
             return False
     
     def get_explorer_url(self, url_type: str, identifier: str) -> str:
         """Get explorer URL for transaction, address, or block"""
         if not self.explorer_url:
             return ""
-        
-        base_url = self.explorer_url.rstrip('/')
-        
-        # Handle different explorer URL formats
-        if self.chain_type == 'substrate':
-            if url_type == 'tx':
-                return f"{base_url}/extrinsic/{identifier}"
-            elif url_type == 'address':
-                return f"{base_url}/account/{identifier}"
-            elif url_type == 'block':
-                return f"{base_url}/block/{identifier}"
-        elif self.chain_type == 'cosmos':
-            if url_type == 'tx':
-                return f"{base_url}/tx/{identifier}"
-            elif url_type == 'address':
-                return f"{base_url}/account/{identifier}"
-            elif url_type == 'block':
-                return f"{base_url}/blocks/{identifier}"
-        else:
-            # Generic format
-            if url_type == 'tx':
-                return f"{base_url}/tx/{identifier}"
-            elif url_type == 'address':
-                return f"{base_url}/address/{identifier}"
-            elif url_type == 'block':
-                return f"{base_url}/block/{identifier}"
-        
-        return base_url
+        prefix = self._explorer_prefixes.get(url_type)
+        return f"{prefix}{identifier}" if prefix else self._explorer_base
     
     def _extract_destination(self, tx_data: Dict) -> str:
         """Extract destination address from transaction data"""
@@ -355,37 +440,17 @@ class CustomWeb3Adapter(BaseChainAdapter):
             return str(args.get('value', args.get('amount', 0)))
         return '0'
     
-    def _extract_cosmos_sender(self, tx_data: Dict) -> str:
-        """Extract sender from Cosmos transaction"""
-        msgs = tx_data.get('tx', {}).get('body', {}).get('messages', [])
-        if msgs:
-            return msgs[0].get('from_address', '')
-        return ''
-    
-    def _extract_cosmos_recipient(self, tx_data: Dict) -> str:
-        """Extract recipient from Cosmos transaction"""
-        msgs = tx_data.get('tx', {}).get('body', {}).get('messages', [])
-        if msgs:
-            return msgs[0].get('to_address', '')
-        return ''
-    
-    def _extract_cosmos_amount(self, tx_data: Dict) -> str:
-        """Extract amount from Cosmos transaction"""
-        msgs = tx_data.get('tx', {}).get('body', {}).get('messages', [])
-        if msgs:
-            amount = msgs[0].get('amount', [])
-            if amount:
-                return amount[0].get('amount', '0')
-        return '0'
-    
     def update_rpc_url(self, new_rpc_url: str):
         """Update RPC URL"""
         self.rpc_url = new_rpc_url
+        with self._rpc_cache_lock:
+            self._rpc_cache.clear()
         logger.log(f"Updated RPC URL for {self.chain_name}: {new_rpc_url}")
     
     def add_custom_method(self, method_name: str, rpc_method: str):
         """Add custom RPC method mapping"""
         self.rpc_methods[method_name] = rpc_method
+        self._refresh_cache_ttls()
         logger.log(f"Added custom method {method_name} -> {rpc_method} for {self.chain_name}")
     
     def get_network_info(self) -> Dict[str, Any]:
@@ -1,18 +1,23 @@
 from web3 import Web3
 from typing import List, Dict, Any
-from .base_chain_adapter import BaseChainAdapter
+from .base_chain_adapter import BaseChainAdapter, Tx
+from .evm_adapter import EVMAdapter
 from src.utils.logger import logger
+from src.infrastructure.rpc_client import OrjsonHTTPProvider, rpc_session
 
 
-class EthereumAdapter(BaseChainAdapter):
-    """Ethereum blockchain adapter"""
+class EthereumAdapter(EVMAdapter):
+    """Ethereum blockchain adapter; formats transactions like every other EVM chain"""
     
     def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
+        # EVMAdapter.__init__ raises on an unreachable RPC; Ethereum starts anyway and reports it per call
+        BaseChainAdapter.__init__(self, config)
+        # Set False for providers that serialize or reject JSON-RPC batches
+        self.batch_rpc = config.get('batch_rpc', True)
         self.w3 = None
         self.connection_error = None
         try:
-            self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            self.w3 = Web3(OrjsonHTTPProvider(self.rpc_url, session=rpc_session))
             if not self.w3.is_connected():
                 self.connection_error = f"Failed to connect to Ethereum RPC: {self.rpc_url}"
                 logger.log(f"Warning: {self.connection_error}")
@@ -27,13 +32,9 @@ class EthereumAdapter(BaseChainAdapter):
         if self.connection_error or not self.w3:
             logger.log(f"Cannot get current block: {self.connection_error}")
             return 0
-        try:
-            return self.w3.eth.block_number
-        except Exception as e:
-            logger.log(f"Error getting current block: {e}")
-            return 0
+        return super().get_current_block()
     
-    def get_transactions(self, start_block: int, end_block: int) -> List[Dict[str, Any]]:
+    def get_transactions(self, start_block: int, end_block: int) -> List[Tx]:
         """Get transactions between block range"""
         if self.connection_error or not self.w3:
             logger.log(f"Cannot get transactions: {self.connection_error}")
@@ -41,37 +42,27 @@ class EthereumAdapter(BaseChainAdapter):
         
         transactions = []
         try:
-            for block_num in range(start_block, end_block + 1):
-                block = self.w3.eth.get_block(block_num, full_transactions=True)
-                for tx in block.transactions:
-                    formatted_tx = self._format_ethereum_transaction(tx)
-                    transactions.append(formatted_tx)
+            block_nums = range(start_block, end_block + 1)
+            per_block = {}
+            if self.batch_rpc:
+                # One eth_getBlockByNumber batch POST per batch_size blocks
+                blocks = self._rpc_batch([("eth_getBlockByNumber", [hex(n), True]) for n in block_nums])
+                per_block = {n: self._format_block(block) for n, block in zip(block_nums, blocks) if block}
+            # Blocks the batch didn't return are fetched in parallel, bounded by fetch_workers
+            missing = [n for n in block_nums if n not in per_block]
+            per_block.update(zip(missing, self._fetch_concurrently(self._get_block_transactions, missing)))
+            for n in block_nums:
+                transactions.extend(per_block[n])
         except Exception as e:
             logger.log(f"Error getting transactions: {e}")
         
         return transactions
     
-    def get_transaction_details(self, tx_hash: str) -> Dict[str, Any]:
-        """Get detailed transaction information"""
+    def _get_block_transactions(self, block_num: int) -> List[Tx]:
+        """Fetch one block and format its transactions; a failed block is logged and skipped"""
         try:
-            tx = self.w3.eth.get_transaction(tx_hash)
-            return self._format_ethereum_transaction(tx)
+            block = self.w3.eth.get_block(block_num, full_transactions=True)
         except Exception as e:
-            logger.log(f"Error getting transaction details: {e}")
-            return {}
-    
-    def _format_ethereum_transaction(self, tx) -> Dict[str, Any]:
-        """Format Ethereum transaction to standard format"""
-        try:
-            return {
-                'hash': tx['hash'].hex() if hasattr(tx['hash'], 'hex') else str(tx['hash']),
-                'to': tx.get('to', ''),
-                'from': tx.get('from', ''),
-                'value': float(self.w3.from_wei(tx.get('value', 0), 'ether')),
-                'currency': self._detect_token_currency(tx),
-                'block': tx.get('blockNumber', 0),
-                'timestamp': 0  # Would need to get from block
-            }
-        except Exception as e:
-            logger.log(f"Error formatting transaction: {e}")
-            return {}
\ No newline at end of file
+            logger.log(f"Error getting block {block_num}: {e}")
+            return []
+        return self._format_block(block)
@@ -0,0 +1,95 @@
+from web3 import Web3
+from typing import List, Dict, Any, Optional
+from .base_chain_adapter import BaseChainAdapter, Tx
+from src.core.blockchain.wallet_cache import address_key
+from src.utils.logger import logger
+from src.infrastructure.rpc_client import OrjsonHTTPProvider, rpc_session
+
+_WEI = 10 ** 18  # wei per native coin
+
+
+class EVMAdapter(BaseChainAdapter):
+    """
+    Adapter for EVM-compatible chains that need no chain-specific handling.
+    
+    BSC, Polygon, Avalanche, Arbitrum, Optimism, Fantom, PulseChain and Base
+    differ only in RPC URL, native token and token contracts, all of which
+    come from the chain's entry in blockchains.json.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        try:
+            self.w3 = Web3(OrjsonHTTPProvider(self.rpc_url, session=rpc_session))
+            if not self.w3.is_connected():
+                raise ConnectionError(f"Failed to connect to {self.chain_name} RPC: {self.rpc_url}")
+        except Exception as e:
+            logger.log(f"Error initializing {self.chain_name} adapter: {e}")
+            raise
+    
+    def get_current_block(self) -> int:
+        """Get the current block number"""
+        try:
+            return self.w3.eth.block_number
+        except Exception as e:
+            logger.log(f"Error getting current block: {e}")
+            return 0
+    
+    def get_transactions(self, start_block: int, end_block: int) -> List[Tx]:
+        """Get transactions between block range"""
+        transactions = []
+        try:
+            for block in self._get_blocks_batched(start_block, end_block):
+                transactions.extend(self._format_block(block))
+        except Exception as e:
+            logger.log(f"Error getting transactions: {e}")
+        
+        return transactions
+    
+    def get_transaction_details(self, tx_hash: str) -> Dict[str, Any]:
+        """Get detailed transaction information"""
+        try:
+            tx = self.w3.eth.get_transaction(tx_hash)
+            formatted_tx = self._format_ethereum_transaction(tx)
+            return formatted_tx.to_dict() if formatted_tx else {}
+        except Exception as e:
+            logger.log(f"Error getting transaction details: {e}")
+            return {}
+    
+    def _format_block(self, block) -> List[Tx]:
+        """Format the transactions of a web3 block or a raw JSON-RPC block"""
+        return self._format_transactions(block.get('transactions') or [])
+    
+    def _format_transactions(self, txs: List[Dict[str, Any]]) -> List[Tx]:
+        """Format web3 or raw JSON-RPC transactions in one pass"""
+        token_map, native, key, to_int = self._token_map, self.native_token, address_key, self._hex_to_int
+        hash_hex = self._hash_hex
+        try:
+            return [
+                Tx(
+                    hash_hex(t['hash']), t.get('to', ''), t.get('from', ''), to_int(t.get('value', 0)) / _WEI,
+                    token_map.get(key(t.get('to')), native) if token_map else native,
+                    to_int(t.get('blockNumber', 0))
+                )
+                for t in txs
+            ]
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            # Fall back to the per-transaction path, which skips only the malformed entries
+            logger.log(f"Error formatting transaction batch, retrying one by one: {e}")
+            return [tx for tx in map(self._format_ethereum_transaction, txs) if tx]
+    
+    def _format_ethereum_transaction(self, tx) -> Optional[Tx]:
+        """Format EVM transaction to standard format"""
+        try:
+            return Tx(
+                hash=self._hash_hex(tx['hash']),
+                to=tx.get('to', ''),
+                from_=tx.get('from', ''),
+                value=self._hex_to_int(tx.get('value', 0)) / _WEI,
+                currency=self._detect_token_currency(tx),
+                block=self._hex_to_int(tx.get('blockNumber', 0)),
+                timestamp=0
+            )
+        except Exception as e:
+            logger.log(f"Error formatting transaction: {e}")
+            return None
\ No newline at end of file
@@ -1,44 +1,10 @@
-from typing import List, Dict, Any
-from .base_chain_adapter import BaseChainAdapter
-from src.utils.logger import logger
+from typing import Dict, Any
+from .cosmos_adapter import CosmosAdapter
 
 
-class OsmosisAdapter(BaseChainAdapter):
-    """Osmosis blockchain adapter"""
+class OsmosisAdapter(CosmosAdapter):
+    """Osmosis blockchain adapter; Osmosis is a Cosmos SDK chain, so it reads the same LCD REST API"""
     
     def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        try:
-            # Osmosis client initialization would go here
-            pass
-        except Exception as e:
-            logger.log(f"Error initializing Osmosis adapter: {e}")
-            raise
-    
-    def get_current_block(self) -> int:
-        """Get the current block number"""
-        try:
-            # Osmosis specific implementation
-            return 0  # Placeholder
-        except Exception as e:
-            logger.log(f"Error getting current block: {e}")
-            return 0
-    
-    def get_transactions(self, start_block: int, end_block: int) -> List[Dict[str, Any]]:
-        """Get transactions between block range"""
-        transactions = []
-        try:
-            # Osmosis transaction fetching logic would go here
-            pass
-        except Exception as e:
-            logger.log(f"Error getting transactions: {e}")
-        return transactions
-    
-    def get_transaction_details(self, tx_hash: str) -> Dict[str, Any]:
-        """Get detailed transaction information"""
-        try:
-            # Osmosis transaction details logic
-            return {}  # Placeholder
-        except Exception as e:
-            logger.log(f"Error getting transaction details: {e}")
-            return {}
+        # OSMO is denominated in uosmo; IBC assets can be mapped through 'denoms'
+        super().__init__({'native_token': 'OSMO', **config})
@@ -5,90 +5,118 @@ Extends adapters with token-specific functionality
 
 import asyncio
 import json
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from web3 import Web3
+from eth_abi import decode
+from eth_utils import event_signature_to_log_topic, function_signature_to_4byte_selector
 from web3.exceptions import ContractLogicError
 
 from src.utils.logger import get_logger
 from src.core.tracking.models import Transaction, TransactionType
+from src.infrastructure.multicall import Multicall
+from src.utils.address import checksum_address
+from src.core.blockchain.wallet_cache import address_key
 
 logger = get_logger(__name__)
 
+ERC20_SELECTORS = {
+    field: function_signature_to_4byte_selector(f'{field}()')
+    for field in ('name', 'symbol', 'decimals', 'totalSupply')
+}
+ERC20_RETURN_TYPES = {'name': 'string', 'symbol': 'string', 'decimals': 'uint8', 'totalSupply': 'uint256'}
+
+# ABIs are parsed by web3 when a contract class is built, so they are defined once
+# here and each adapter keeps the resulting classes (see _erc20_contract)
+ERC20_INFO_ABI = [
+    {"constant": True, "inputs": [], "name": field, "outputs": [{"name": "", "type": ERC20_RETURN_TYPES[field]}],
+     "type": "function"}
+    for field in ('name', 'symbol', 'decimals', 'totalSupply')
+]
+
+# topic0 of Transfer(address,address,uint256), shared by ERC20 and ERC721
+ERC20_TRANSFER_TOPIC = '0x' + event_signature_to_log_topic('Transfer(address,address,uint256)').hex()
+
+# Known DEX router addresses (this would be expanded), keyed by address_key so
+# checksummed and lowercase forms match with one dict lookup
+_DEX_NAMES = {
+    address_key(address): name for address, name in (
+        ('0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D', 'Uniswap V2'),
+        ('0xE592427A0AEce92De3Edee1F18E0157C05861564', 'Uniswap V3'),
+        ('0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F', 'SushiSwap'),
+        ('0x10ED43C718714eb63d5aA57B78B54704E256024E', 'PancakeSwap'),
+    )
+}
+
+
 class TokenMethodsMixin:
     """Mixin class to add token tracking methods to blockchain adapters"""
     
+    # Token metadata entries kept per adapter before the least recently used is evicted
+    TOKEN_INFO_CACHE_SIZE = 4096
+    # Seconds token metadata is reused; override per chain with the 'token_info_ttl' config key
+    TOKEN_INFO_TTL = 3600
+    
     async def get_token_info(self, token_address: str) -> Optional[Dict]:
-        """Get basic token information"""
+        """Get basic token information, reusing recent lookups of the same token"""
+        key = address_key(token_address)
+        cache = self._token_info_cache
+        entry = cache.get(key)
+        if entry and time.monotonic() < entry[1]:
+            cache.move_to_end(key)
+            return dict(entry[0])  # Callers may add fields to the dict they get back
+        
         try:
             if hasattr(self, 'web3') and self.web3:
-                return await self._get_erc20_token_info(token_address)
+                info = await self._get_erc20_token_info(token_address)
             else:
-                return await self._get_generic_token_info(token_address)
+                info = await self._get_generic_token_info(token_address)
         except Exception as e:
             logger.error(f"Error getting token info for {token_address}: {e}")
             return None
+        
+        # Failed lookups are not cached, so a flaky RPC is retried next time
+        if info:
+            ttl = getattr(self, 'config', {}).get('token_info_ttl', self.TOKEN_INFO_TTL)
+            cache[key] = (dict(info), time.monotonic() + ttl)
+            cache.move_to_end(key)
+            if len(cache) > self.TOKEN_INFO_CACHE_SIZE:
+                cache.popitem(last=False)
+        return info
+    
+    @property
+    def _token_info_cache(self) -> OrderedDict:
+        """Per-adapter LRU of token address key -> (info, monotonic expiry)"""
+        if not hasattr(self, '_token_infos'):
+            self._token_infos = OrderedDict()
+        return self._token_infos
     
     async def _get_erc20_token_info(self, token_address: str) -> Optional[Dict]:
         """Get ERC20 token information using Web3"""
         try:
-            # ERC20 ABI for basic functions
-            erc20_abi = [
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "name",
-                    "outputs": [{"name": "", "type": "string"}],
-                    "type": "function"
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "symbol",
-                    "outputs": [{"name": "", "type": "string"}],
-                    "type": "function"
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "decimals",
-                    "outputs": [{"name": "", "type": "uint8"}],
-                    "type": "function"
-                },
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "totalSupply",
-                    "outputs": [{"name": "", "type": "uint256"}],
-                    "type": "function"
+            # Read all four fields in one eth_call; fall back to individual
+            # calls, issued concurrently, on chains without a Multicall3 deployment
+            fields = self._multicall_token_fields(token_address)
+            if fields is None:
+                contract = self._erc20_contract(token_address, 'info', ERC20_INFO_ABI)
+                values = await asyncio.gather(
+                    *(asyncio.to_thread(getattr(contract.functions, field)().call) for field in ERC20_SELECTORS),
+                    return_exceptions=True
+                )
+                fields = {
+                    field: None if isinstance(value, Exception) else value
+                    for field, value in zip(ERC20_SELECTORS, values)
                 }
-            ]
-            
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=erc20_abi
-            )
             
-            # Get token information
-            try:
-                name = contract.functions.name().call()
-            except:
-                name = "Unknown Token"
+            name = fields['name'] or "Unknown Token"
+            symbol = fields['symbol'] or "UNKNOWN"
+            decimals = fields['decimals'] if fields['decimals'] is not None else 18
+            total_supply = fields['totalSupply']
             
-            try:
-                symbol = contract.functions.symbol().call()
-            except:
-                symbol = "UNKNOWN"
-            
-            try:
-                decimals = contract.functions.decimals().call()
-            except:
-                decimals = 18
-            
-            try:
-                total_supply = contract.functions.totalSupply().call()
-            except:
-                total_supply = None
+            # decimals() is immutable, so it only ever needs to be read once
+            if fields['decimals'] is not None:
+                self._decimals_cache[address_key(token_address)] = decimals
             
             return {
                 'name': name,
@@ -103,6 +131,48 @@ class TokenMethodsMixin:
             logger.error(f"Error getting ERC20 token info: {e}")
             return None
     
+    @property
+    def _decimals_cache(self) -> Dict[Any, int]:
+        """Per-adapter cache of token decimals, keyed by address_key like the other token caches"""
+        if not hasattr(self, '_token_decimals'):
+            self._token_decimals = {}
+        return self._token_decimals
+    
+    def _erc20_contract(self, token_address: str, kind: str, abi: List[Dict[str, Any]]):
+        """Bind a token address to a contract class built once per ABI and Web3 connection"""
+        if not hasattr(self, '_erc20_factories'):
+            self._erc20_factories = {}
+        factories = self._erc20_factories
+        web3, factory = factories.get(kind, (None, None))
+        if web3 is not self.web3:
+            # A reconnect replaces self.web3, and classes are bound to the old instance
+            web3, factory = self.web3, self.web3.eth.contract(abi=abi)
+            factories[kind] = (web3, factory)
+        return factory(address=checksum_address(token_address))
+    
+    def _multicall_token_fields(self, token_address: str) -> Optional[Dict[str, Any]]:
+        """Read name/symbol/decimals/totalSupply through Multicall3, or None if unavailable"""
+        cached_decimals = self._decimals_cache.get(address_key(token_address))
+        fields = [(field, ERC20_SELECTORS[field]) for field in ('name', 'symbol', 'totalSupply')]
+        if cached_decimals is None:
+            fields.append(('decimals', ERC20_SELECTORS['decimals']))
+        
+        try:
+            results = Multicall(self.web3).try_aggregate(
+                [(token_address, selector) for _, selector in fields]
+            )
+        except Exception as e:
+            logger.debug(f"Multicall unavailable for {token_address}: {e}")
+            return None
+        
+        decoded = {'decimals': cached_decimals}
+        for (field, _), data in zip(fields, results):
+            try:
+                decoded[field] = decode([ERC20_RETURN_TYPES[field]], data)[0] if data else None
+            except Exception:
+                decoded[field] = None
+        return decoded
+    
     async def _get_generic_token_info(self, token_address: str) -> Optional[Dict]:
         """Get generic token information for non-EVM chains"""
         try:
@@ -129,7 +199,7 @@ class TokenMethodsMixin:
             if hasattr(self, 'web3') and self.web3:
                 # Get contract code to verify it's a contract
                 try:
-                    code = self.web3.eth.get_code(Web3.to_checksum_address(token_address))
+                    code = self.web3.eth.get_code(checksum_address(token_address))
                     basic_info['is_contract'] = len(code) > 0
                 except:
                     basic_info['is_contract'] = False
@@ -154,34 +224,33 @@ class TokenMethodsMixin:
     async def _get_erc20_transactions(self, token_address: str, from_block: int) -> List[Transaction]:
         """Get ERC20 token transactions"""
         try:
-            # ERC20 Transfer event ABI
-            transfer_abi = {
-                "anonymous": False,
-                "inputs": [
-                    {"indexed": True, "name": "from", "type": "address"},
-                    {"indexed": True, "name": "to", "type": "address"},
-                    {"indexed": False, "name": "value", "type": "uint256"}
-                ],
-                "name": "Transfer",
-                "type": "event"
-            }
-            
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(token_address),
-                abi=[transfer_abi]
-            )
-            
             # Get latest block
             latest_block = self.web3.eth.block_number
             to_block = min(from_block + 1000, latest_block)  # Limit to 1000 blocks
             
-            # Get transfer events
-            transfer_filter = contract.events.Transfer.create_filter(
-                fromBlock=from_block,
-                toBlock=to_block
-            )
-            
-            events = transfer_filter.get_all_entries()
+            # Get transfer events with one stateless eth_getLogs; installing a node-side
+            # filter costs extra round trips and is disabled on many hosted providers
+            logs = self.web3.eth.get_logs({
+                'fromBlock': from_block,
+                'toBlock': to_block,
+                'address': checksum_address(token_address),
+                'topics': [ERC20_TRANSFER_TOPIC]
+            })
+            # Indexed from/to are the low 20 bytes of topics 1 and 2, and the value is the
+            # uint256 data word; ERC721 logs index a fourth topic and are skipped
+            events = [
+                {
+                    'transactionHash': log['transactionHash'],
+                    'blockNumber': log['blockNumber'],
+                    'args': {
+                        'from': checksum_address('0x' + bytes(log['topics'][1])[-20:].hex()),
+                        'to': checksum_address('0x' + bytes(log['topics'][2])[-20:].hex()),
+                        'value': int.from_bytes(bytes(log['data']), 'big')
+                    }
+                }
+                for log in logs
+                if len(log['topics']) == 3
+            ]
             transactions = []
             
             # Get token info for decimals
@@ -189,17 +258,34 @@ class TokenMethodsMixin:
             decimals = token_info.get('decimals', 18) if token_info else 18
             symbol = token_info.get('symbol', 'UNKNOWN') if token_info else 'UNKNOWN'
             
+            # Receipts, transactions and block headers are fetched once per unique hash and
+            # block in batched POSTs, instead of three sequential calls per event
+            tx_hashes = list(dict.fromkeys(self._hash_hex(event['transactionHash']) for event in events))
+            block_nums = list(dict.fromkeys(event['blockNumber'] for event in events))
+            receipts, tx_by_hash, blocks = await asyncio.to_thread(self._get_event_context, tx_hashes, block_nums)
+            to_int = self._hex_to_int
+            scale = 10 ** decimals
+            # Events of one block share a header, so its timestamp is converted once
+            block_times = {}
+            
             for event in events:
                 try:
-                    # Get transaction details
-                    tx_hash = event['transactionHash'].hex()
-                    tx_receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-                    tx_details = self.web3.eth.get_transaction(tx_hash)
-                    block = self.web3.eth.get_block(event['blockNumber'])
+                    # Get transaction details; anything the batch didn't return is fetched on its
+                    # own and kept, so later events of the same transaction or block reuse it
+                    tx_hash = self._hash_hex(event['transactionHash'])
+                    block_number = event['blockNumber']
+                    if not receipts.get(tx_hash):
+                        receipts[tx_hash] = self.web3.eth.get_transaction_receipt(tx_hash)
+                    if not tx_by_hash.get(tx_hash):
+                        tx_by_hash[tx_hash] = self.web3.eth.get_transaction(tx_hash)
+                    if block_number not in block_times:
+                        block = blocks.get(block_number) or self.web3.eth.get_block(block_number)
+                        block_times[block_number] = datetime.fromtimestamp(to_int(block['timestamp']))
+                    tx_receipt, tx_details = receipts[tx_hash], tx_by_hash[tx_hash]
                     
                     # Calculate amount
                     raw_amount = event['args']['value']
-                    amount = raw_amount / (10 ** decimals)
+                    amount = raw_amount / scale
                     
                     # Determine transaction type
                     from_addr = event['args']['from']
@@ -224,10 +310,10 @@ class TokenMethodsMixin:
                         amount=amount,
                         amount_usd=None,  # Would need price data
                         price=None,
-                        timestamp=datetime.fromtimestamp(block['timestamp']),
-                        block_number=event['blockNumber'],
-                        gas_used=tx_receipt['gasUsed'],
-                        gas_price=tx_details['gasPrice'],
+                        timestamp=block_times[block_number],
+                        block_number=block_number,
+                        gas_used=to_int(tx_receipt['gasUsed']),
+                        gas_price=to_int(tx_details['gasPrice']),
                         is_whale=amount > 100000,  # Simple whale detection
                         dex_name=self._get_dex_name(from_addr, to_addr)
                     )
@@ -244,6 +330,22 @@ class TokenMethodsMixin:
             logger.error(f"Error getting ERC20 transactions: {e}")
             return []
     
+    def _get_event_context(self, tx_hashes: List[str], block_nums: List[int]):
+        """Receipts and transactions by hash, and block headers by number, via batched JSON-RPC"""
+        if not str(getattr(self, 'rpc_url', '')).startswith(('http://', 'https://')):
+            return {}, {}, {}  # Batches are POSTed over HTTP; other transports use the per-event calls
+        n = len(tx_hashes)
+        results = self._rpc_batch(
+            [('eth_getTransactionReceipt', [tx_hash]) for tx_hash in tx_hashes]
+            + [('eth_getTransactionByHash', [tx_hash]) for tx_hash in tx_hashes]
+            + [('eth_getBlockByNumber', [hex(number), False]) for number in block_nums]
+        )
+        return (
+            dict(zip(tx_hashes, results[:n])),
+            dict(zip(tx_hashes, results[n:2 * n])),
+            dict(zip(block_nums, results[2 * n:]))
+        )
+    
     async def _get_generic_token_transactions(self, token_address: str, from_block: int) -> List[Transaction]:
         """Get token transactions for non-EVM chains"""
         try:
@@ -256,34 +358,11 @@ class TokenMethodsMixin:
     
     def _is_dex_address(self, address: str) -> bool:
         """Check if address is a known DEX"""
-        # Known DEX addresses (this would be expanded)
-        dex_addresses = {
-            # Uniswap V2
-            '0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D',
-            # Uniswap V3
-            '0xE592427A0AEce92De3Edee1F18E0157C05861564',
-            # SushiSwap
-            '0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F',
-            # PancakeSwap
-            '0x10ED43C718714eb63d5aA57B78B54704E256024E',
-        }
-        
-        return address.lower() in [addr.lower() for addr in dex_addresses]
+        return address_key(address) in _DEX_NAMES
     
     def _get_dex_name(self, from_addr: str, to_addr: str) -> Optional[str]:
         """Get DEX name from addresses"""
-        dex_mapping = {
-            '0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D': 'Uniswap V2',
-            '0xE592427A0AEce92De3Edee1F18E0157C05861564': 'Uniswap V3',
-            '0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F': 'SushiSwap',
-            '0x10ED43C718714eb63d5aA57B78B54704E256024E': 'PancakeSwap',
-        }
-        
-        for addr in [from_addr, to_addr]:
-            if addr.lower() in [k.lower() for k in dex_mapping.keys()]:
-                return dex_mapping.get(addr)
-        
-        return None
+        return _DEX_NAMES.get(address_key(from_addr)) or _DEX_NAMES.get(address_key(to_addr))
     
     async def discover_tokens(self, limit: int = 100) -> List[Dict]:
         """Discover new tokens on the blockchain"""
@@ -297,44 +376,39 @@ class TokenMethodsMixin:
             return []
     
     async def _discover_erc20_tokens(self, limit: int) -> List[Dict]:
-        """Discover ERC20 tokens by scanning recent blocks"""
+        """Discover ERC20 tokens from the Transfer logs of recent blocks"""
         try:
             discovered_tokens = []
             latest_block = self.web3.eth.block_number
             
-            # Scan last 100 blocks for token transfers
-            for block_num in range(latest_block - 100, latest_block):
-                try:
-                    block = self.web3.eth.get_block(block_num, full_transactions=True)
-                    
-                    for tx in block['transactions']:
-                        try:
-                            # Check if transaction is to a contract
-                            if tx['to']:
-                                code = self.web3.eth.get_code(tx['to'])
-                                if len(code) > 0:  # It's a contract
-                                    # Try to get token info
-                                    token_info = await self.get_token_info(tx['to'])
-                                    if token_info and token_info['symbol'] != 'UNKNOWN':
-                                        token_data = {
-                                            'address': tx['to'],
-                                            'symbol': token_info['symbol'],
-                                            'name': token_info['name'],
-                                            'decimals': token_info['decimals'],
-                                            'verified': True
-                                        }
-                                        
-                                        # Check if already discovered
-                                        if not any(t['address'].lower() == tx['to'].lower() 
-                                                 for t in discovered_tokens):
-                                            discovered_tokens.append(token_data)
-                                            
-                                            if len(discovered_tokens) >= limit:
-                                                return discovered_tokens
-                        except:
-                            continue
-                except:
-                    continue
+            # One eth_getLogs over the last 100 blocks names every contract that emitted a
+            # Transfer, replacing a block fetch per block and a get_code per transaction
+            logs = self.web3.eth.get_logs({
+                'fromBlock': max(latest_block - 100, 0),
+                'toBlock': latest_block,
+                'topics': [ERC20_TRANSFER_TOPIC]
+            })
+            
+            # ERC721 uses the same event signature but also indexes the token id; each
+            # contract is kept once, by address key, in the order it was first seen
+            candidates = {}
+            for log in logs:
+                if len(log['topics']) == 3:
+                    candidates.setdefault(address_key(log['address']), log['address'])
+            
+            # Looked up one at a time so the scan stops as soon as `limit` tokens are found
+            for address in candidates.values():
+                token_info = await self.get_token_info(address)
+                if token_info and token_info['symbol'] != 'UNKNOWN':
+                    discovered_tokens.append({
+                        'address': address,
+                        'symbol': token_info['symbol'],
+                        'name': token_info['name'],
+                        'decimals': token_info['decimals'],
+                        'verified': True
+                    })
+                    if len(discovered_tokens) >= limit:
+                        break
             
             return discovered_tokens
             
@@ -357,7 +431,7 @@ class TokenMethodsMixin:
             if hasattr(self, 'web3') and self.web3:
                 # EVM address validation
                 try:
-                    Web3.to_checksum_address(address)
+                    checksum_address(address)
                     return True
                 except:
                     return False
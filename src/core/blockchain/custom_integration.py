@@ -5,12 +5,13 @@ Handles dynamic addition and management of custom blockchain integrations
 
 import json
 import os
-from typing import Dict, List, Optional, Any, Union
-from .adapters.custom_evm_adapter import CustomEVMAdapter
-from .adapters.custom_web3_adapter import CustomWeb3Adapter
-from .adapters.base_chain_adapter import BaseChainAdapter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from src.utils.logger import logger
 
+if TYPE_CHECKING:
+    from .adapters.base_chain_adapter import BaseChainAdapter
+
 class CustomBlockchainManager:
     """
     Manager for custom blockchain integrations
@@ -19,7 +20,7 @@ class CustomBlockchainManager:
     
     def __init__(self, config_file: str = "config/custom_blockchains.json"):
         self.config_file = config_file
-        self.custom_chains: Dict[str, BaseChainAdapter] = {}
+        self.custom_chains: Dict[str, 'BaseChainAdapter'] = {}
         self.chain_configs: Dict[str, Dict] = {}
         self.load_custom_chains()
     
@@ -34,6 +35,7 @@ class CustomBlockchainManager:
                     self.add_custom_chain(chain_name, config, save=False)
                 
                 logger.log(f"Loaded {len(self.custom_chains)} custom blockchain configurations")
+                self._warm_up_connections()
             else:
                 logger.log("No custom blockchain configuration file found, creating default")
                 self.create_default_config()
@@ -41,6 +43,16 @@ class CustomBlockchainManager:
         except Exception as e:
             logger.log(f"Error loading custom blockchain configurations: {e}")
     
+    def _warm_up_connections(self):
+        """Open adapter connections in parallel in the background instead of one by one on first use"""
+        adapters = [adapter for adapter in self.custom_chains.values() if hasattr(adapter, 'warm_up')]
+        if not adapters:
+            return
+        pool = ThreadPoolExecutor(max_workers=min(8, len(adapters)), thread_name_prefix='chain-warm-up')
+        for adapter in adapters:
+            pool.submit(adapter.warm_up)
+        pool.shutdown(wait=False)
+    
     def create_default_config(self):
         """Create default custom blockchain configuration file"""
         default_config = {
@@ -123,16 +135,23 @@ class CustomBlockchainManager:
             
             chain_type = config.get('type', 'web3').lower()
             
+            # Imported here so loading the manager doesn't pull in the adapter stack
             if chain_type == 'evm':
+                from .adapters.custom_evm_adapter import CustomEVMAdapter
                 adapter = CustomEVMAdapter(config)
             elif chain_type == 'web3':
+                from .adapters.custom_web3_adapter import CustomWeb3Adapter
                 adapter = CustomWeb3Adapter(config)
             else:
                 logger.log(f"Unknown chain type: {chain_type}")
                 return False
             
+            previous = self.custom_chains.get(chain_name)
             self.custom_chains[chain_name] = adapter
             self.chain_configs[chain_name] = config
+            # Re-adding a chain replaces its adapter, whose worker threads are released here
+            if previous is not None and hasattr(previous, 'close'):
+                previous.close()
             
             if save:
                 self.save_configuration()
@@ -148,7 +167,10 @@ class CustomBlockchainManager:
         """Remove a custom blockchain integration"""
         try:
             if chain_name in self.custom_chains:
-                del self.custom_chains[chain_name]
+                adapter = self.custom_chains.pop(chain_name)
+                # Adapters that own worker threads release them here
+                if hasattr(adapter, 'close'):
+                    adapter.close()
             
             if chain_name in self.chain_configs:
                 del self.chain_configs[chain_name]
@@ -163,7 +185,7 @@ class CustomBlockchainManager:
             logger.log(f"Error removing custom chain {chain_name}: {e}")
             return False
     
-    def get_custom_chain(self, chain_name: str) -> Optional[BaseChainAdapter]:
+    def get_custom_chain(self, chain_name: str) -> Optional['BaseChainAdapter']:
         """Get a custom blockchain adapter"""
         return self.custom_chains.get(chain_name)
     
@@ -171,7 +193,7 @@ class CustomBlockchainManager:
         """List all custom blockchain names"""
         return list(self.custom_chains.keys())
     
-    def get_all_custom_chains(self) -> Dict[str, BaseChainAdapter]:
+    def get_all_custom_chains(self) -> Dict[str, 'BaseChainAdapter']:
         """Get all custom blockchain adapters"""
         return self.custom_chains.copy()
     
@@ -1,76 +1,180 @@
 import time
+import asyncio
 from src.infrastructure.database import SupabaseDB
+from src.infrastructure.cache import cache
 from src.core.notification.service import NotificationService
 from src.utils.logger import logger
 from src.core.blockchain.adapters import BlockchainAdapters
+from src.core.blockchain.wallet_cache import address_key, wallet_cache
 from config.settings import settings
 
+LAST_BLOCKS_KEY = 'last_blocks'
+
+
+class BlockchainManager:
+    """Cached lookups over the configured and custom blockchains"""
+    CHAINS_TTL = 300  # seconds between refreshes of the chain list
+
+    def __init__(self):
+        self.adapters = BlockchainAdapters()
+        self._chains = None  # (chains, fetched_at)
+        # Per-instance and bounded by the number of chains; refreshed with the chain list
+        self._explorer_urls = {}
+
+    def get_all_chains(self):
+        """Return the names of all supported blockchains, refreshed every CHAINS_TTL seconds"""
+        now = time.monotonic()
+        if self._chains is None or now - self._chains[1] > self.CHAINS_TTL:
+            self._chains = (self.adapters.get_supported_chains(), now)
+            self._explorer_urls.clear()  # Custom chains may have been added or reconfigured
+        return self._chains[0]
+
+    def get_explorer_url(self, chain_name):
+        """Return the transaction explorer base URL for a blockchain"""
+        url = self._explorer_urls.get(chain_name)
+        if url is None:
+            url = self._explorer_urls[chain_name] = self.adapters.get_explorer_url(chain_name)
+        return url
+
 
 class BlockchainTracker:
+    RATE_CACHE_TTL = 60  # seconds; rates move far slower than the poll loop
+
     def __init__(self):
         self.db = SupabaseDB()
         self.notifier = NotificationService()
-        self.last_blocks = {}
+        # Resume from the persisted cursors so blocks produced while the bot was down are still scanned
+        self.last_blocks = {chain: int(block) for chain, block in cache.get_hash(LAST_BLOCKS_KEY).items()}
+        self._persist_task = None
+        self._loop = None  # The bot's event loop, captured by run()
         self.active = True
         self.adapters = {}  # Cache adapters to avoid repeated instantiation
-        self.tracked_wallets_cache = {}  # Cache for tracked wallets
+        self._manager = BlockchainManager()
+        self._rate_cache = None  # (rate, fetched_at)
+        self._load_message_format()
 
-    def start(self):
+    async def run(self):
+        """Poll the tracked chains on the running event loop until deactivated"""
+        self._loop = asyncio.get_running_loop()
         while self.active:
             try:
-                chains = self.db.execute('blockchains', 'select').data
-                for chain in chains:
-                    self._check_chain(chain['name'])
-                time.sleep(12)
+                chains = self._manager.get_all_chains()
+                # Adapters block, so every chain is polled in its own worker thread and
+                # a cycle takes as long as the slowest RPC, not the sum
+                results = await asyncio.gather(
+                    *(asyncio.to_thread(self._check_chain, chain) for chain in chains),
+                    return_exceptions=True
+                )
+                for chain, result in zip(chains, results):
+                    if isinstance(result, Exception):
+                        logger.log(f"Tracking error on {chain}: {str(result)}", level='error')
+                self._persist_last_blocks()
+                await asyncio.sleep(12)
             except Exception as e:
-                logger.log('error', f"Tracking error: {str(e)}")
-                time.sleep(5)  # Small delay in case of error
+                logger.log(f"Tracking error: {str(e)}", level='error')
+                await asyncio.sleep(5)  # Small delay in case of error
 
     def _check_chain(self, chain_name):
-        current_block = self._get_current_block(chain_name)
+        adapter = self._get_adapter(chain_name)
+        if adapter is None:
+            return  # Unconfigured or failed to initialize; retried on the next cycle
+        current_block = adapter.get_current_block()
         last_block = self.last_blocks.get(chain_name, current_block)
         
-        if current_block > last_block:
-            adapter = self._get_adapter(chain_name)
+        # With no tracked wallets nothing can match, so skip fetching block bodies
+        if current_block > last_block and self._get_tracked_wallets(chain_name):
             transactions = adapter.get_transactions(last_block + 1, current_block)
+            explorer_url = self._manager.get_explorer_url(chain_name)
             
-            for tx in transactions:
-                if self._should_track(tx, chain_name):
-                    self._process_transaction(tx, chain_name)
-            
-            self.last_blocks[chain_name] = current_block
+            for tx in self._filter_tracked(transactions, chain_name):
+                self._process_transaction(tx, chain_name, explorer_url)
+        
+        self.last_blocks[chain_name] = max(current_block, last_block)
+
+    def _persist_last_blocks(self):
+        """Write the block cursors to the cache in the background so polling never waits on it"""
+        if self._persist_task and not self._persist_task.done():
+            return  # The previous write is still running; the next cycle catches up
+        snapshot = dict(self.last_blocks)
+        self._persist_task = asyncio.create_task(
+            asyncio.to_thread(cache.set_hash, LAST_BLOCKS_KEY, snapshot)
+        )
 
     def _get_adapter(self, chain_name):
         """Get the appropriate adapter for the blockchain"""
-        if chain_name not in self.adapters:
-            self.adapters[chain_name] = BlockchainAdapters.get_adapter(chain_name)
-        return self.adapters[chain_name]
+        adapter = self.adapters.get(chain_name)
+        if adapter is None:
+            adapter = self._manager.adapters.get_adapter(chain_name)
+            if adapter is not None:
+                self.adapters[chain_name] = adapter
+        return adapter
 
-    def _get_current_block(self, chain_name):
-        """Method to fetch the current block from the blockchain"""
-        adapter = self._get_adapter(chain_name)
-        return adapter.get_current_block()
+    def _filter_tracked(self, transactions, chain_name):
+        """Return the transactions that should be tracked, filtering the whole batch at once"""
+        wallets = self._get_tracked_wallets(chain_name)
+        # A single set intersection rules out batches with no tracked recipient
+        # before any per-transaction work happens
+        keys = [address_key(tx['to']) for tx in transactions]
+        hit_wallets = wallets.intersection(keys)
+        if not hit_wallets:
+            return []
+        return [
+            tx for tx, key in zip(transactions, keys)
+            if key in hit_wallets and tx['currency'] in settings.TRACKED_CURRENCIES
+        ]
 
     def _should_track(self, tx, chain_name):
         """Determine if a transaction should be tracked based on wallet and currency"""
-        if chain_name not in self.tracked_wallets_cache:
-            wallets = [w['address'] for w in self.db.execute('wallets', 'select', {'blockchain': chain_name}).data]
-            self.tracked_wallets_cache[chain_name] = set(wallets)
-        
-        return tx['to'] in self.tracked_wallets_cache[chain_name] and \
-               tx['currency'] in settings.TRACKED_CURRENCIES
+        wallets = self._get_tracked_wallets(chain_name)
+        return address_key(tx['to']) in wallets and tx['currency'] in settings.TRACKED_CURRENCIES
+
+    def _get_tracked_wallets(self, chain_name):
+        """Return the cached set of tracked wallet keys for a blockchain"""
+        return wallet_cache.get(chain_name, self._load_tracked_wallets)
+
+    def _load_tracked_wallets(self, chain_name):
+        """Fetch tracked wallet addresses for a blockchain from the database"""
+        return [w['address'] for w in self.db.execute('wallets', 'select', {'blockchain': chain_name}).data]
+
+    def _cached_rate(self):
+        """Return the USD rate, re-querying the database at most once per RATE_CACHE_TTL"""
+        now = time.monotonic()
+        if self._rate_cache is None or now - self._rate_cache[1] > self.RATE_CACHE_TTL:
+            rate = self.db.execute('rates', 'select').data[0]['value']
+            self._rate_cache = (rate, now)
+        return self._rate_cache[0]
 
-    def _process_transaction(self, tx, chain_name):
+    def _load_message_format(self):
+        """Apply a message format saved with /set_message_format, if there is one"""
+        try:
+            saved = self.db.execute('settings', 'select', {'key': 'message_format'}).data
+            if saved:
+                settings.MESSAGE_TEMPLATE = saved[0]['value']
+        except Exception as e:
+            logger.log(f"Error loading message format, using default: {e}")
+
+    def _send_alert(self, message):
+        """Hand an alert for the configured group to the bot's event loop"""
+        saved = self.db.execute('settings', 'select', {'key': 'group_id'}).data
+        if not saved:
+            logger.log("No group ID set; use /set_group_id to receive alerts", level='warning')
+            return
+        # Chain checks run in worker threads, while the Telegram client lives on the loop
+        asyncio.run_coroutine_threadsafe(
+            self.notifier.send_alert(int(saved[0]['value']), message), self._loop
+        )
+
+    def _process_transaction(self, tx, chain_name, explorer_url):
         """Format and send the transaction message to the notification service"""
         try:
-            rate = self.db.execute('rates', 'select').data[0]['value']
-            amount = tx['value']
+            rate = self._cached_rate()
+            # Adapters already report value in whole native units
+            amount = float(tx['value'])
             usd_value = amount * rate
-            explorer_url = BlockchainAdapters.get_explorer_url(chain_name)
-            message = f"""🔔 New {chain_name} Transaction!
-            Amount: {amount} {tx['currency']}
-            USD Value: ${usd_value:.2f}
-            Explorer: {explorer_url}{tx['hash']}"""
-            self.notifier.send(message)
+            message = settings.MESSAGE_TEMPLATE.format(
+                chain=chain_name, amount=amount, cur=tx['currency'],
+                usd=usd_value, url=explorer_url, hash=tx['hash']
+            )
+            self._send_alert(message)
         except Exception as e:
-            logger.log('error', f"Error processing transaction {tx['hash']}: {str(e)}")
\ No newline at end of file
+            logger.log(f"Error processing transaction {tx['hash']}: {str(e)}", level='error')
\ No newline at end of file
@@ -0,0 +1,51 @@
+import time
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+
+def address_key(address: Optional[str]) -> Any:
+    """
+    Normalise an address for matching.
+
+    0x-prefixed EVM addresses become ints, so checksummed and lowercase forms
+    compare equal without any string case folding. Other address formats are
+    case-sensitive and returned unchanged.
+    """
+    if address and address[:2] in ('0x', '0X'):
+        try:
+            return int(address, 16)
+        except ValueError:
+            return address
+    return address
+
+
+class WalletSetCache:
+    """Per-chain cache of tracked wallet address keys (see address_key) with TTL refresh"""
+
+    def __init__(self, ttl: int = 60):
+        self.ttl = ttl
+        self._sets: Dict[str, Tuple[FrozenSet[Any], float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, chain_name: str, loader: Callable[[str], Iterable[str]]) -> FrozenSet[Any]:
+        """Return the wallet set for a chain, calling loader(chain_name) when missing or expired"""
+        entry = self._sets.get(chain_name)
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+
+        wallets = frozenset(address_key(address) for address in loader(chain_name))
+        with self._lock:
+            self._sets[chain_name] = (wallets, time.monotonic() + self.ttl)
+        return wallets
+
+    def invalidate(self, chain_name: Optional[str] = None) -> None:
+        """Drop the cached set for one chain, or for every chain when chain_name is None"""
+        with self._lock:
+            if chain_name is None:
+                self._sets.clear()
+            else:
+                self._sets.pop(chain_name, None)
+
+
+# Shared by the trackers and the wallet admin commands
+wallet_cache = WalletSetCache()
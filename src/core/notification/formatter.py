@@ -17,9 +17,9 @@ class MessageFormatter:
             """
         except KeyError as e:
             # Log error if a key is missing from tx_data
-            logger.log('error', f"Missing key in transaction data: {str(e)}")
+            logger.log(f"Missing key in transaction data: {str(e)}", level='error')
             return "Error formatting notification."
         except Exception as e:
             # General error handling
-            logger.log('error', f"Error formatting notification: {str(e)}")
+            logger.log(f"Error formatting notification: {str(e)}", level='error')
             return "Error formatting notification."
\ No newline at end of file
@@ -49,9 +49,9 @@ class TrackingConfig:
         if self.created_at is None:
             self.created_at = datetime.now().isoformat()
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
-    """Transaction data structure"""
+    """Transaction data structure; slotted, as one is built per transfer event"""
     hash: str
     blockchain: str
     token_address: str
@@ -53,6 +53,9 @@ class SimpleCache:
 
 
 class RedisCache:
+    # In-memory stand-in for Redis keys that never expire
+    PERSISTENT_TTL = 10 * 365 * 24 * 3600
+
     def __init__(self):
         self.fallback_cache = SimpleCache()
         self.redis_available = False
@@ -75,9 +78,9 @@ class RedisCache:
             try:
                 value = self.conn.get(key)
                 if value:
-                    logger.log(f"Redis cache hit for key: {key}")
+                    logger.log("Redis cache hit for key: %s", key, level='debug')
                     return value.decode('utf-8')
-                logger.log(f"Redis cache miss for key: {key}")
+                logger.log("Redis cache miss for key: %s", key, level='debug')
                 return None
             except Exception as e:
                 logger.log(f"Redis error, falling back to memory cache: {e}")
@@ -91,7 +94,7 @@ class RedisCache:
         if self.redis_available:
             try:
                 self.conn.setex(key, ttl, value)
-                logger.log(f"Redis cache set for key: {key} with TTL: {ttl} seconds")
+                logger.log("Redis cache set for key: %s with TTL: %s seconds", key, ttl, level='debug')
                 return
             except Exception as e:
                 logger.log(f"Redis error, falling back to memory cache: {e}")
@@ -105,7 +108,7 @@ class RedisCache:
         if self.redis_available:
             try:
                 result = self.conn.delete(key)
-                logger.log(f"Redis cache delete for key: {key}")
+                logger.log("Redis cache delete for key: %s", key, level='debug')
                 return bool(result)
             except Exception as e:
                 logger.log(f"Redis error, falling back to memory cache: {e}")
@@ -114,6 +117,39 @@ class RedisCache:
         # Use fallback cache
         return self.fallback_cache.delete(key)
     
+    def get_hash(self, name: str) -> Dict[str, str]:
+        """Retrieve every field of a hash."""
+        if self.redis_available:
+            try:
+                return {
+                    field.decode('utf-8'): value.decode('utf-8')
+                    for field, value in self.conn.hgetall(name).items()
+                }
+            except Exception as e:
+                logger.log(f"Redis error, falling back to memory cache: {e}")
+                self.redis_available = False
+        
+        # Use fallback cache
+        return dict(self.fallback_cache.get(name) or {})
+    
+    def set_hash(self, name: str, mapping: Dict[str, Any]) -> None:
+        """Set several fields of a hash; the hash itself does not expire."""
+        if not mapping:
+            return
+        if self.redis_available:
+            try:
+                self.conn.hset(name, mapping=mapping)
+                return
+            except Exception as e:
+                logger.log(f"Redis error, falling back to memory cache: {e}")
+                self.redis_available = False
+        
+        # Use fallback cache
+        current = self.fallback_cache.get(name) or {}
+        self.fallback_cache.set(
+            name, {**current, **{field: str(value) for field, value in mapping.items()}}, self.PERSISTENT_TTL
+        )
+    
     def clear_all(self) -> None:
         """Clear all cache entries"""
         if self.redis_available:
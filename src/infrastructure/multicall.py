@@ -0,0 +1,76 @@
+"""
+Multicall3 helper for batching read-only contract calls into a single eth_call
+"""
+
+from typing import List, Optional, Sequence, Tuple
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+from web3 import Web3
+from src.utils.address import checksum_address
+
+# Multicall3 is deployed at the same address on Ethereum, BSC, Polygon,
+# Avalanche, Arbitrum, Optimism, Base and most other EVM chains
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+AGGREGATE_SELECTOR = function_signature_to_4byte_selector('aggregate((address,bytes)[])')
+TRY_AGGREGATE_SELECTOR = function_signature_to_4byte_selector('tryAggregate(bool,(address,bytes)[])')
+
+Call = Tuple[str, bytes]
+
+
+def encode_aggregate(calls: Sequence[Call]) -> bytes:
+    """Encode calldata for `aggregate((address,bytes)[])`"""
+    return AGGREGATE_SELECTOR + encode(
+        ['(address,bytes)[]'],
+        [[(checksum_address(target), data) for target, data in calls]]
+    )
+
+
+def decode_aggregate(data: bytes) -> Tuple[int, List[bytes]]:
+    """Decode the `(uint256 blockNumber, bytes[] returnData)` result of `aggregate`"""
+    block_number, return_data = decode(['uint256', 'bytes[]'], data)
+    return block_number, list(return_data)
+
+
+def encode_try_aggregate(calls: Sequence[Call], require_success: bool = False) -> bytes:
+    """Encode calldata for `tryAggregate(bool,(address,bytes)[])`"""
+    return TRY_AGGREGATE_SELECTOR + encode(
+        ['bool', '(address,bytes)[]'],
+        [require_success, [(checksum_address(target), data) for target, data in calls]]
+    )
+
+
+def decode_try_aggregate(data: bytes) -> List[Optional[bytes]]:
+    """Decode the `(bool,bytes)[]` result of `tryAggregate`; failed calls become None"""
+    (results,) = decode(['(bool,bytes)[]'], data)
+    return [return_data if success else None for success, return_data in results]
+
+
+class Multicall:
+    """Executes many contract reads in one RPC round trip via Multicall3"""
+
+    def __init__(self, w3: Web3, address: str = MULTICALL3_ADDRESS):
+        self.w3 = w3
+        self.address = checksum_address(address)
+
+    def aggregate(self, calls: Sequence[Call]) -> Tuple[int, List[bytes]]:
+        """
+        Execute `calls` atomically; the whole batch reverts if any call reverts.
+
+        Args:
+            calls: (target contract, calldata) pairs.
+
+        Returns:
+            The block number the calls ran at and each call's raw return data.
+        """
+        if not calls:
+            return 0, []
+        result = self.w3.eth.call({'to': self.address, 'data': encode_aggregate(calls)})
+        return decode_aggregate(bytes(result))
+
+    def try_aggregate(self, calls: Sequence[Call]) -> List[Optional[bytes]]:
+        """Execute `calls` allowing individual failures, which are returned as None"""
+        if not calls:
+            return []
+        result = self.w3.eth.call({'to': self.address, 'data': encode_try_aggregate(calls)})
+        return decode_try_aggregate(bytes(result))
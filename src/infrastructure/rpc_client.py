@@ -1,13 +1,46 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import HTTPProvider
+from web3.types import RPCResponse
 from config.settings import settings
 from src.utils.logger import logger
 from typing import List, Optional, Dict
 
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with a connection pool sized for polling many chains."""
+    retries = Retry(
+        total=3,
+        connect=1,  # don't stall the poll loop on an unreachable endpoint
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'POST'})  # JSON-RPC and REST reads are safe to replay
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by RPCClient, batched adapter calls, REST adapters and the Web3 HTTP providers
+rpc_session = _build_session()
+
+
+class OrjsonHTTPProvider(HTTPProvider):
+    """Web3 HTTP provider that decodes responses with orjson instead of stdlib json"""
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        return orjson.loads(raw_response)
+
 class RPCClient:
     def __init__(self, chain: str):
         """Initialize the RPC client with the appropriate chain endpoint."""
         try:
-            self.endpoint = settings.BLOCKCHAINS[chain]['rpc']
+            self.endpoint = settings.RPC_URLS[chain]
         except KeyError:
             logger.log(f"Error: Blockchain '{chain}' not found in settings.")
             raise ValueError(f"Invalid blockchain: {chain}")
@@ -32,14 +65,14 @@ class RPCClient:
 
         try:
             # Sending POST request with timeout to avoid hanging
-            response = requests.post(self.endpoint, json=payload, timeout=10)
+            response = rpc_session.post(self.endpoint, json=payload, timeout=10)
             response.raise_for_status()  # Raise exception for HTTP errors
             
             # Checking for valid JSON response
-            response_data = response.json()
+            response_data = orjson.loads(response.content)
             
-            # Log the response (optional, for debugging)
-            logger.log(f"RPC Call: {method} with params {params} - Response: {response_data}")
+            # Debug only; the response is not formatted unless debug logging is on
+            logger.log("RPC Call: %s with params %s - Response: %s", method, params, response_data, level='debug')
             
             # Validate response structure if needed (e.g., check if 'result' exists)
             if 'result' in response_data:
@@ -2,6 +2,8 @@ from telegram import Update
 from telegram.ext import ContextTypes
 from src.utils.validator import BlockchainValidator
 from src.utils.logger import logger
+from config.settings import settings
+from src.core.blockchain.wallet_cache import wallet_cache
 
 # Initialize database lazily to avoid connection errors during import
 _db = None
@@ -62,6 +64,7 @@ async def handle_add_wallet(update: Update, context: ContextTypes.DEFAULT_TYPE):
             'address': address,
             'blockchain': blockchain
         })
+        wallet_cache.invalidate(blockchain)
         await update.message.reply_text(f"✅ Wallet `{address}` added", parse_mode="Markdown")
     except (ValueError, IndexError):
         await update.message.reply_text("Usage: /add_wallet <address> <blockchain>")
@@ -72,6 +75,8 @@ async def handle_remove_wallet(update: Update, context: ContextTypes.DEFAULT_TYP
     try:
         address = context.args[0]
         get_db().execute('wallets', 'delete', {'address': address})
+        # The command doesn't name the chain, so refresh every chain's set
+        wallet_cache.invalidate()
         await update.message.reply_text(f"🗑️ Wallet `{address}` removed", parse_mode="Markdown")
     except IndexError:
         await update.message.reply_text("Usage: /remove_wallet <address>")
@@ -272,8 +277,13 @@ async def handle_set_message_format(update: Update, context: ContextTypes.DEFAUL
         template = " ".join(context.args)
         if not template:
             raise ValueError("Template cannot be empty")
+        try:
+            template.format(chain='', amount=0.0, cur='', usd=0.0, url='', hash='')
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError(f"Invalid template placeholder {e}; use chain, amount, cur, usd, url, hash")
         
         get_db().execute('settings', 'upsert', {'key': 'message_format', 'value': template})
+        settings.MESSAGE_TEMPLATE = template
         await update.message.reply_text("📝 Message format updated")
     except Exception as e:
         await update.message.reply_text(f"❌ Error: {str(e)}")
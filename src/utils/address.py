@@ -0,0 +1,18 @@
+"""
+EVM address helpers
+"""
+
+import functools
+from web3 import Web3
+
+
+@functools.lru_cache(maxsize=8192)
+def checksum_address(address: str) -> str:
+    """
+    Return the EIP-55 checksummed form of an EVM address.
+
+    Checksumming hashes the address with Keccak-256, and the bot checksums the
+    same tracked wallets and token contracts on every poll, so results are
+    memoised. Invalid addresses raise ValueError and are not cached.
+    """
+    return Web3.to_checksum_address(address)
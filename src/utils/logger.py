@@ -20,13 +20,13 @@ class BotLogger:
         file_handler.setFormatter(formatter)
         self.logger.addHandler(file_handler)
 
-    def log(self, message: str, level: str = 'info'):
-        """Log message at specified level"""
+    def log(self, message: str, *args, level: str = 'info'):
+        """Log message at specified level; %-style args are only formatted if the level is enabled"""
         if hasattr(self.logger, level):
-            getattr(self.logger, level)(message)
+            getattr(self.logger, level)(message, *args)
         else:
             self.logger.warning(f"Invalid log level '{level}' provided. Logging as WARNING.")
-            self.logger.warning(message)
+            self.logger.warning(message, *args)
 
 # Instantiate the logger
 logger = BotLogger()
@@ -0,0 +1,28 @@
+"""
+Tests for the EVM address helpers
+"""
+
+import pytest
+
+from src.utils.address import checksum_address
+
+
+class TestChecksumAddress:
+    """Test memoised EIP-55 checksumming"""
+
+    def test_checksums_and_caches(self):
+        """Test that lowercase input is checksummed and repeat lookups hit the cache"""
+        checksum_address.cache_clear()
+        for _ in range(3):
+            assert checksum_address('0x55d398326f99059ff775485246999027b3197955') == \
+                '0x55d398326f99059fF775485246999027B3197955'
+        assert checksum_address.cache_info().hits == 2
+
+    def test_invalid_address_raises(self):
+        """Test that invalid addresses still raise instead of returning a cached value"""
+        with pytest.raises(ValueError):
+            checksum_address('0x1234')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,938 @@
+"""
+Tests for blockchain adapter base functionality
+"""
+
+import asyncio
+import orjson
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+from config.settings import settings
+from src.core.blockchain.adapters import BlockchainAdapters
+from src.core.blockchain.adapters.base_chain_adapter import BaseChainAdapter, Tx
+from src.core.blockchain.adapters.evm_adapter import EVMAdapter
+from src.core.blockchain.adapters.ethereum_adapter import EthereumAdapter
+from src.core.blockchain.adapters.token_methods import ERC20_INFO_ABI, ERC20_TRANSFER_TOPIC
+from src.core.blockchain.adapters.algorand_adapter import AlgorandAdapter
+from src.core.blockchain.adapters.cosmos_adapter import CosmosAdapter
+from src.core.blockchain.adapters.osmosis_adapter import OsmosisAdapter
+from src.core.blockchain.adapters.custom_evm_adapter import BALANCE_OF_SELECTOR, CustomEVMAdapter
+from src.core.blockchain.adapters.custom_web3_adapter import CustomWeb3Adapter
+from src.core.blockchain.custom_integration import CustomBlockchainManager
+from src.core.blockchain.wallet_cache import address_key
+
+
+class DummyAdapter(BaseChainAdapter):
+    """Minimal concrete adapter for exercising base class helpers"""
+
+    def get_current_block(self):
+        return 0
+
+    def get_transactions(self, start_block, end_block):
+        return []
+
+    def get_transaction_details(self, tx_hash):
+        return {}
+
+
+def _batch_response(payload):
+    """Answer a JSON-RPC batch in reverse order, echoing each call's block number"""
+    response = Mock()
+    response.raise_for_status.return_value = None
+    response.content = orjson.dumps([
+        {"jsonrpc": "2.0", "id": call["id"], "result": {"number": call["params"][0]}}
+        for call in reversed(payload)
+    ])
+    return response
+
+
+def _transfer_log(tx_hash, block_number, sender, recipient, value):
+    """Raw eth_getLogs entry for an ERC20 Transfer, with addresses left-padded into topics"""
+    return {
+        'transactionHash': tx_hash, 'blockNumber': block_number,
+        'topics': [bytes.fromhex(ERC20_TRANSFER_TOPIC[2:])] + [
+            bytes(12) + bytes.fromhex(address[2:]) for address in (sender, recipient)
+        ],
+        'data': value.to_bytes(32, 'big'),
+    }
+
+
+class TestRpcBatch:
+    """Test batched JSON-RPC helper"""
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = DummyAdapter({'rpc_url': 'https://rpc.test', 'native_token': 'ETH', 'batch_size': 2})
+        adapter._session = Mock()
+        adapter._session.post.side_effect = lambda url, json, timeout: _batch_response(json)
+        return adapter
+
+    def test_batches_are_chunked(self, adapter):
+        """Test that calls are split into batch_size-sized POSTs"""
+        adapter._get_blocks_batched(10, 14)
+        sizes = [len(call.kwargs['json']) for call in adapter._session.post.call_args_list]
+        assert sizes == [2, 2, 1]
+
+    def test_results_keep_request_order(self, adapter):
+        """Test that out-of-order replies are matched back by id"""
+        blocks = adapter._get_blocks_batched(10, 14)
+        assert [block['number'] for block in blocks] == [hex(n) for n in range(10, 15)]
+
+    def test_failed_calls_are_dropped(self, adapter):
+        """Test that error replies yield no block"""
+        adapter._session.post.side_effect = None
+        adapter._session.post.return_value.content = orjson.dumps([
+            {"jsonrpc": "2.0", "id": 0, "error": {"code": -32000, "message": "boom"}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"number": "0xb"}},
+        ])
+        assert adapter._get_blocks_batched(10, 11) == [{"number": "0xb"}]
+
+    def test_unmatched_reply_ids_drop_only_that_entry(self, adapter):
+        """Test that replies with a missing or out-of-range id don't abort the batch"""
+        adapter._session.post.side_effect = None
+        adapter._session.post.return_value.content = orjson.dumps([
+            {"jsonrpc": "2.0", "result": {"number": "0xa"}},
+            {"jsonrpc": "2.0", "id": 7, "result": {"number": "0xa"}},
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "invalid request"}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"number": "0xb"}},
+        ])
+        assert adapter._rpc_batch([("eth_blockNumber", []), ("eth_blockNumber", [])]) == [None, {"number": "0xb"}]
+
+    def test_skip_empty_blocks(self, adapter):
+        """Test that only blocks with transactions are fetched when enabled"""
+        adapter.skip_empty_blocks = True
+        counts = {'0xa': '0x0', '0xb': '0x3', '0xc': '0x0'}
+
+        def respond(url, json, timeout):
+            if json[0]['method'] == 'eth_getBlockTransactionCountByNumber':
+                response = Mock()
+                response.content = orjson.dumps([
+                    {"jsonrpc": "2.0", "id": call["id"], "result": counts[call["params"][0]]}
+                    for call in json
+                ])
+                return response
+            return _batch_response(json)
+
+        adapter._session.post.side_effect = respond
+        assert adapter._get_blocks_batched(10, 12) == [{"number": "0xb"}]
+
+
+class TestAsyncVariants:
+    """Test the awaitable adapter wrappers"""
+
+    def test_chains_polled_concurrently(self):
+        """Test that gathering several adapters overlaps their blocking RPC calls"""
+        barrier = threading.Barrier(3, timeout=5)
+
+        class SlowAdapter(DummyAdapter):
+            def get_current_block(self):
+                barrier.wait()  # only returns once all three calls are in flight
+                return 42
+
+        adapters = [SlowAdapter({'name': f'chain{i}'}) for i in range(3)]
+
+        async def poll():
+            return await asyncio.gather(*(adapter.get_current_block_async() for adapter in adapters))
+        assert asyncio.run(poll()) == [42, 42, 42]
+
+
+class TestColumnar:
+    """Test the column-per-field transaction view"""
+
+    def test_records_transposed(self):
+        """Test that Tx records become one list per field"""
+        adapter = DummyAdapter({'name': 'Devnet'})
+        adapter.get_transactions = Mock(return_value=[
+            Tx('0x1', '0xb', '0xa', 1.5, 'ETH', 7), Tx('0x2', '0xc', '0xa', 2.0, 'USDT', 8, 99)
+        ])
+        columns = adapter.get_transactions_columnar(7, 8)
+        assert columns['to'] == ['0xb', '0xc'] and columns['from'] == ['0xa', '0xa']
+        assert columns['currency'] == ['ETH', 'USDT'] and columns['timestamp'] == [0, 99]
+
+    def test_empty_range(self):
+        """Test that an empty range still returns every column"""
+        columns = DummyAdapter({'name': 'Devnet'}).get_transactions_columnar(1, 2)
+        assert columns == {column: [] for column in BaseChainAdapter.TX_COLUMNS}
+
+
+class TestTokenMethods:
+    """Test the ERC-20 helpers shared by the adapters"""
+
+    def test_contract_class_built_once(self):
+        """Test that contracts for different tokens share one parsed ABI until web3 is replaced"""
+        adapter = DummyAdapter({'name': 'Devnet'})
+        adapter.web3 = Web3()
+        first = adapter._erc20_contract('0x' + 'a' * 40, 'info', ERC20_INFO_ABI)
+        second = adapter._erc20_contract('0x' + 'b' * 40, 'info', ERC20_INFO_ABI)
+        assert type(first) is type(second)
+        assert second.address.lower() == '0x' + 'b' * 40
+        adapter.web3 = Web3()
+        assert type(adapter._erc20_contract('0x' + 'a' * 40, 'info', ERC20_INFO_ABI)) is not type(first)
+
+
+    def test_discovery_checks_each_contract_once(self):
+        """Test that tokens come from one Transfer log query, with one info lookup per ERC20 contract"""
+        adapter = DummyAdapter({'name': 'Devnet'})
+        adapter.web3 = Mock()
+        adapter.web3.eth.block_number = 150
+        token, nft = '0x55d398326f99059fF775485246999027B3197955', '0x' + 'c' * 40
+        topics = [bytes(32)] * 3
+        adapter.web3.eth.get_logs.return_value = [
+            {'address': token, 'topics': topics}, {'address': token.lower(), 'topics': topics},
+            {'address': nft, 'topics': topics + [bytes(32)]},
+        ]
+        adapter.get_token_info = AsyncMock(return_value={'symbol': 'USDT', 'name': 'Tether', 'decimals': 18})
+        tokens = asyncio.run(adapter._discover_erc20_tokens(limit=10))
+        assert [(t['address'], t['symbol']) for t in tokens] == [(token, 'USDT')]
+        adapter.get_token_info.assert_awaited_once_with(token)
+        assert adapter.web3.eth.get_logs.call_args[0][0]['fromBlock'] == 50
+        adapter.web3.eth.get_block.assert_not_called()
+
+    def test_info_fallback_reads_fields_concurrently(self):
+        """Test that without Multicall3 the four token reads overlap and a failed read falls back"""
+        adapter = DummyAdapter({'name': 'Devnet'})
+        adapter._multicall_token_fields = Mock(return_value=None)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def reader(value):
+            def call():
+                barrier.wait()  # only returns once all four reads are in flight
+                if isinstance(value, Exception):
+                    raise value
+                return value
+            return Mock(return_value=Mock(call=call))
+        contract = Mock()
+        contract.functions.name = reader('Tether')
+        contract.functions.symbol = reader('USDT')
+        contract.functions.decimals = reader(ValueError('execution reverted'))
+        contract.functions.totalSupply = reader(10)
+        adapter._erc20_contract = Mock(return_value=contract)
+        info = asyncio.run(adapter._get_erc20_token_info('0x' + 'a' * 40))
+        assert (info['name'], info['symbol'], info['decimals'], info['total_supply']) == ('Tether', 'USDT', 18, 10)
+
+    def test_token_info_cached_per_token(self):
+        """Test that metadata is fetched once per token in any address case and failures are retried"""
+        adapter = DummyAdapter({'name': 'Devnet'})
+        adapter.web3 = Mock()
+        adapter._get_erc20_token_info = AsyncMock(side_effect=[None, {'symbol': 'USDT'}])
+        token = '0x55d398326f99059fF775485246999027B3197955'
+
+        async def lookups():
+            return [await adapter.get_token_info(address) for address in (token, token, token.lower())]
+        missing, first, second = asyncio.run(lookups())
+        assert missing is None and first == second == {'symbol': 'USDT'}
+        first['is_contract'] = True
+        assert asyncio.run(adapter.get_token_info(token)) == {'symbol': 'USDT'}
+        assert adapter._get_erc20_token_info.await_count == 2
+
+    def test_transfer_context_fetched_in_one_batch(self):
+        """Test that receipts, transactions and blocks for all transfer events share one batch POST"""
+        adapter = DummyAdapter({'name': 'Devnet', 'rpc_url': 'https://rpc.test'})
+        adapter.web3 = Mock()
+        adapter.web3.eth.block_number = 10
+        adapter.get_token_info = AsyncMock(return_value={'decimals': 6, 'symbol': 'USDT'})
+        router = '0x10ED43C718714eb63d5aA57B78B54704E256024E'
+        adapter.web3.eth.get_logs.return_value = [
+            _transfer_log(bytes([1]) * 32, 5, router, '0x' + 'b' * 40, 2 * 10 ** 6),
+            _transfer_log(bytes([1]) * 32, 5, '0x' + 'b' * 40, '0x' + 'c' * 40, 10 ** 6),
+        ]
+        replies = {'eth_getTransactionReceipt': {'gasUsed': '0x5208'}, 'eth_getTransactionByHash': {'gasPrice': '0x3'},
+                   'eth_getBlockByNumber': {'timestamp': '0x64'}}
+        adapter._session = Mock()
+        adapter._session.post.side_effect = lambda url, json, timeout: Mock(content=orjson.dumps([
+            {"jsonrpc": "2.0", "id": call["id"], "result": replies[call["method"]]} for call in json
+        ]))
+        txs = asyncio.run(adapter._get_erc20_transactions('0x' + 'a' * 40, 1))
+        adapter._session.post.assert_called_once()
+        assert len(adapter._session.post.call_args.kwargs['json']) == 3
+        adapter.web3.eth.get_transaction_receipt.assert_not_called()
+        query = adapter.web3.eth.get_logs.call_args[0][0]
+        assert query['topics'] == [ERC20_TRANSFER_TOPIC] and query['fromBlock'] == 1 and query['toBlock'] == 10
+        assert [(tx.amount, tx.gas_used, tx.gas_price, tx.dex_name) for tx in txs] == [
+            (2.0, 21000, 3, 'PancakeSwap'), (1.0, 21000, 3, None)
+        ]
+        assert txs[0].hash == '0x' + '01' * 32 and txs[0].transaction_type.name == 'BUY'
+        # Slotted records carry no per-instance __dict__
+        assert not hasattr(txs[0], '__dict__')
+
+    def test_transfer_context_fallback_fetched_once(self):
+        """Test that without a batch each transaction and block is still fetched once for all its events"""
+        adapter = DummyAdapter({'name': 'Devnet', 'rpc_url': 'wss://rpc.test'})
+        adapter.web3 = Mock()
+        adapter.web3.eth.block_number = 10
+        adapter.web3.eth.get_transaction_receipt.return_value = {'gasUsed': 21000}
+        adapter.web3.eth.get_transaction.return_value = {'gasPrice': 3}
+        adapter.web3.eth.get_block.return_value = {'timestamp': 100}
+        adapter.get_token_info = AsyncMock(return_value={'decimals': 0, 'symbol': 'T'})
+        adapter.web3.eth.get_logs.return_value = [
+            _transfer_log(bytes([1]) * 32, 5, '0x' + 'a' * 40, '0x' + 'b' * 40, 1)
+        ] * 3
+        txs = asyncio.run(adapter._get_erc20_transactions('0x' + 'a' * 40, 1))
+        assert len(txs) == 3 and txs[0].timestamp == txs[2].timestamp
+        for call in (adapter.web3.eth.get_transaction_receipt, adapter.web3.eth.get_transaction, adapter.web3.eth.get_block):
+            call.assert_called_once()
+
+    def test_dex_lookup_ignores_case(self):
+        """Test that DEX routers are recognised and named in any address case"""
+        adapter = DummyAdapter({'name': 'Devnet'})
+        router = '0x10ED43C718714eb63d5aA57B78B54704E256024E'
+        assert adapter._is_dex_address(router.lower()) and not adapter._is_dex_address('0x' + 'a' * 40)
+        assert adapter._get_dex_name('0x' + 'a' * 40, router.lower()) == 'PancakeSwap'
+        assert adapter._get_dex_name('0x' + 'a' * 40, '0x' + 'b' * 40) is None
+
+
+class TestTokenDetection:
+    """Test token currency detection"""
+
+    @pytest.fixture
+    def adapter(self):
+        return DummyAdapter({
+            'rpc_url': 'https://rpc.test',
+            'native_token': 'BNB',
+            'tokens': {'USDT': '0x55d398326f99059fF775485246999027B3197955'}
+        })
+
+    def test_contract_match_ignores_case(self, adapter):
+        """Test that token contracts match regardless of address case"""
+        tx = {'to': '0x55D398326F99059FF775485246999027B3197955'}
+        assert adapter._detect_token_currency(tx) == 'USDT'
+
+    def test_falls_back_to_native(self, adapter):
+        """Test that unknown or missing recipients resolve to the native token"""
+        assert adapter._detect_token_currency({'to': '0x' + '0' * 40}) == 'BNB'
+        assert adapter._detect_token_currency({'to': None}) == 'BNB'
+
+    def test_tokenless_chain_is_native(self):
+        """Test that chains without token contracts always report the native token"""
+        adapter = DummyAdapter({'rpc_url': 'https://rpc.test', 'native_token': 'doge'})
+        assert adapter._detect_token_currency({'to': 'DH5yaieqoZN36fDVciNyRueRGvGLR3mr7L'}) == 'DOGE'
+        assert [tx.currency for tx in adapter._format_transactions([{'to': 'D1'}, {}])] == ['DOGE', 'DOGE']
+
+    def test_format_transaction(self, adapter):
+        """Test that raw transactions are formatted into Tx records"""
+        tx = adapter._format_transaction({
+            'hash': '0xabc', 'to': '0x55d398326f99059fF775485246999027B3197955',
+            'from': '0x2', 'value': 5, 'blockNumber': 10
+        })
+        assert tx == Tx(
+            hash='0xabc', to='0x55d398326f99059fF775485246999027B3197955',
+            from_='0x2', value=5, currency='USDT', block=10
+        )
+
+
+class TestEVMFormatting:
+    """Test bulk formatting of raw JSON-RPC transactions"""
+
+    @pytest.fixture
+    def adapter(self):
+        # Skip EVMAdapter.__init__, which connects to the RPC endpoint
+        adapter = EVMAdapter.__new__(EVMAdapter)
+        BaseChainAdapter.__init__(adapter, {
+            'rpc_url': 'https://rpc.test',
+            'native_token': 'MATIC',
+            'tokens': {'USDC': '0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174'}
+        })
+        return adapter
+
+    def test_bulk_format(self, adapter):
+        """Test hex quantities are decoded and currencies detected"""
+        txs = adapter._format_transactions([
+            {'hash': '0x1', 'to': '0x2791bca1f2de4661ed88a30c99a7a9449aa84174', 'from': '0xa',
+             'value': '0x0', 'blockNumber': '0x10'},
+            {'hash': '0x2', 'to': '0xb', 'from': '0xa', 'value': hex(2 * 10 ** 18), 'blockNumber': '0x10'},
+        ])
+        assert [(tx.currency, tx.value, tx.block) for tx in txs] == [('USDC', 0, 16), ('MATIC', 2, 16)]
+
+    def test_malformed_entries_are_skipped(self, adapter):
+        """Test that one bad transaction doesn't drop the rest of the block"""
+        txs = adapter._format_transactions([
+            {'hash': '0x1', 'to': '0xb', 'value': '0x0', 'blockNumber': '0x10'},
+            {'to': '0xb', 'value': 'not-hex'},
+        ])
+        assert [tx.hash for tx in txs] == ['0x1']
+
+
+class TestCustomEVMBatching:
+    """Test block fetching in the custom EVM adapter"""
+
+    @pytest.fixture
+    def adapter(self):
+        # Skip CustomEVMAdapter.__init__, which connects to the RPC endpoint
+        adapter = CustomEVMAdapter.__new__(CustomEVMAdapter)
+        BaseChainAdapter.__init__(adapter, {'rpc_url': 'https://rpc.test', 'name': 'Devnet'})
+        adapter.chain_id = 7
+        adapter.batch_rpc = True
+        adapter.block_fetch_chunk = 50
+        adapter._latest_head = None
+        adapter._new_head = threading.Event()
+        adapter._closed = False
+        adapter._conn_ok_until = 0.0
+        adapter._block_number_memo = (0, 0.0)
+        adapter.multicall_address = '0xcA11bde05977b3631167028862bE2a173976CA11'
+        adapter.web3 = Mock()
+        adapter._session = Mock()
+
+        def post(url, json, timeout):
+            response = Mock()
+            response.content = orjson.dumps([
+                {"jsonrpc": "2.0", "id": call["id"], "result": {
+                    "number": call["params"][0], "hash": "0xb",
+                    "transactions": [{"hash": "0x1", "from": "0xa", "to": None, "value": "0x10",
+                                      "gas": "0x5208", "gasPrice": "0x1", "transactionIndex": "0x0"}]
+                }}
+                for call in json
+            ])
+            return response
+        adapter._session.post.side_effect = post
+        return adapter
+
+    def test_blocks_fetched_in_batches(self, adapter):
+        """Test that the whole range is fetched chunk by chunk in batch_size POSTs"""
+        txs = adapter.get_transactions(100, 200)
+        assert [len(call.kwargs['json']) for call in adapter._session.post.call_args_list] == [20, 20, 10, 20, 20, 10, 1]
+        assert [tx['block_number'] for tx in txs] == list(range(100, 201))
+        assert adapter.get_transactions_columnar(100, 101)['block_number'] == [100, 101]
+        assert txs[0].value == 16 and txs[0]['gas'] == 21000 and txs[0]['to'] == ''
+        assert txs[0].to_dict()['value'] == '16' and txs[0].to_dict()['hash'] == '0x1'
+        assert not hasattr(txs[0], '__dict__')
+        adapter.web3.eth.get_block.assert_not_called()
+
+    def test_connection_check_is_reused(self, adapter):
+        """Test that a successful connection check isn't repeated within its TTL"""
+        adapter.web3.eth.get_balance.return_value = 10 ** 18
+        for _ in range(3):
+            assert adapter.get_native_balance('0x55d398326f99059fF775485246999027B3197955') == 1.0
+        assert adapter.web3.is_connected.call_count == 1
+
+    def test_transaction_details_in_one_batch(self, adapter):
+        """Test that tx, receipt and head share one POST and the head is reused right after"""
+        replies = {
+            'eth_getTransactionByHash': {'hash': '0x1', 'from': '0xa', 'to': '0xb', 'value': '0x10',
+                                         'gas': '0x5208', 'gasPrice': '0x1'},
+            'eth_getTransactionReceipt': {'blockNumber': '0x64', 'gasUsed': '0x5208', 'status': '0x1',
+                                          'blockHash': '0xbb', 'transactionIndex': '0x2'},
+            'eth_blockNumber': '0x6e',
+        }
+        adapter._session.post.side_effect = lambda url, json, timeout: Mock(content=orjson.dumps([
+            {"jsonrpc": "2.0", "id": call["id"], "result": replies[call["method"]]} for call in json
+        ]))
+        details = adapter.get_transaction_details('0x1')
+        assert details['confirmations'] == 10 and details['status'] == 1 and details['value'] == '16'
+        adapter.get_transaction_details('0x1')
+        sizes = [len(call.kwargs['json']) for call in adapter._session.post.call_args_list]
+        assert sizes == [3, 2]
+
+    def test_transaction_details_without_head(self, adapter):
+        """Test that a failed head lookup is reported as not found rather than a formatting error"""
+        replies = {
+            'eth_getTransactionByHash': {'hash': '0x1', 'from': '0xa', 'value': '0x10', 'gas': '0x5208'},
+            'eth_getTransactionReceipt': {'blockNumber': '0x64', 'gasUsed': '0x5208', 'status': '0x1',
+                                          'blockHash': '0xbb', 'transactionIndex': '0x2'},
+        }
+        adapter._session.post.side_effect = lambda url, json, timeout: Mock(content=orjson.dumps([
+            {"jsonrpc": "2.0", "id": call["id"], "result": replies[call["method"]]} if call["method"] in replies else
+            {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000}}
+            for call in json
+        ]))
+        with patch('src.core.blockchain.adapters.custom_evm_adapter.logger') as log:
+            assert adapter.get_transaction_details('0x1') is None
+        assert 'Chain head not found' in log.log.call_args[0][0]
+        assert adapter._recent_block_number() is None
+
+    def test_subscribed_head_skips_polling(self, adapter):
+        """Test that a block number pushed by newHeads is used without an RPC call"""
+        adapter._latest_head = 1234
+        adapter._conn_ok_until = time.monotonic() + 60
+        assert adapter.get_current_block() == 1234
+        adapter.web3.is_connected.assert_not_called()
+        adapter.web3.eth.get_block.assert_not_called()
+
+    def test_subscribed_head_needs_read_connection(self, adapter):
+        """Test that a pushed head is not reported when blocks cannot be read"""
+        adapter._latest_head = 1234
+        adapter.web3 = None
+        assert adapter.get_current_block() == 0
+        assert adapter.get_transactions(1, 1234) == []
+
+    def test_websocket_endpoint_reads_over_http(self, adapter):
+        """Test that a websocket chain reads blocks from http_rpc_url, and not at all without one"""
+        adapter.rpc_url = 'wss://rpc.test'
+        adapter.http_rpc_url = None
+        adapter.web3 = None
+        adapter._initialize_connection()
+        assert adapter.web3 is None
+
+        adapter.http_rpc_url = 'https://rpc.test'
+        with patch('src.core.blockchain.adapters.custom_evm_adapter.OrjsonHTTPProvider') as provider, \
+             patch('src.core.blockchain.adapters.custom_evm_adapter.Web3'):
+            adapter._initialize_connection()
+        assert provider.call_args.args[0] == 'https://rpc.test'
+        assert adapter.web3 is not None
+
+    def test_token_decimals_read_once(self, adapter):
+        """Test that balances are raw eth_calls and decimals are read only once"""
+        wallet, token = '0x' + 'a' * 40, '0x' + 'b' * 40
+        adapter.web3.eth.call.side_effect = lambda tx: (
+            encode(['uint256'], [2500000]) if tx['data'][:4] == BALANCE_OF_SELECTOR else encode(['uint8'], [6])
+        )
+        for _ in range(3):
+            assert adapter.get_token_balance(wallet, token) == 2.5
+        assert adapter.web3.eth.call.call_count == 4
+        assert adapter.web3.eth.call.call_args_list[0].args[0]['data'] == \
+            BALANCE_OF_SELECTOR + encode(['address'], [wallet])
+        adapter.web3.eth.contract.assert_not_called()
+
+    def test_token_balances_in_one_multicall(self, adapter):
+        """Test that balances and decimals for many wallets come from one eth_call"""
+        adapter.web3.to_checksum_address.side_effect = lambda a: a
+        adapter.web3.eth.call.return_value = encode(['(bool,bytes)[]'], [[
+            (True, encode(['uint256'], [1500000])), (False, b''), (True, encode(['uint8'], [6]))
+        ]])
+        token = '0x55d398326f99059fF775485246999027B3197955'
+        wallets = ['0x' + '1' * 40, '0x' + '2' * 40]
+        assert adapter.get_token_balances(wallets, token) == [1.5, 0.0]
+        assert adapter._decimals_cache[address_key(token.lower())] == 6
+        adapter.web3.eth.call.assert_called_once()
+
+    def test_wait_for_transaction_backs_off(self, adapter):
+        """Test that receipts are polled with growing intervals until the transaction is mined"""
+        adapter._rpc_batch = Mock(side_effect=[[None], [None], [None], [{'status': '0x1'}]])
+        adapter.get_transaction_details = Mock(return_value={'status': 1})
+        with patch('time.sleep') as sleep:
+            assert adapter.wait_for_transaction('0x1') == {'status': 1}
+        assert [c.args[0] for c in sleep.call_args_list] == [0.5, 0.75, 1.125]
+
+    def test_rpc_url_update_reuses_provider(self, adapter):
+        """Test that switching between HTTP endpoints retargets the existing provider"""
+        web3 = adapter.web3
+        adapter.update_rpc_url('https://rpc2.test')
+        assert adapter.web3 is web3
+        assert web3.provider.endpoint_uri == 'https://rpc2.test'
+
+    def test_validate_address_is_local(self, adapter):
+        """Test that address validation needs no web3 call"""
+        adapter.web3 = None
+        assert adapter.validate_address('0x55d398326f99059fF775485246999027B3197955')
+        assert adapter.validate_address('0x55d398326f99059ff775485246999027b3197955')
+        assert not adapter.validate_address('0x55d398326f99059ff775485246999027b31979')
+        assert not adapter.validate_address('0xZZd398326f99059ff775485246999027b3197955')
+        assert not adapter.validate_address(None)
+
+    def test_construction_does_not_connect(self):
+        """Test that the RPC connection is opened on first use of web3, not in __init__"""
+        with patch.object(CustomEVMAdapter, '_initialize_connection') as connect:
+            adapter = CustomEVMAdapter({'rpc_url': 'https://rpc.test', 'name': 'Devnet'})
+            connect.assert_not_called()
+            adapter.warm_up()
+            adapter.web3
+            connect.assert_called_once()
+            adapter.close()
+
+    def test_parallel_fetch_without_batching(self, adapter):
+        """Test that blocks are fetched concurrently but returned in order when batching is off"""
+        adapter.batch_rpc = False
+        adapter._pool = ThreadPoolExecutor(max_workers=4)
+
+        def get_block(number, full_transactions):
+            tx = Mock(value=1, gas=21000, gasPrice=1, transactionIndex=0)
+            tx.__getitem__ = lambda self, key: '0xa'
+            return Mock(transactions=[tx])
+        adapter.web3.eth.get_block.side_effect = get_block
+        txs = adapter.get_transactions(5, 8)
+        adapter.close()
+        assert [tx['block_number'] for tx in txs] == [5, 6, 7, 8]
+        adapter._session.post.assert_not_called()
+
+
+def _rest_session(documents):
+    """Mock session answering GETs from a path -> JSON document mapping"""
+    def get(url, timeout):
+        response = Mock()
+        response.content = orjson.dumps(documents[url.split('.test', 1)[1]])
+        return response
+    session = Mock()
+    session.get.side_effect = get
+    return session
+
+
+class TestRestAdapters:
+    """Test the REST-based Algorand, Cosmos and Osmosis adapters"""
+
+    def test_algorand_payments(self):
+        """Test that payments in a round are formatted with their transaction IDs"""
+        adapter = AlgorandAdapter({'rpc_url': 'https://algod.test', 'native_token': 'ALGO'})
+        adapter._session = _rest_session({
+            '/v2/status': {'last-round': 101},
+            '/v2/blocks/101?format=json': {'block': {'ts': 5, 'txns': [
+                {'txn': {'type': 'appl', 'snd': 'A'}},
+                {'txn': {'type': 'pay', 'snd': 'A', 'rcv': 'B', 'amt': 2500000}},
+            ]}},
+            '/v2/blocks/101/txids': {'blockTxids': ['T1', 'T2']},
+        })
+        assert adapter.get_current_block() == 101
+        assert adapter.get_transactions(101, 101) == [Tx('T2', 'B', 'A', 2.5, 'ALGO', 101, 5)]
+
+    def test_cosmos_bank_sends(self):
+        """Test that native MsgSend transfers are hashed and formatted"""
+        adapter = CosmosAdapter({'rpc_url': 'https://lcd.test', 'native_token': 'ATOM'})
+        send = {'@type': '/cosmos.bank.v1beta1.MsgSend', 'from_address': 'cosmos1a',
+                'to_address': 'cosmos1b', 'amount': [{'denom': 'uatom', 'amount': '1500000'}]}
+        adapter._session = _rest_session({
+            f'/cosmos/tx/v1beta1/txs/block/{h}?pagination.limit=100': {
+                'block': {'data': {'txs': ['dHgx']}}, 'txs': [{'body': {'messages': [send]}}]
+            } for h in (7, 8)
+        })
+        txs = adapter.get_transactions(7, 8)
+        assert [(tx.block, tx.to, tx.value, tx.currency) for tx in txs] == [
+            (7, 'cosmos1b', 1.5, 'ATOM'), (8, 'cosmos1b', 1.5, 'ATOM')
+        ]
+        # sha256(b'tx1')
+        assert txs[0].hash == '709B55BD3DA0F5A838125BD0EE20C5BFDD7CABA173912D4281CAE816B79A201B'
+
+    def test_osmosis_reads_uosmo_sends(self):
+        """Test that Osmosis reuses the Cosmos LCD parsing with its own native denom"""
+        adapter = OsmosisAdapter({'rpc_url': 'https://lcd.test'})
+        send = {'@type': '/cosmos.bank.v1beta1.MsgSend', 'from_address': 'osmo1a',
+                'to_address': 'osmo1b', 'amount': [{'denom': 'uosmo', 'amount': '2000000'}]}
+        adapter._session = _rest_session({
+            '/cosmos/tx/v1beta1/txs/block/9?pagination.limit=100': {
+                'block': {'data': {'txs': ['dHgx']}}, 'txs': [{'body': {'messages': [send]}}]
+            }
+        })
+        assert [(tx.to, tx.value, tx.currency) for tx in adapter.get_transactions(9, 9)] == [('osmo1b', 2.0, 'OSMO')]
+
+    def test_cosmos_skips_hashing_unrelated_txs(self):
+        """Test that transactions without a tracked send are not decoded"""
+        adapter = CosmosAdapter({'rpc_url': 'https://lcd.test', 'native_token': 'ATOM'})
+        vote = {'@type': '/cosmos.gov.v1beta1.MsgVote', 'voter': 'cosmos1a'}
+        adapter._session = _rest_session({
+            '/cosmos/tx/v1beta1/txs/block/7?pagination.limit=100': {
+                'block': {'data': {'txs': ['not base64!']}}, 'txs': [{'body': {'messages': [vote]}}]
+            }
+        })
+        assert adapter.get_transactions(7, 7) == []
+
+    def test_cosmos_ibc_denoms(self):
+        """Test that configured IBC denoms map to their symbols and unknown denoms are skipped"""
+        adapter = CosmosAdapter({'rpc_url': 'https://lcd.test', 'native_token': 'ATOM',
+                                 'denoms': {'usdc': 'ibc/USDC'}})
+        send = {'@type': '/cosmos.bank.v1beta1.MsgSend', 'from_address': 'a', 'to_address': 'b',
+                'amount': [{'denom': 'ibc/USDC', 'amount': '2000000'}, {'denom': 'ibc/OTHER', 'amount': '1'}]}
+        adapter._session = _rest_session({'/cosmos/tx/v1beta1/txs/block/9?pagination.limit=100': {
+            'block': {'data': {'txs': ['dHgx']}}, 'txs': [{'body': {'messages': [send]}}]
+        }})
+        assert [(tx.currency, tx.value) for tx in adapter.get_transactions(9, 9)] == [('USDC', 2.0)]
+
+    def test_cosmos_pages_through_busy_blocks(self):
+        """Test that decoded transactions past the first page are fetched and paired by offset"""
+        adapter = CosmosAdapter({'rpc_url': 'https://lcd.test', 'native_token': 'ATOM'})
+        adapter.TX_PAGE_LIMIT = 1
+        sends = [{'@type': '/cosmos.bank.v1beta1.MsgSend', 'from_address': 'a', 'to_address': to,
+                  'amount': [{'denom': 'uatom', 'amount': '1000000'}]} for to in ('b', 'c')]
+        block = {'data': {'txs': ['dHgx', 'dHgy']}}
+        adapter._session = _rest_session({
+            '/cosmos/tx/v1beta1/txs/block/3?pagination.limit=1': {
+                'block': block, 'txs': [{'body': {'messages': [sends[0]]}}], 'pagination': {'total': '2'}
+            },
+            '/cosmos/tx/v1beta1/txs/block/3?pagination.limit=1&pagination.offset=1': {
+                'block': block, 'txs': [{'body': {'messages': [sends[1]]}}], 'pagination': {'total': '2'}
+            },
+        })
+        txs = adapter.get_transactions(3, 3)
+        assert [tx.to for tx in txs] == ['b', 'c']
+        assert txs[0].hash != txs[1].hash
+
+    def test_cosmos_prefilter_skips_parsing_blocks_without_tracked_sends(self):
+        """Test that single-page blocks lacking a tracked MsgSend are dropped before JSON parsing"""
+        adapter = CosmosAdapter({'rpc_url': 'https://lcd.test', 'native_token': 'ATOM'})
+        vote = {'@type': '/cosmos.gov.v1beta1.MsgVote', 'voter': 'cosmos1a', 'fee': 'uatom'}
+        other = {'@type': '/cosmos.bank.v1beta1.MsgSend', 'amount': [{'denom': 'ibc/OTHER', 'amount': '1'}]}
+        block = {'block': {'data': {'txs': ['dHgx']}}, 'txs': [{'body': {'messages': [vote]}}]}
+        assert not adapter._may_hold_sends(orjson.dumps(block))
+        assert not adapter._may_hold_sends(orjson.dumps({**block, 'txs': [{'body': {'messages': [other]}}]}))
+        # A tracked send could sit on a later page, so multi-page blocks are parsed regardless
+        assert adapter._may_hold_sends(orjson.dumps({**block, 'pagination': {'total': '101'}}))
+
+        adapter._session = _rest_session({'/cosmos/tx/v1beta1/txs/block/7?pagination.limit=100': block})
+        with patch('src.core.blockchain.adapters.base_chain_adapter.orjson.loads') as loads:
+            assert adapter.get_transactions(7, 7) == []
+        loads.assert_not_called()
+
+
+class TestEthereumAdapter:
+    """Test block fetching in the Ethereum adapter"""
+
+    def test_blocks_fetched_in_parallel_and_ordered(self):
+        """Test that blocks are fetched concurrently, kept in order, and a failed block is skipped"""
+        with patch.object(Web3, 'is_connected', return_value=True):
+            adapter = EthereumAdapter({'rpc_url': 'https://rpc.test', 'native_token': 'ETH',
+                                       'fetch_workers': 4, 'batch_rpc': False})
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get_block(number, full_transactions):
+            barrier.wait()  # only returns once four fetches are in flight
+            if number == 3:
+                raise ValueError("block not available")
+            return {'transactions': [{'hash': f'0x{number}', 'to': '0xb', 'from': '0xa',
+                                      'value': 10 ** 18, 'blockNumber': number}]}
+        adapter.w3 = Mock()
+        adapter.w3.eth.get_block.side_effect = get_block
+        txs = adapter.get_transactions(1, 4)
+        assert [tx.block for tx in txs] == [1, 2, 4]
+        assert txs[0].value == 1.0
+
+
+    def test_blocks_batched_with_fallback(self):
+        """Test that blocks come from one batch POST and only a failed one is fetched on its own"""
+        with patch.object(Web3, 'is_connected', return_value=True):
+            adapter = EthereumAdapter({'rpc_url': 'https://rpc.test', 'native_token': 'ETH'})
+        adapter._session = Mock()
+
+        def post(url, json, timeout):
+            response = Mock()
+            response.content = orjson.dumps([
+                {"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32000}} if call["params"][0] == '0x2' else
+                {"jsonrpc": "2.0", "id": call["id"], "result": {"transactions": [
+                    {"hash": "0x" + call["params"][0][2:] * 2, "to": "0xb", "from": "0xa",
+                     "value": hex(10 ** 18), "blockNumber": call["params"][0]}
+                ]}}
+                for call in json
+            ])
+            return response
+        adapter._session.post.side_effect = post
+        adapter.w3 = Mock()
+        adapter.w3.eth.get_block.return_value = {'transactions': [
+            {'hash': '0x22', 'to': '0xb', 'from': '0xa', 'value': 2 * 10 ** 18, 'blockNumber': 2}
+        ]}
+        txs = adapter.get_transactions(1, 3)
+        adapter._session.post.assert_called_once()
+        adapter.w3.eth.get_block.assert_called_once_with(2, full_transactions=True)
+        assert [(tx.block, tx.value) for tx in txs] == [(1, 1.0), (2, 2.0), (3, 1.0)]
+
+    def test_format_block_detects_tokens_and_skips_malformed(self):
+        """Test that token contracts map to their symbol and a malformed tx drops only itself"""
+        usdt = '0xdAC17F958D2ee523a2206206994597C13D831ec7'
+        with patch.object(Web3, 'is_connected', return_value=True):
+            adapter = EthereumAdapter({'rpc_url': 'https://rpc.test', 'native_token': 'ETH',
+                                       'tokens': {'usdt': usdt}})
+        block = {'transactions': [
+            {'hash': b'\x01', 'to': usdt.lower(), 'from': '0xa', 'value': '0x0', 'blockNumber': '0x5'},
+            {'hash': '0x2', 'to': '0xb', 'from': '0xa', 'value': '0xde0b6b3a7640000', 'blockNumber': '0x5'},
+        ]}
+        assert [(tx.hash, tx.currency, tx.value) for tx in adapter._format_block(block)] == [
+            ('0x01', 'USDT', 0.0), ('0x2', 'ETH', 1.0)
+        ]
+        block['transactions'].append({'to': '0xb'})
+        assert [tx.hash for tx in adapter._format_block(block)] == ['0x01', '0x2']
+
+
+class TestCustomWeb3Batching:
+    """Test block fetching in the custom Web3 adapter"""
+
+    def test_blocks_fetched_in_one_batch(self):
+        """Test that every block in the range is requested in a single batch POST"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'name': 'Devnet'})
+        adapter._session = Mock()
+
+        def post(url, json, timeout):
+            response = Mock()
+            response.content = orjson.dumps([
+                {"jsonrpc": "2.0", "id": call["id"], "result": {"transactions": [
+                    {"hash": f"0x{call['params'][0]}", "from": "a", "to": "b", "value": 1}
+                ]}}
+                for call in reversed(json)
+            ])
+            return response
+        adapter._session.post.side_effect = post
+
+        txs = adapter.get_transactions(1, 8)
+        adapter._session.post.assert_called_once()
+        assert [tx['block_number'] for tx in txs] == list(range(1, 9))
+        assert [tx['hash'] for tx in txs] == [f"0x{n}" for n in range(1, 9)]
+
+
+    def test_read_only_calls_cached(self):
+        """Test that repeated read-only calls reuse the response and misses are retried"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'name': 'Devnet'})
+        adapter._session = Mock()
+        adapter._session.post.side_effect = [
+            Mock(content=orjson.dumps(reply)) for reply in ({'result': {'free': '5'}}, {'result': None}, {'result': None})
+        ]
+        assert adapter.get_balance('alice') == adapter.get_balance('alice')
+        adapter.get_transaction_details('0x1')
+        adapter.get_transaction_details('0x1')
+        assert adapter._session.post.call_count == 3
+
+    def test_concurrent_duplicate_calls_share_one_post(self):
+        """Test that identical read-only calls in flight at once are sent to the node once"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'name': 'Devnet'})
+        release = threading.Event()
+
+        def post(*args, **kwargs):
+            release.wait(timeout=5)
+            return Mock(content=orjson.dumps({'result': {'free': '5'}}))
+        adapter._session = Mock()
+        adapter._session.post.side_effect = post
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(adapter.get_balance, 'alice') for _ in range(4)]
+            release.set()
+            balances = [future.result() for future in futures]
+        assert len(set(balances)) == 1
+        adapter._session.post.assert_called_once()
+        assert adapter._inflight == {}
+
+    def test_cache_can_be_disabled(self):
+        """Test that disable_cache sends every call to the node"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'name': 'Devnet', 'disable_cache': True})
+        adapter._session = Mock()
+        adapter._session.post.return_value.content = orjson.dumps({'result': '0x10'})
+        adapter.get_current_block()
+        adapter.get_current_block()
+        assert adapter._session.post.call_count == 2
+        assert orjson.loads(adapter._session.post.call_args.kwargs['data'])['method'] == 'chain_getBlockNumber'
+
+
+    def test_parser_chosen_by_chain_type(self):
+        """Test that substrate blocks are parsed from their extrinsics"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'chain_type': 'substrate'})
+        block = {'block': {'extrinsics': [
+            {'hash': '0x1', 'signer': 'alice', 'call': {'args': {'dest': 'bob', 'value': 7}}}
+        ]}}
+        txs = adapter._parse_block_transactions(block, 12)
+        assert [(tx['from'], tx['to'], tx['value'], tx['block_number']) for tx in txs] == [('alice', 'bob', '7', 12)]
+        assert adapter._parse_transaction_details({'success': False}, '0x2')['status'] == 'failed'
+
+    def test_cosmos_blocks_read_first_message(self):
+        """Test that cosmos block transactions take sender, recipient and amount from the first message"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'chain_type': 'cosmos', 'name': 'Hub'})
+        msg = {'from_address': 'a', 'to_address': 'b', 'amount': [{'denom': 'uatom', 'amount': '9'}]}
+        block = {'block': {'data': {'txs': [{'txhash': 'H', 'tx': {'body': {'messages': [msg]}}}, {}, {'tx': None},
+                                            {'tx': {'body': {'messages': [{'amount': None}]}}}]}}}
+        txs = adapter._parse_block_transactions(block, 4)
+        assert [(tx['hash'], tx['from'], tx['to'], tx['value']) for tx in txs] == [
+            ('H', 'a', 'b', '9'), ('block_4_tx_1', '', '', '0'), ('block_4_tx_2', '', '', '0'), ('block_4_tx_3', '', '', '0')
+        ]
+        assert txs[0]['chain_type'] == 'cosmos' and txs[0]['chain_name'] == 'Hub'
+        assert txs[0].to_dict() == {'hash': 'H', 'from': 'a', 'to': 'b', 'value': '9', 'block_number': 4,
+                                    'transaction_index': 0, 'chain_name': 'Hub', 'chain_type': 'cosmos'}
+        assert txs[0].get('currency') is None
+        assert not hasattr(txs[0], '__dict__')
+
+    def test_address_format(self):
+        """Test that addresses are matched against the configured pattern, and a bad pattern rejects all"""
+        adapter = CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'address_format': r'^5[A-Za-z0-9]{47}$'})
+        assert adapter.validate_address('5' + 'a' * 47)
+        assert not adapter.validate_address('1' + 'a' * 47)
+        assert not adapter.validate_address(None)
+        assert not CustomWeb3Adapter({'rpc_url': 'https://rpc.test', 'address_format': '('}).validate_address('5')
+
+
+class TestTx:
+    """Test the transaction record type"""
+
+    @pytest.fixture
+    def tx(self):
+        return Tx(hash='0xabc', to='0x1', from_='0x2', value=1.5, currency='BNB', block=10)
+
+    def test_dict_style_access(self, tx):
+        """Test that records still support the old dict keys"""
+        assert tx['to'] == '0x1'
+        assert tx['from'] == '0x2'
+        assert tx.get('missing', 'default') == 'default'
+        with pytest.raises(KeyError):
+            tx['missing']
+
+    def test_to_dict(self, tx):
+        """Test conversion back to the dict format"""
+        assert tx.to_dict() == {
+            'hash': '0xabc', 'to': '0x1', 'from': '0x2', 'value': 1.5,
+            'currency': 'BNB', 'block': 10, 'timestamp': 0
+        }
+
+    @pytest.mark.parametrize("value", [bytes([0xab, 0x01]), HexBytes('0xab01'), '0xab01', 'ab01'])
+    def test_hash_hex_is_always_prefixed(self, value):
+        """Test that every adapter path renders the same hash string"""
+        assert BaseChainAdapter._hash_hex(value) == '0xab01'
+
+
+class TestAdapterRegistry:
+    """Test the lazily-imported adapter registry"""
+
+    @pytest.mark.parametrize("chain_name", sorted(BlockchainAdapters._ADAPTER_REGISTRY))
+    def test_registry_entries_resolve(self, chain_name):
+        """Test that every registered chain maps to an importable adapter class"""
+        assert issubclass(BlockchainAdapters._get_adapter_class(chain_name), BaseChainAdapter)
+
+    def test_adapter_instances_are_reused(self, monkeypatch):
+        """Test that each chain's adapter is constructed only once"""
+        adapter_class = Mock(side_effect=DummyAdapter)
+        monkeypatch.setattr(BlockchainAdapters, '_get_adapter_class', classmethod(lambda cls, name: adapter_class))
+        adapters = BlockchainAdapters()
+        assert adapters.get_adapter('Solana') is adapters.get_adapter('Solana')
+        assert adapter_class.call_count == 1
+
+    def test_reload_configs_rebuilds_adapters(self, monkeypatch):
+        """Test that reloading picks up changed settings and drops cached instances"""
+        monkeypatch.setattr(BlockchainAdapters, '_get_adapter_class', classmethod(lambda cls, name: DummyAdapter))
+        monkeypatch.setattr(settings, 'BLOCKCHAINS', {'blockchains': {'Solana': {'rpc_url': 'https://old.test'}}})
+        adapters = BlockchainAdapters()
+        old = adapters.get_adapter('Solana')
+        settings.BLOCKCHAINS = {'blockchains': {'Solana': {'rpc_url': 'https://new.test'}}}
+        assert adapters.get_adapter('Solana') is old
+        adapters.reload_configs()
+        assert adapters.get_adapter('Solana').rpc_url == 'https://new.test'
+
+    def test_readding_custom_chain_closes_old_adapter(self, tmp_path):
+        """Test that replacing a custom chain releases the previous adapter"""
+        config_file = tmp_path / 'custom_blockchains.json'
+        config_file.write_text('{}')
+        manager = CustomBlockchainManager(str(config_file))
+        with patch('src.core.blockchain.adapters.custom_evm_adapter.CustomEVMAdapter') as adapter_class:
+            adapter_class.side_effect = lambda config: Mock()
+            assert manager.add_custom_chain('Devnet', {'type': 'evm'}, save=False)
+            old = manager.get_custom_chain('Devnet')
+            assert manager.add_custom_chain('Devnet', {'type': 'evm'}, save=False)
+        old.close.assert_called_once()
+        manager.get_custom_chain('Devnet').close.assert_not_called()
+
+
+class TestExplorerUrls:
+    """Test explorer URL building"""
+
+    @pytest.fixture
+    def adapters(self):
+        return BlockchainAdapters()
+
+    def test_tx_url(self, adapters):
+        """Test transaction links"""
+        assert adapters.get_explorer_url('Polygon', 'tx', '0xabc') == 'https://polygonscan.com/tx/0xabc'
+
+    def test_address_and_block_urls(self, adapters):
+        """Test address and block links, including explorers without a /tx/ path"""
+        assert adapters.get_explorer_url('Base', 'address', '0x1') == 'https://basescan.org/address/0x1'
+        assert adapters.get_explorer_url('Tron', 'address', 'T1') == 'https://tronscan.org/#/address/T1'
+        assert adapters.get_explorer_url('Polkadot', 'block', '5') == 'https://polkadot.subscan.io/block/5'
+
+    def test_unknown_chain(self, adapters):
+        """Test that chains without an explorer give an empty URL"""
+        assert adapters.get_explorer_url('Nowhere', 'tx', '0xabc') == ''
+
+    def test_custom_chain_layouts(self):
+        """Test that custom chains link with their chain type's paths and fall back to the base URL"""
+        substrate = CustomWeb3Adapter({'name': 'Sub', 'chain_type': 'substrate',
+                                       'explorer_url': 'https://sub.scan/'})
+        cosmos = CustomWeb3Adapter({'name': 'Cos', 'chain_type': 'cosmos', 'explorer_url': 'https://cos.scan'})
+        assert substrate.get_explorer_url('tx', '0x1') == 'https://sub.scan/extrinsic/0x1'
+        assert cosmos.get_explorer_url('block', '7') == 'https://cos.scan/blocks/7'
+        assert cosmos.get_explorer_url('validator', 'v1') == 'https://cos.scan'
+        assert CustomWeb3Adapter({'name': 'Bare'}).get_explorer_url('tx', '0x1') == ''
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
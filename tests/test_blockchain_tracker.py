@@ -0,0 +1,109 @@
+"""
+Tests for the polling BlockchainTracker
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+# The tracker module pulls in the Supabase and Telegram clients
+pytest.importorskip("supabase")
+pytest.importorskip("telegram")
+
+from config.settings import settings
+from src.core.blockchain import manager
+from src.core.blockchain.manager import BlockchainTracker
+from src.core.blockchain.adapters.base_chain_adapter import Tx
+from src.core.blockchain.wallet_cache import WalletSetCache
+
+WALLET = '0x00000000000000000000000000000000000000aa'
+OTHER = '0x00000000000000000000000000000000000000bb'
+EXPLORER = 'https://etherscan.io/tx/'
+
+
+class TestBlockchainTracker:
+    """Test chain checks and alert delivery with a stubbed adapter and database"""
+
+    @pytest.fixture
+    def db(self):
+        rows = {
+            ('wallets', 'ethereum'): [{'address': WALLET}],
+            ('rates', None): [{'value': 2000.0}],
+            ('settings', 'group_id'): [{'key': 'group_id', 'value': '-1001'}],
+        }
+
+        def execute(table, op, data=None):
+            key = (data or {}).get('blockchain', (data or {}).get('key'))
+            return Mock(data=rows.get((table, key), []))
+
+        return Mock(execute=Mock(side_effect=execute))
+
+    @pytest.fixture
+    def adapter(self):
+        adapter = Mock()
+        adapter.get_current_block.return_value = 105
+        adapter.get_transactions.return_value = [
+            Tx('0xaaa', WALLET, OTHER, 1.5, 'ETH', 103),
+            Tx('0xbbb', OTHER, WALLET, 2.0, 'ETH', 104),
+        ]
+        return adapter
+
+    @pytest.fixture
+    def tracker(self, db, adapter):
+        with patch.object(manager, 'SupabaseDB', return_value=db), \
+             patch.object(manager, 'NotificationService'), \
+             patch.object(manager, 'BlockchainManager') as blockchain_manager, \
+             patch.object(manager, 'cache') as cache:
+            cache.get_hash.return_value = {'ethereum': '100'}
+            blockchain_manager.return_value.adapters.get_adapter.return_value = adapter
+            blockchain_manager.return_value.get_explorer_url.return_value = EXPLORER
+            tracker = BlockchainTracker()
+        with patch.object(manager, 'wallet_cache', WalletSetCache()), \
+             patch.object(manager.asyncio, 'run_coroutine_threadsafe') as schedule:
+            tracker.schedule = schedule
+            yield tracker
+
+    def test_resumes_from_persisted_cursor(self, tracker):
+        """Test that cursors are loaded from the cache on startup"""
+        assert tracker.last_blocks == {'ethereum': 100}
+
+    def test_check_chain_alerts_and_advances(self, tracker, adapter):
+        """Test that a transfer to a tracked wallet is alerted and the cursor advances"""
+        tracker._check_chain('ethereum')
+
+        adapter.get_transactions.assert_called_once_with(101, 105)
+        tracker.notifier.send_alert.assert_called_once()
+        chat_id, message = tracker.notifier.send_alert.call_args.args
+        assert chat_id == -1001
+        assert '0xaaa' in message and '0xbbb' not in message
+        assert tracker.schedule.call_count == 1
+        assert tracker.last_blocks['ethereum'] == 105
+
+    def test_check_chain_without_wallets_skips_fetch(self, tracker, adapter):
+        """Test that chains with no tracked wallets advance without fetching blocks"""
+        tracker.last_blocks['solana'] = 100
+        tracker._check_chain('solana')
+
+        adapter.get_transactions.assert_not_called()
+        tracker.notifier.send_alert.assert_not_called()
+        assert tracker.last_blocks['solana'] == 105
+
+    def test_check_chain_without_adapter(self, tracker):
+        """Test that a chain whose adapter cannot be built is skipped"""
+        tracker._manager.adapters.get_adapter.return_value = None
+        tracker._check_chain('ethereum')
+
+        assert tracker.last_blocks == {'ethereum': 100}
+        assert tracker.adapters == {}
+
+    def test_process_transaction_formats_template(self, tracker):
+        """Test that alerts use the message template and the cached rate"""
+        tx = Tx('0xaaa', WALLET, OTHER, 1.5, 'ETH', 103)
+        tracker._process_transaction(tx, 'ethereum', EXPLORER)
+        tracker._process_transaction(tx, 'ethereum', EXPLORER)
+
+        message = tracker.notifier.send_alert.call_args.args[1]
+        assert message == settings.MESSAGE_TEMPLATE.format(
+            chain='ethereum', amount=1.5, cur='ETH', usd=3000.0, url=EXPLORER, hash='0xaaa'
+        )
+        rate_queries = [c for c in tracker.db.execute.call_args_list if c.args[0] == 'rates']
+        assert len(rate_queries) == 1
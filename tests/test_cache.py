@@ -0,0 +1,31 @@
+"""
+Tests for the cache layer's in-memory fallback
+"""
+
+import pytest
+
+from src.infrastructure.cache import RedisCache
+
+
+class TestHashFallback:
+    """Test hash storage when Redis is unavailable"""
+
+    @pytest.fixture
+    def cache(self):
+        cache = RedisCache()
+        cache.redis_available = False
+        return cache
+
+    def test_missing_hash_is_empty(self, cache):
+        """Test that an unknown hash reads as empty"""
+        assert cache.get_hash('last_blocks') == {}
+
+    def test_fields_are_merged(self, cache):
+        """Test that setting fields keeps the ones already stored"""
+        cache.set_hash('last_blocks', {'Polygon': 100})
+        cache.set_hash('last_blocks', {'Base': 7, 'Polygon': 101})
+        assert cache.get_hash('last_blocks') == {'Polygon': '101', 'Base': '7'}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,42 @@
+"""
+Tests for the bot logger wrapper
+"""
+
+import logging
+import pytest
+
+from src.utils.logger import logger
+
+
+class Unformattable:
+    """Fails the test if the logger ever renders it"""
+
+    def __str__(self):
+        raise AssertionError("argument was formatted")
+
+
+class TestBotLogger:
+    """Test lazy message formatting"""
+
+    def test_disabled_level_skips_formatting(self):
+        """Test that args of a suppressed level are never formatted"""
+        assert not logger.logger.isEnabledFor(logging.DEBUG)
+        logger.log("value: %s", Unformattable(), level='debug')
+
+    def test_args_are_interpolated(self, caplog):
+        """Test that %-style args are applied when the level is enabled"""
+        with caplog.at_level(logging.INFO, logger='CryptoBot'):
+            logger.log("%s current block: %s", 'Devnet', 42)
+        assert caplog.records[-1].getMessage() == "Devnet current block: 42"
+
+    def test_error_level_keyword(self, caplog):
+        """Test the tracker/manager call style: a preformatted message with level='error'"""
+        with caplog.at_level(logging.INFO, logger='CryptoBot'):
+            logger.log(f"Tracking error on {'BSC'}: {'100% timeout'}", level='error')
+        record = caplog.records[-1]
+        assert record.levelno == logging.ERROR
+        assert record.getMessage() == "Tracking error on BSC: 100% timeout"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,64 @@
+"""
+Tests for Multicall3 calldata encoding and result decoding
+"""
+
+import pytest
+from unittest.mock import Mock
+from eth_abi import decode, encode
+
+from src.infrastructure.multicall import (
+    AGGREGATE_SELECTOR, TRY_AGGREGATE_SELECTOR, Multicall,
+    decode_aggregate, decode_try_aggregate, encode_aggregate, encode_try_aggregate
+)
+
+TOKEN = '0x55d398326f99059fF775485246999027B3197955'
+
+
+class TestMulticall:
+    """Test Multicall3 helpers"""
+
+    def test_encode_aggregate(self):
+        """Test aggregate calldata carries the selector and the encoded calls"""
+        data = encode_aggregate([(TOKEN, b'\x31\x3c\xe5\x67')])
+        assert data[:4] == AGGREGATE_SELECTOR
+        (calls,) = decode(['(address,bytes)[]'], data[4:])
+        assert calls[0][0].lower() == TOKEN.lower()
+        assert calls[0][1] == b'\x31\x3c\xe5\x67'
+
+    def test_encode_try_aggregate(self):
+        """Test tryAggregate calldata carries the selector, the success flag and the calls"""
+        data = encode_try_aggregate([(TOKEN, b'\x31\x3c\xe5\x67')], require_success=True)
+        assert data[:4] == TRY_AGGREGATE_SELECTOR
+        require_success, calls = decode(['bool', '(address,bytes)[]'], data[4:])
+        assert require_success is True
+        assert calls[0][0].lower() == TOKEN.lower()
+        assert calls[0][1] == b'\x31\x3c\xe5\x67'
+
+    def test_decode_aggregate(self):
+        """Test aggregate return data decodes to block number and results"""
+        raw = encode(['uint256', 'bytes[]'], [123, [b'\x01', b'\x02']])
+        assert decode_aggregate(raw) == (123, [b'\x01', b'\x02'])
+
+    def test_try_aggregate_failures_are_none(self):
+        """Test failed calls in tryAggregate decode to None"""
+        raw = encode(['(bool,bytes)[]'], [[(True, b'\x01'), (False, b'')]])
+        assert decode_try_aggregate(raw) == [b'\x01', None]
+
+    def test_single_eth_call(self):
+        """Test that all calls go out in one eth_call"""
+        w3 = Mock()
+        w3.eth.call.return_value = encode(['(bool,bytes)[]'], [[(True, b'\x01')] * 3])
+        results = Multicall(w3).try_aggregate([(TOKEN, b'\x00')] * 3)
+        assert results == [b'\x01'] * 3
+        w3.eth.call.assert_called_once()
+        assert w3.eth.call.call_args[0][0]['data'][:4] == TRY_AGGREGATE_SELECTOR
+
+    def test_empty_calls_skip_rpc(self):
+        """Test that an empty batch does not hit the node"""
+        w3 = Mock()
+        assert Multicall(w3).aggregate([]) == (0, [])
+        w3.eth.call.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,46 @@
+"""
+Tests for loading the blockchain config
+"""
+
+import pytest
+
+from config.settings import REQUIRED_ENV_VARS, Settings, settings
+
+
+class TestBlockchainsConfig:
+    """Test parsing of blockchains.json"""
+
+    def test_config_parsed(self, tmp_path):
+        """Test that the JSON is parsed into a dict"""
+        config_path = tmp_path / "blockchains.json"
+        config_path.write_text('{"blockchains": {"Base": {"rpc_url": "https://base.test"}}}')
+        expected = {'blockchains': {'Base': {'rpc_url': 'https://base.test'}}}
+        assert settings._load_blockchains_config(config_path) == expected
+
+    def test_invalid_json_raises(self, tmp_path):
+        """Test that malformed JSON is reported as a ValueError"""
+        config_path = tmp_path / "blockchains.json"
+        config_path.write_text('{"blockchains": ')
+        with pytest.raises(ValueError, match="Failed to parse"):
+            settings._load_blockchains_config(config_path)
+
+    def test_missing_file_raises(self, tmp_path):
+        """Test that a missing config file is reported"""
+        with pytest.raises(FileNotFoundError):
+            settings._load_blockchains_config(tmp_path / "blockchains.json")
+
+
+class TestRequiredEnvVars:
+    """Test the startup check on required environment variables"""
+
+    def test_all_missing_vars_reported(self, monkeypatch):
+        """Test that every missing variable is named in one error"""
+        assert 'TELEGRAM_TOKEN' in REQUIRED_ENV_VARS
+        monkeypatch.delenv('TELEGRAM_TOKEN', raising=False)
+        monkeypatch.setenv('SUPABASE_KEY', '')
+        with pytest.raises(EnvironmentError, match='SUPABASE_KEY, TELEGRAM_TOKEN'):
+            Settings()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,63 @@
+"""
+Tests for the tracked wallet set cache
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from src.core.blockchain.wallet_cache import WalletSetCache, address_key
+
+
+class TestWalletSetCache:
+    """Test wallet set caching and invalidation"""
+
+    @pytest.fixture
+    def loader(self):
+        return Mock(side_effect=lambda chain: [f"{chain}-wallet"])
+
+    def test_loads_once_within_ttl(self, loader):
+        """Test that repeated lookups reuse the cached set"""
+        cache = WalletSetCache(ttl=60)
+        assert cache.get('BSC', loader) == frozenset({'BSC-wallet'})
+        assert cache.get('BSC', loader) == frozenset({'BSC-wallet'})
+        assert loader.call_count == 1
+
+    def test_expired_entries_reload(self, loader):
+        """Test that entries are refreshed once the TTL has passed"""
+        cache = WalletSetCache(ttl=0)
+        cache.get('BSC', loader)
+        cache.get('BSC', loader)
+        assert loader.call_count == 2
+
+    def test_invalidate_single_chain(self, loader):
+        """Test that invalidating one chain leaves the others cached"""
+        cache = WalletSetCache(ttl=60)
+        cache.get('BSC', loader)
+        cache.get('Polygon', loader)
+        cache.invalidate('BSC')
+        cache.get('BSC', loader)
+        cache.get('Polygon', loader)
+        assert [c.args[0] for c in loader.call_args_list] == ['BSC', 'Polygon', 'BSC']
+
+    def test_invalidate_all(self, loader):
+        """Test that invalidating without a chain drops every entry"""
+        cache = WalletSetCache(ttl=60)
+        cache.get('BSC', loader)
+        cache.invalidate()
+        cache.get('BSC', loader)
+        assert loader.call_count == 2
+
+    def test_evm_addresses_match_case_insensitively(self):
+        """Test that checksummed and lowercase EVM addresses share a key"""
+        cache = WalletSetCache(ttl=60)
+        wallets = cache.get('BSC', lambda chain: ['0x55d398326f99059ff775485246999027b3197955'])
+        assert address_key('0x55d398326f99059fF775485246999027B3197955') in wallets
+
+    def test_non_evm_addresses_unchanged(self):
+        """Test that non-hex addresses are kept as-is"""
+        assert address_key('TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t') == 'TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t'
+        assert address_key(None) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])